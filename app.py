@@ -1,8 +1,40 @@
-"""Simple Flask application for testing."""
-from flask import Flask, render_template_string
+"""Simple Flask application for testing.
+
+Pages are rendered once at startup. Each response picks a pre-compressed
+variant (brotli when the optional brotli package is installed, gzip,
+identity) by Accept-Encoding and carries a strong ETag, so repeat requests
+can be answered with 304 Not Modified.
+"""
+from typing import Any, Dict
+from collections import deque
+from collections.abc import Mapping
+import gzip
+import hashlib
+import os
+import re
+from flask import Flask, Response, jsonify, render_template_string, request
+from search_index import DEFAULT_PER_PAGE, build_index, generate_corpus, search
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip covers every browser
+    brotli = None
 
 app = Flask(__name__)
 
+# Content codings in order of preference
+ENCODINGS = ("br", "gzip", "identity")
+
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+MAX_NAME_LENGTH = 200
+MAX_MESSAGE_LENGTH = 5000
+
+# Submitted contact messages, most recent last
+CONTACT_MESSAGES: "deque[Dict[str, str]]" = deque(maxlen=1000)
+
+SEARCH_INDEX = build_index(generate_corpus(int(os.getenv('SEARCH_CORPUS_SIZE', '2000'))))
+SEARCH_BUDGET_MS = float(os.getenv('SEARCH_BUDGET_MS', '50'))
+
 HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
@@ -293,6 +325,72 @@ HTML_TEMPLATE = """
         .social-link:hover {
             opacity: 1;
         }
+
+        /* Search & Contact Form */
+        .search,
+        .contact-form {
+            max-width: 720px;
+            margin: 0 auto var(--section-spacing);
+        }
+
+        .search__form {
+            display: flex;
+            gap: 8px;
+        }
+
+        .search-input,
+        .name-input,
+        .email-input,
+        .message-input {
+            width: 100%;
+            padding: 12px 16px;
+            font: inherit;
+            border: 1px solid rgba(0, 0, 0, 0.2);
+            border-radius: 8px;
+        }
+
+        .search-button,
+        .submit-button,
+        .search-more {
+            padding: 12px 24px;
+            font: inherit;
+            color: var(--color-background);
+            background: var(--color-primary);
+            border: none;
+            border-radius: 8px;
+            cursor: pointer;
+        }
+
+        .search-results__summary {
+            margin: var(--spacing-unit) 0;
+            color: var(--color-secondary);
+        }
+
+        .result-item {
+            list-style: none;
+            padding: var(--spacing-unit) 0;
+            border-bottom: 1px solid rgba(0, 0, 0, 0.1);
+        }
+
+        .result-item__title {
+            color: var(--color-accent);
+            text-decoration: none;
+            font-weight: 500;
+        }
+
+        .contact-form {
+            display: grid;
+            gap: var(--spacing-unit);
+        }
+
+        .contact-form label {
+            display: grid;
+            gap: 8px;
+        }
+
+        .form-error {
+            color: var(--color-accent);
+        }
     </style>
 </head>
 <body>
@@ -320,9 +418,28 @@ HTML_TEMPLATE = """
     <main class="main">
         <div class="container">
             <section class="hero">
-                <h1 class="hero__title">Let's Talk</h1>
+                <h1 class="hero__title">{% if page == "contact" %}Contact Us{% else %}Let's Talk{% endif %}</h1>
                 <p class="hero__subtitle">We will respond to you within 24 hours and help bring your ideas to life.</p>
             </section>
+            {% if page == "contact" %}
+
+            <form class="contact-form" novalidate>
+                <label>Name <input class="name-input" name="name" type="text" autocomplete="name" required></label>
+                <label>Email <input class="email-input" name="email" type="email" autocomplete="email" required></label>
+                <label>Message <textarea class="message-input" name="message" rows="5" required></textarea></label>
+                <button class="submit-button" type="submit">Send Message</button>
+                <p class="form-error" role="alert" hidden></p>
+                <p class="success-message" role="status" hidden>Thank you! We will get back to you within 24 hours.</p>
+            </form>
+            {% else %}
+
+            <section class="search" aria-label="Search articles">
+                <form class="search__form" role="search">
+                    <input class="search-input" name="q" type="search" placeholder="Search articles" aria-label="Search articles" autocomplete="off">
+                    <button class="search-button" type="submit">Search</button>
+                </form>
+                <div class="search-results" aria-live="polite"></div>
+            </section>
 
             <section class="contact-grid">
                 <div class="contact-card">
@@ -341,6 +458,7 @@ HTML_TEMPLATE = """
                     <a href="#locations" class="contact-card__link">View Locations</a>
                 </div>
             </section>
+            {% endif %}
         </div>
     </main>
 
@@ -401,15 +519,174 @@ HTML_TEMPLATE = """
                 }
             });
         });
+
+        // Pure function to build an element with a class and text
+        const createElement = (tag, className, text) => {
+            const element = document.createElement(tag);
+            element.className = className;
+            if (text !== undefined) element.textContent = text;
+            return element;
+        };
+
+        // Render one page of search results, appending to earlier pages
+        const renderResults = (container, data, loadMore) => {
+            if (data.page === 1) {
+                container.replaceChildren(createElement('p', 'search-results__summary',
+                    data.total ? `${data.total} Results for "${data.query}"` : `No Results for "${data.query}"`));
+                container.append(createElement('ul', 'search-results__list'));
+            }
+            container.querySelector('.search-more')?.remove();
+            const list = container.querySelector('.search-results__list');
+            data.results.forEach((result) => {
+                const item = createElement('li', 'result-item');
+                const link = createElement('a', 'result-item__title', result.title);
+                link.href = result.url;
+                item.append(link, createElement('p', 'result-item__snippet', result.snippet));
+                list.append(item);
+            });
+            if (data.page * data.per_page < data.total) {
+                const more = createElement('button', 'search-more', 'More Results');
+                more.type = 'button';
+                more.addEventListener('click', () => loadMore(data.page + 1));
+                container.append(more);
+            }
+        };
+
+        // Initialize search
+        document.addEventListener('DOMContentLoaded', () => {
+            const form = document.querySelector('.search__form');
+            if (!form) return;
+            const input = form.querySelector('.search-input');
+            const container = document.querySelector('.search-results');
+
+            const loadPage = async (query, page) => {
+                const params = new URLSearchParams({ q: query, page: String(page) });
+                const response = await fetch(`/api/search?${params}`);
+                renderResults(container, await response.json(), (next) => loadPage(query, next));
+            };
+
+            form.addEventListener('submit', (event) => {
+                event.preventDefault();
+                if (input.value.trim()) loadPage(input.value.trim(), 1);
+            });
+        });
+
+        // Initialize contact form
+        document.addEventListener('DOMContentLoaded', () => {
+            const form = document.querySelector('.contact-form');
+            if (!form) return;
+            const error = form.querySelector('.form-error');
+            const success = form.querySelector('.success-message');
+
+            form.addEventListener('submit', async (event) => {
+                event.preventDefault();
+                const fields = Object.fromEntries(new FormData(form));
+                const response = await fetch('/api/contact', {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify(fields),
+                });
+                const data = await response.json();
+                error.hidden = response.ok;
+                success.hidden = !response.ok;
+                if (response.ok) {
+                    form.reset();
+                } else {
+                    error.textContent = Object.values(data.errors).join(' ');
+                }
+            });
+        });
     </script>
 </body>
 </html>
 """
 
+def prepare_page(template: str, **context: Any) -> Dict[str, Any]:
+    """Render a template once and precompute its encoded variants and their ETags."""
+    with app.app_context():
+        body = render_template_string(template, **context).encode("utf-8")
+    variants = {"identity": body, "gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(body, quality=11)
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    # Each representation needs its own strong validator
+    etags = {encoding: digest if encoding == "identity" else f"{digest}-{encoding}" for encoding in variants}
+    return {"variants": variants, "etags": etags}
+
+def send_page(page: Dict[str, Any]) -> Response:
+    """Send the best encoded variant the client accepts, or 304 when its cached copy is current."""
+    offered = [encoding for encoding in ENCODINGS if encoding in page["variants"]]
+    encoding = request.accept_encodings.best_match(offered, default="identity")
+    etag = page["etags"][encoding]
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = Response(page["variants"][encoding], mimetype="text/html")
+        if encoding != "identity":
+            response.headers["Content-Encoding"] = encoding
+    response.set_etag(etag)
+    response.headers["Vary"] = "Accept-Encoding"
+    # Browsers may keep the page but must revalidate, which costs a 304 at most
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+def validate_contact(fields: Dict[str, Any]) -> Dict[str, str]:
+    """Return an error message per invalid contact form field."""
+    errors = {}
+    name = str(fields.get("name", "")).strip()
+    email = str(fields.get("email", "")).strip()
+    message = str(fields.get("message", "")).strip()
+    if not name or len(name) > MAX_NAME_LENGTH:
+        errors["name"] = f"Please enter your name (up to {MAX_NAME_LENGTH} characters)."
+    if not EMAIL_PATTERN.match(email):
+        errors["email"] = "Please enter a valid email address."
+    if not message or len(message) > MAX_MESSAGE_LENGTH:
+        errors["message"] = f"Please enter a message (up to {MAX_MESSAGE_LENGTH} characters)."
+    return errors
+
+INDEX_PAGE = prepare_page(HTML_TEMPLATE, page="index")
+CONTACT_PAGE = prepare_page(HTML_TEMPLATE, page="contact")
+
 @app.route('/')
 def index():
-    """Render the index page."""
-    return render_template_string(HTML_TEMPLATE)
+    """Serve the index page rendered at startup."""
+    return send_page(INDEX_PAGE)
+
+@app.route('/contact')
+def contact():
+    """Serve the contact page rendered at startup."""
+    return send_page(CONTACT_PAGE)
+
+@app.route('/api/contact', methods=['POST'])
+def submit_contact():
+    """Accept a contact form submission as JSON or form data."""
+    fields = request.get_json(silent=True) if request.is_json else request.form
+    if not isinstance(fields, Mapping):
+        return jsonify({"status": "invalid", "errors": {"body": "Expected a JSON object"}}), 400
+    errors = validate_contact(fields)
+    if errors:
+        return jsonify({"status": "invalid", "errors": errors}), 400
+    CONTACT_MESSAGES.append({key: str(fields[key]).strip() for key in ("name", "email", "message")})
+    return jsonify({"status": "received"}), 201
+
+@app.route('/api/search')
+def search_documents():
+    """Search the seeded corpus: /api/search?q=...&page=1&per_page=10."""
+    try:
+        page = int(request.args.get("page", 1))
+        per_page = int(request.args.get("per_page", DEFAULT_PER_PAGE))
+    except ValueError:
+        return jsonify({"error": "page and per_page must be integers"}), 400
+    result = search(SEARCH_INDEX, request.args.get("q", ""), page=page, per_page=per_page, budget_ms=SEARCH_BUDGET_MS)
+    response = jsonify(result)
+    response.headers["Cache-Control"] = "no-store"
+    response.headers["Server-Timing"] = f"search;dur={result['took_ms']}"
+    return response
+
+@app.route('/healthz')
+def healthz():
+    """Report that the server is up, for readiness checks."""
+    return Response("ok", mimetype="text/plain", headers={"Cache-Control": "no-store"})
 
 if __name__ == '__main__':
     app.run(port=5000)
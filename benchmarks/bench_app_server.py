@@ -0,0 +1,74 @@
+"""Requests per second of the Flask index page, rendered per request versus rendered once.
+
+Drives the app in process through the Flask test client, so the numbers are
+the server's own cost per request without sockets or a browser. "render per
+request" serves HTML_TEMPLATE the way index() used to; the other rows go
+through the current app with identity, gzip and brotli (when installed)
+responses and with a revalidation that gets 304 Not Modified.
+
+Usage:
+    python -m benchmarks.bench_app_server [--requests N]
+"""
+from typing import Callable, Dict
+import argparse
+import time
+from flask import Flask, render_template_string
+from flask.testing import FlaskClient
+from app import HTML_TEMPLATE, INDEX_PAGE, app
+
+
+def create_uncached_app() -> Flask:
+    """App serving the index by rendering the template on every request."""
+    uncached = Flask("uncached")
+
+    @uncached.route("/")
+    def index() -> str:
+        return render_template_string(HTML_TEMPLATE)
+
+    return uncached
+
+
+def requests_per_second(send: Callable[[], int], requests: int) -> Dict[str, float]:
+    """Send requests one after another and return the rate and the last response size."""
+    send()
+    started = time.perf_counter()
+    size = 0
+    for _ in range(requests):
+        size = send()
+    elapsed = time.perf_counter() - started
+    return {"rate": requests / elapsed, "bytes": size}
+
+
+def main() -> None:
+    """Measure every serving mode and print requests per second and bytes per response."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    uncached_client = create_uncached_app().test_client()
+    client = app.test_client()
+
+    def get(test_client: FlaskClient, headers: Dict[str, str]) -> Callable[[], int]:
+        """Build a sender that requests the index and returns the body size."""
+        return lambda: len(test_client.get("/", headers=headers).data)
+
+    modes = {
+        "render per request": get(uncached_client, {}),
+        "cached identity": get(client, {}),
+        "cached gzip": get(client, {"Accept-Encoding": "gzip"}),
+    }
+    if "br" in INDEX_PAGE["variants"]:
+        modes["cached brotli"] = get(client, {"Accept-Encoding": "br"})
+    modes["304 revalidation"] = get(client, {"Accept-Encoding": "gzip", "If-None-Match": f'"{INDEX_PAGE["etags"]["gzip"]}"'})
+
+    results = {name: requests_per_second(send, args.requests) for name, send in modes.items()}
+    baseline = results["render per request"]["rate"]
+    print(f"\nIndex page, {args.requests} sequential requests per mode")
+    width = max(len(name) for name in results)
+    for name, result in results.items():
+        print(f"{name:{width}}  {result['rate']:>8.0f} req/s  {result['rate'] / baseline:>5.1f}x  "
+              f"{result['bytes']:>6} bytes/response")
+
+
+if __name__ == "__main__":
+    main()
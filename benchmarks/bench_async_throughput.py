@@ -0,0 +1,101 @@
+"""Throughput of sync versus concurrent async test execution on the Flask app.
+
+Serves app.py on an ephemeral local port and runs the same scenario (open
+the contact page, read the hero, count the contact cards, follow a link)
+serially through playwright.sync_api and concurrently through
+utils.async_runner in one browser.
+
+Usage:
+    python -m benchmarks.bench_async_throughput [--tests N] [--concurrency N]
+"""
+from typing import Dict
+import argparse
+import asyncio
+import threading
+import time
+from playwright.async_api import Page as AsyncPage
+from playwright.sync_api import Page, sync_playwright
+from werkzeug.serving import make_server
+from app import app
+from page_objects.async_base_page import async_base_page
+from page_objects.base_page import base_page
+from utils.async_runner import launch_browser, run_concurrently
+
+
+def sync_scenario(page: Page, base_url: str) -> None:
+    """Contact page scenario through the sync page object."""
+    page_actions = base_page(page)
+    page.goto(base_url, wait_until="domcontentloaded")
+    page_actions["wait_for_element"](".hero__title")
+    assert page_actions["get_element_text"](".hero__title") == "Let's Talk"
+    assert page.locator(".contact-card").count() == 3
+    page_actions["click_element"]('a[href="#contact"]')
+    page.wait_for_url("**#contact")
+
+
+async def async_scenario(page: AsyncPage, base_url: str) -> None:
+    """The same scenario through the async page object."""
+    page_actions = async_base_page(page)
+    await page.goto(base_url, wait_until="domcontentloaded")
+    await page_actions["wait_for_element"](".hero__title")
+    assert await page_actions["get_element_text"](".hero__title") == "Let's Talk"
+    assert await page.locator(".contact-card").count() == 3
+    await page_actions["click_element"]('a[href="#contact"]')
+    await page.wait_for_url("**#contact")
+
+
+def run_sync(base_url: str, tests: int) -> float:
+    """Run the scenario serially, one fresh context per test, and return the wall time."""
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=True)
+        started = time.perf_counter()
+        for _ in range(tests):
+            context = browser.new_context()
+            sync_scenario(context.new_page(), base_url)
+            context.close()
+        elapsed = time.perf_counter() - started
+        browser.close()
+    return elapsed
+
+
+async def run_async(base_url: str, tests: int, concurrency: int) -> float:
+    """Run the scenario concurrently in one browser and return the wall time."""
+    async def scenario(page: AsyncPage) -> None:
+        await async_scenario(page, base_url)
+
+    async with launch_browser("chromium", headless=True) as browser:
+        started = time.perf_counter()
+        results = await run_concurrently(browser, {f"test {i}": scenario for i in range(tests)}, concurrency)
+        elapsed = time.perf_counter() - started
+    failures = [result["error"] for result in results if not result["passed"]]
+    if failures:
+        raise RuntimeError(f"{len(failures)} async runs failed, first: {failures[0]}")
+    return elapsed
+
+
+def main() -> None:
+    """Run both modes and print throughput in tests per minute."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tests", type=int, default=24)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    try:
+        wall_times: Dict[str, float] = {
+            "sync": run_sync(base_url, args.tests),
+            f"async x{args.concurrency}": asyncio.run(run_async(base_url, args.tests, args.concurrency)),
+        }
+    finally:
+        server.shutdown()
+
+    print(f"\nThroughput for {args.tests} tests")
+    width = max(len(name) for name in wall_times)
+    for name, elapsed in wall_times.items():
+        print(f"{name:{width}}  {elapsed:>7.2f}s  {args.tests / elapsed * 60:>8.1f} tests/minute")
+
+
+if __name__ == "__main__":
+    main()
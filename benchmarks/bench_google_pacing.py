@@ -0,0 +1,60 @@
+"""Per-search latency of the fast and human pacing strategies.
+
+Runs the search interaction of page_objects.google_page against the local
+mock search page, so no network access is needed.
+
+Usage:
+    python -m benchmarks.bench_google_pacing [--repeat N] [--query TEXT]
+"""
+from typing import Any, Dict
+import argparse
+import os
+from playwright.sync_api import Page, sync_playwright
+from benchmarks.common import measure, print_results
+from config.test_config import get_mock_origin
+from page_objects.google_page import fast_pacing, human_pacing
+from utils.mock_pages import create_mock_registry
+
+MOCK_DIR = os.path.join(os.path.dirname(__file__), "..", "tests", "components")
+
+
+def search_once(page: Page, pacing: Dict[str, Any], query: str) -> None:
+    """Enter a query with the given pacing and wait for the rendered results."""
+    search_input = page.locator(".search-input")
+    pacing["approach"](search_input)
+    pacing["type_text"](search_input, query)
+    pacing["pause"]()
+    search_input.press("Enter")
+    page.locator(".result-item").first.wait_for(state="visible")
+
+
+def main() -> None:
+    """Run the benchmark and print per-search latency for both pacing modes."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--query", default="playwright python automation")
+    args = parser.parse_args()
+
+    # The mock page is a template filled with its result sets, so it is served through the registry
+    mock_pages = create_mock_registry(get_mock_origin())
+    mock_url = mock_pages["register"](
+        "google", os.path.join(MOCK_DIR, "mock_google.html"), os.path.join(MOCK_DIR, "mock_results.json")
+    )
+    results = {}
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=True)
+        page = browser.new_page()
+        mock_pages["attach"](page.context)
+        for pacing in (fast_pacing(), human_pacing()):
+            results[pacing["name"]] = measure(
+                lambda: search_once(page, pacing, args.query),
+                args.repeat,
+                setup=lambda: page.goto(mock_url)
+            )
+        browser.close()
+
+    print_results(f"Per-search latency for a {len(args.query)} character query", results)
+
+
+if __name__ == "__main__":
+    main()
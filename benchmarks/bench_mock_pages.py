@@ -0,0 +1,98 @@
+"""Per-test setup time of the mock search page: file:// navigation versus the in-memory registry.
+
+The first part measures without a browser: reading and rendering the template
+and its result set for every test against looking up the page the registry
+rendered once. The second part times what the mock_page fixture does per test
+in a real browser: open a context and page and navigate to the mock page,
+once through file:// and once through the registry's routed origin, with
+set_content as a reference.
+
+Usage:
+    python -m benchmarks.bench_mock_pages [--tests N] [--no-browser]
+"""
+from typing import Callable, Dict
+import argparse
+import json
+import os
+from playwright.sync_api import Browser, sync_playwright
+from benchmarks.common import measure, print_results
+from utils.mock_pages import create_mock_registry, render_mock_page
+
+MOCK_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "components")
+TEMPLATE_PATH = os.path.join(MOCK_DIR, "mock_google.html")
+DATA_PATH = os.path.join(MOCK_DIR, "mock_results.json")
+
+
+def read_and_render() -> bytes:
+    """Read and render the mock page from disk, as a per-test fixture would."""
+    with open(TEMPLATE_PATH, encoding="utf-8") as f:
+        template = f.read()
+    with open(DATA_PATH, encoding="utf-8") as f:
+        results = json.load(f)
+    return render_mock_page(template, results)
+
+
+def bench_loading(tests: int) -> None:
+    """Print the Python-side cost of getting the page body per test."""
+    registry = create_mock_registry()
+    registry["register"]("google", TEMPLATE_PATH, DATA_PATH)
+    results = {
+        "read per test": measure(read_and_render, tests),
+        "registry": measure(lambda: registry["register"]("google", TEMPLATE_PATH, DATA_PATH), tests),
+    }
+    micros = {name: {stat: value * 1000 for stat, value in stats.items()} for name, stats in results.items()}
+    print_results(f"Mock page body per test, {tests} tests", micros, unit="us")
+
+
+def bench_setup(tests: int) -> None:
+    """Print the per-test fixture setup time in a real browser for each way of loading the page."""
+    registry = create_mock_registry()
+    url = registry["register"]("google", TEMPLATE_PATH, DATA_PATH)
+    rendered = read_and_render().decode("utf-8")
+
+    def setup(browser: Browser, load: Callable) -> Callable[[], None]:
+        def action() -> None:
+            context = browser.new_context()
+            page = context.new_page()
+            load(page)
+            context.close()
+        return action
+
+    # The file:// page still carries the placeholder; rendering it keeps the comparison fair
+    file_path = os.path.join(os.path.dirname(TEMPLATE_PATH), ".bench_mock_google.html")
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write(rendered)
+
+    def routed(page) -> None:
+        registry["attach"](page.context)
+        page.goto(url)
+
+    loaders: Dict[str, Callable] = {
+        "file:// goto": lambda page: page.goto(f"file://{file_path}"),
+        "registry goto": routed,
+        "set_content": lambda page: page.set_content(rendered),
+    }
+    try:
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch(headless=True)
+            results = {name: measure(setup(browser, load), tests) for name, load in loaders.items()}
+            browser.close()
+    finally:
+        os.remove(file_path)
+    print_results(f"mock_page fixture setup (context, page, load), {tests} tests", results)
+
+
+def main() -> None:
+    """Run the loading and browser setup benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tests", type=int, default=50)
+    parser.add_argument("--no-browser", action="store_true", help="Only measure reading and rendering")
+    args = parser.parse_args()
+
+    bench_loading(max(args.tests, 1000))
+    if not args.no_browser:
+        bench_setup(args.tests)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Per-call overhead of the base page object, uncached versus cached, and batched form fills.
+
+The first part measures only Python-side cost on a stub page whose locators
+do nothing: building the actions and a locator on every call, as base_page
+used to, against the per-page action and locator cache. The second part
+fills a three-field form in a real browser field by field and with one
+fill_form call.
+
+Usage:
+    python -m benchmarks.bench_page_actions [--calls N] [--forms N] [--no-browser]
+"""
+from typing import Any, Callable, Dict
+import argparse
+import time
+from playwright.sync_api import sync_playwright
+from benchmarks.common import measure, print_results
+from page_objects.base_page import base_page
+
+FORM_HTML = """
+<form>
+    <input class="name-input" type="text">
+    <input class="email-input" type="email">
+    <textarea class="message-input"></textarea>
+</form>
+"""
+
+FORM_FIELDS = {
+    ".name-input": "Test User",
+    ".email-input": "test@example.com",
+    ".message-input": "Test message",
+}
+
+
+class StubLocator:
+    """Locator whose actions return immediately."""
+
+    def __init__(self, selector: str) -> None:
+        self.selector = selector
+
+    def fill(self, value: str) -> None:
+        pass
+
+
+class StubPage:
+    """Page that creates stub locators and ignores event handlers."""
+
+    main_frame = None
+
+    def locator(self, selector: str) -> StubLocator:
+        return StubLocator(selector)
+
+    def on(self, event: str, handler: Callable) -> None:
+        pass
+
+
+def uncached_base_page(page: Any) -> Dict[str, Callable]:
+    """The previous base_page: new closures per call and a new locator per action."""
+    def fill_input(selector: str, value: str) -> None:
+        element = page.locator(selector)
+        element.fill(value)
+
+    def is_element_visible(selector: str) -> bool:
+        return page.locator(selector) is not None
+
+    return {"fill_input": fill_input, "is_element_visible": is_element_visible}
+
+
+def time_per_call(action: Callable[[], None], calls: int) -> float:
+    """Average microseconds per call of an action."""
+    started = time.perf_counter()
+    for _ in range(calls):
+        action()
+    return (time.perf_counter() - started) / calls * 1_000_000
+
+
+def bench_overhead(calls: int) -> None:
+    """Print the Python overhead of one fill_input call through each page object."""
+    page = StubPage()
+    results = {
+        "uncached": time_per_call(lambda: uncached_base_page(page)["fill_input"](".email-input", "x"), calls),
+        "cached": time_per_call(lambda: base_page(page)["fill_input"](".email-input", "x"), calls),
+    }
+    print(f"\nPython overhead per base_page(page)['fill_input'](...) call over {calls} calls")
+    for name, micros in results.items():
+        print(f"{name:8}  {micros:>6.2f}us")
+
+
+def bench_form(forms: int) -> None:
+    """Print the time to fill the three-field form field by field and in one batch."""
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=True)
+        page = browser.new_page()
+        page.set_content(FORM_HTML)
+        actions = base_page(page)
+
+        def fill_each() -> None:
+            for selector, value in FORM_FIELDS.items():
+                actions["fill_input"](selector, value)
+
+        results = {
+            "fill_input x3": measure(fill_each, forms),
+            "fill_form": measure(lambda: actions["fill_form"](FORM_FIELDS), forms),
+        }
+        browser.close()
+    print_results(f"Filling a three-field form, {forms} times", results)
+
+
+def main() -> None:
+    """Run the overhead and form benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100_000)
+    parser.add_argument("--forms", type=int, default=50)
+    parser.add_argument("--no-browser", action="store_true", help="Only measure the Python overhead")
+    args = parser.parse_args()
+
+    bench_overhead(args.calls)
+    if not args.no_browser:
+        bench_form(args.forms)
+
+
+if __name__ == "__main__":
+    main()
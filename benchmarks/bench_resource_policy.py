@@ -0,0 +1,87 @@
+"""Load time of the Flask index page with and without resource blocking.
+
+Serves app.py on an ephemeral local port and loads the index page in a fresh
+context per sample, once with no policy and once under each blocking policy.
+Each sample waits for the load event. Blocked requests and the response
+bytes that were actually transferred are counted per policy.
+
+Usage:
+    python -m benchmarks.bench_resource_policy [--repeat N]
+"""
+from typing import Dict, List
+import argparse
+import threading
+from playwright.sync_api import Browser, Request, sync_playwright
+from werkzeug.serving import make_server
+from app import app
+from benchmarks.common import measure, print_results
+from config.test_config import RESOURCE_POLICIES
+from utils.resource_policy import create_resource_blocker
+
+
+def run_policy(browser: Browser, base_url: str, policy_name: str, repeat: int) -> Dict[str, float]:
+    """Load the index page repeatedly under one policy and return timings and counters."""
+    policy = dict(RESOURCE_POLICIES[policy_name])
+    if "allow_domains" in policy:
+        policy["allow_domains"] = ["127.0.0.1"]
+    blocker = create_resource_blocker(policy)
+    finished: List[Request] = []
+    transferred: List[int] = []
+    state = {}
+
+    def close_sample() -> None:
+        """Count the previous sample's transferred bytes (outside the timing) and close its context."""
+        transferred.extend(response_size(request) for request in finished)
+        finished.clear()
+        state.pop("context").close()
+
+    def setup() -> None:
+        """Replace the previous sample's context with a fresh one under the policy."""
+        if "context" in state:
+            close_sample()
+        state["context"] = browser.new_context()
+        blocker["attach"](state["context"])
+        state["context"].on("requestfinished", finished.append)
+        state["page"] = state["context"].new_page()
+
+    def load() -> None:
+        state["page"].goto(base_url, wait_until="load")
+
+    timings = measure(load, repeat, setup=setup)
+    close_sample()
+    stats = blocker["get_stats"]()
+    return {**timings, "blocked": stats["blocked"] / repeat, "bytes": sum(transferred) / repeat}
+
+
+def response_size(request: Request) -> int:
+    """Bytes of the response body the browser received for a finished request."""
+    return max(request.sizes()["responseBodySize"], 0)
+
+
+def main() -> None:
+    """Load the page under each policy and print load times, blocked requests and bytes."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    try:
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch(headless=True)
+            # One unmeasured load warms the server and the browser
+            run_policy(browser, base_url, "none", 1)
+            results = {name: run_policy(browser, base_url, name, args.repeat) for name in RESOURCE_POLICIES}
+            browser.close()
+    finally:
+        server.shutdown()
+
+    print_results(f"Index page load time over {args.repeat} loads", results)
+    width = max(len(name) for name in results)
+    for name, result in results.items():
+        print(f"{name:{width}}  {result['blocked']:>5.1f} blocked/load  {result['bytes'] / 1024:>8.1f} KiB transferred/load")
+
+
+if __name__ == "__main__":
+    main()
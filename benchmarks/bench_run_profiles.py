@@ -0,0 +1,64 @@
+"""Wall time of the same test selection under each run profile.
+
+Runs pytest once per profile in a subprocess (so browser launch, artifact
+recording and report writing are all included) and prints the wall time,
+the number of tests executed and the exit code.
+
+Usage:
+    python -m benchmarks.bench_run_profiles [--profiles fast ci debug] [pytest args...]
+
+Pytest arguments default to the component tests, which use the local mock page.
+"""
+from typing import Dict, List
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+from config.test_config import RUN_PROFILES
+
+DEFAULT_PYTEST_ARGS = ["tests/components"]
+
+
+def run_profile(profile: str, pytest_args: List[str]) -> Dict[str, float]:
+    """Run pytest under a profile and return wall time, executed test count and exit code."""
+    report_path = os.path.join("reports", f"bench-profile-{profile}.log")
+    os.makedirs("reports", exist_ok=True)
+    started = time.perf_counter()
+    with open(report_path, "w") as log:
+        completed = subprocess.run(
+            [sys.executable, "-m", "pytest", "--profile", profile, "-p", "no:cacheprovider", "-q", *pytest_args],
+            stdout=log,
+            stderr=subprocess.STDOUT
+        )
+    elapsed = time.perf_counter() - started
+    with open(report_path, "r") as log:
+        summary = log.read().strip().splitlines()[-1:]
+    # e.g. "== 8 passed, 2 errors in 0.65s ==" on the last line
+    counts = re.findall(r"(\d+) (passed|failed|errors?)", summary[0] if summary else "")
+    executed = sum(int(count) for count, _ in counts)
+    return {"seconds": elapsed, "tests": executed, "exit_code": completed.returncode}
+
+
+def main() -> None:
+    """Run the selection under every profile and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", nargs="+", default=sorted(RUN_PROFILES), choices=sorted(RUN_PROFILES))
+    args, pytest_args = parser.parse_known_args()
+
+    results = {profile: run_profile(profile, pytest_args or DEFAULT_PYTEST_ARGS) for profile in args.profiles}
+
+    print(f"\nSuite wall time per run profile ({' '.join(pytest_args or DEFAULT_PYTEST_ARGS)})")
+    width = max(len(profile) for profile in results)
+    for profile, result in results.items():
+        per_test = result["seconds"] / result["tests"] if result["tests"] else 0.0
+        print(
+            f"{profile:{width}}  {result['seconds']:>7.2f}s  {result['tests']:>4} tests  "
+            f"{per_test:>6.2f}s/test  exit {result['exit_code']}"
+        )
+    print("Full pytest output is in reports/bench-profile-<profile>.log")
+
+
+if __name__ == "__main__":
+    main()
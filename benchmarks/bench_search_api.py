@@ -0,0 +1,92 @@
+"""Latency and throughput of the search API over a generated corpus.
+
+Builds the search index for a corpus of --docs documents, reports the build
+time and the in-process search latency percentiles for random vocabulary
+queries, then serves app.py with the test server and reports the requests
+per second that concurrent keep-alive clients get from /api/search.
+
+Usage:
+    SEARCH_CORPUS_SIZE=5000 python -m benchmarks.bench_search_api [--clients N] [--requests N]
+"""
+from typing import List
+import argparse
+import http.client
+import os
+import random
+import statistics
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+import search_index
+from app import SEARCH_INDEX, app
+from utils.test_server import start_test_server
+
+
+def random_queries(count: int, seed: int = 7) -> List[str]:
+    """Queries of one to three words drawn from the corpus vocabulary."""
+    rng = random.Random(seed)
+    vocabulary = search_index.TOPICS + search_index.WORDS
+    return [" ".join(rng.sample(vocabulary, rng.randint(1, 3))) for _ in range(count)]
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of the samples."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def client_run(host: str, port: int, queries: List[str]) -> None:
+    """Run the queries over one keep-alive connection."""
+    connection = http.client.HTTPConnection(host, port, timeout=10)
+    for query in queries:
+        connection.request("GET", "/api/search?" + urllib.parse.urlencode({"q": query}))
+        response = connection.getresponse()
+        response.read()
+        if response.status != 200:
+            raise RuntimeError(f"Unexpected status {response.status}")
+    connection.close()
+
+
+def main() -> None:
+    """Measure index build, search latency and API throughput."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=int(os.getenv("SEARCH_CORPUS_SIZE", "5000")))
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=4000)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    index = search_index.build_index(search_index.generate_corpus(args.docs))
+    build_ms = (time.perf_counter() - started) * 1000
+
+    queries = random_queries(args.requests)
+    latencies = []
+    partial = 0
+    for query in queries:
+        result = search_index.search(index, query)
+        latencies.append(result["took_ms"])
+        partial += result["partial"]
+
+    print(f"\nCorpus of {args.docs} documents, index built in {build_ms:.0f}ms")
+    print(f"search(): p50 {percentile(latencies, 0.5):.2f}ms  p95 {percentile(latencies, 0.95):.2f}ms  "
+          f"p99 {percentile(latencies, 0.99):.2f}ms  mean {statistics.mean(latencies):.2f}ms  "
+          f"partial {partial}/{len(queries)}")
+
+    # The app builds its own index at import; size it with SEARCH_CORPUS_SIZE
+    server = start_test_server(app)
+    try:
+        host, port = server["base_url"].rsplit("//", 1)[1].split(":")
+        chunks = [queries[i::args.clients] for i in range(args.clients)]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.clients) as executor:
+            for future in [executor.submit(client_run, host, int(port), chunk) for chunk in chunks]:
+                future.result()
+        rate = len(queries) / (time.perf_counter() - started)
+    finally:
+        server["stop"]()
+    print(f"/api/search ({server['backend']}, {len(SEARCH_INDEX['documents'])} docs): "
+          f"{rate:.0f} req/s from {args.clients} concurrent keep-alive clients")
+
+
+if __name__ == "__main__":
+    main()
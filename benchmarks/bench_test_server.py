@@ -0,0 +1,91 @@
+"""Readiness time and throughput of the test server backends under concurrent clients.
+
+Serves app.py the way `python app.py` does (single-threaded werkzeug), with
+the threaded werkzeug server and with waitress when it is installed. For each
+one it reports the time until /healthz answers and the requests per second
+that a pool of concurrent clients gets for the index page.
+
+Usage:
+    python -m benchmarks.bench_test_server [--clients N] [--requests N]
+"""
+from typing import Any, Dict
+import argparse
+import http.client
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.serving import make_server
+from app import app
+from utils.test_server import QuietRequestHandler, create_waitress_server, start_test_server, wait_until_healthy
+
+
+def start_dev_server() -> Dict[str, Any]:
+    """Serve the app single-threaded, like app.run()."""
+    server = make_server("127.0.0.1", 0, app, threaded=False, request_handler=QuietRequestHandler)
+    thread = threading.Thread(target=lambda: server.serve_forever(poll_interval=0.05), daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    def stop() -> None:
+        server.shutdown()
+        thread.join(timeout=5)
+
+    return {"base_url": base_url, "ready_seconds": wait_until_healthy(base_url), "stop": stop}
+
+
+def client_run(host: str, port: int, requests: int) -> None:
+    """Fetch the index page repeatedly over one keep-alive connection."""
+    connection = http.client.HTTPConnection(host, port, timeout=10)
+    for _ in range(requests):
+        connection.request("GET", "/", headers={"Accept-Encoding": "gzip"})
+        response = connection.getresponse()
+        response.read()
+        if response.status != 200:
+            raise RuntimeError(f"Unexpected status {response.status}")
+    connection.close()
+
+
+def measure_throughput(base_url: str, clients: int, requests: int) -> float:
+    """Requests per second for concurrent clients splitting the requests."""
+    host, port = base_url.rsplit("//", 1)[1].split(":")
+    per_client = requests // clients
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        for future in [executor.submit(client_run, host, int(port), per_client) for _ in range(clients)]:
+            future.result()
+    return per_client * clients / (time.perf_counter() - started)
+
+
+def main() -> None:
+    """Start every backend, measure it and print readiness and throughput."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=4000)
+    args = parser.parse_args()
+
+    starters = {
+        "dev server (1 thread)": start_dev_server,
+        "werkzeug threaded": lambda: start_test_server(app, backend="werkzeug"),
+    }
+    if create_waitress_server is not None:
+        starters["waitress"] = lambda: start_test_server(app, backend="waitress")
+
+    results = {}
+    for name, start in starters.items():
+        server = start()
+        try:
+            results[name] = {
+                "ready_ms": server["ready_seconds"] * 1000,
+                "rate": measure_throughput(server["base_url"], args.clients, args.requests),
+            }
+        finally:
+            server["stop"]()
+
+    print(f"\nIndex page, {args.requests} requests from {args.clients} concurrent keep-alive clients")
+    width = max(len(name) for name in results)
+    for name, result in results.items():
+        print(f"{name:{width}}  ready in {result['ready_ms']:>6.1f}ms  {result['rate']:>8.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""CPU time and bytes written by video capture versus the trace ring buffer.
+
+Runs the same search scenario on the local mock page with no capture, with
+video recording (as retain-on-failure does for every test) and with the
+trace buffer. Each mode starts its own Playwright driver and browser so the
+CPU time of those processes can be read from the children's resource usage
+once they exit. Bytes are reported for a passing test and for one that
+failed and kept its artifacts.
+
+Usage:
+    python -m benchmarks.bench_trace_buffer [--tests N]
+"""
+from typing import Callable, Dict, Optional
+import argparse
+import os
+import resource
+import shutil
+import tempfile
+import time
+from playwright.sync_api import Page, sync_playwright
+from config.test_config import get_mock_origin
+from utils.mock_pages import create_mock_registry
+from utils.trace_buffer import create_trace_buffer
+
+MOCK_DIR = os.path.join(os.path.dirname(__file__), "..", "tests", "components")
+
+
+def scenario(page: Page, mock_url: str) -> None:
+    """Search on the mock page and wait for the results."""
+    page.goto(mock_url)
+    page.locator(".search-input").fill("playwright python automation")
+    page.locator(".search-input").press("Enter")
+    page.locator(".result-item").first.wait_for(state="visible")
+
+
+def directory_size(path: str) -> int:
+    """Total size of the files below a directory."""
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+
+def run_mode(mode: str, tests: int, mock_pages: Dict[str, Callable], work_dir: str) -> Dict[str, float]:
+    """Run the scenario under one capture mode and measure CPU, wall time and bytes."""
+    output_dir = os.path.join(work_dir, mode)
+    os.makedirs(output_dir)
+    usage_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu_before = time.process_time()
+    started = time.perf_counter()
+    kept_bytes = 0
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=True)
+        for index in range(tests):
+            context_args = {"record_video_dir": os.path.join(output_dir, "raw")} if mode == "video" else {}
+            context = browser.new_context(**context_args)
+            mock_pages["attach"](context)
+            page = context.new_page()
+            buffer: Optional[Dict[str, Callable]] = None
+            if mode == "trace buffer":
+                buffer = create_trace_buffer(page)
+                buffer["start"]()
+            scenario(page, mock_pages["get_url"]("google"))
+            # The last test plays the failing one that keeps its artifacts
+            failed = index == tests - 1
+            if buffer is not None and failed:
+                kept_bytes = buffer["persist"](os.path.join(output_dir, "failed"), f"bench-{index}")["bytes"]
+            page.close()
+            if mode == "video":
+                if failed:
+                    kept_path = os.path.join(output_dir, "failed", "video.webm")
+                    page.video.save_as(kept_path)
+                    kept_bytes = os.path.getsize(kept_path)
+            context.close()
+        browser.close()
+    wall = time.perf_counter() - started
+    usage_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    child_cpu = (usage_after.ru_utime - usage_before.ru_utime) + (usage_after.ru_stime - usage_before.ru_stime)
+    raw_dir = os.path.join(output_dir, "raw")
+    written = directory_size(raw_dir) if os.path.isdir(raw_dir) else 0
+    return {
+        "cpu": child_cpu + time.process_time() - cpu_before,
+        "wall": wall,
+        "bytes_per_pass": written / tests if mode == "video" else 0,
+        "bytes_on_failure": kept_bytes,
+    }
+
+
+def main() -> None:
+    """Run every capture mode and print CPU and bytes per test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tests", type=int, default=10)
+    args = parser.parse_args()
+
+    mock_pages = create_mock_registry(get_mock_origin())
+    mock_pages["register"](
+        "google", os.path.join(MOCK_DIR, "mock_google.html"), os.path.join(MOCK_DIR, "mock_results.json")
+    )
+    work_dir = tempfile.mkdtemp(prefix="bench-trace-buffer-")
+    try:
+        results = {mode: run_mode(mode, args.tests, mock_pages, work_dir) for mode in ("none", "video", "trace buffer")}
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(f"\nCapture cost over {args.tests} tests (browser, driver and Python CPU)")
+    width = max(len(mode) for mode in results)
+    print(f"{'':{width}}  {'CPU/test':>10}  {'wall/test':>10}  {'written/pass':>13}  {'kept/failure':>13}")
+    for mode, result in results.items():
+        print(
+            f"{mode:{width}}  {result['cpu'] / args.tests * 1000:>8.0f}ms  {result['wall'] / args.tests * 1000:>8.0f}ms  "
+            f"{result['bytes_per_pass'] / 1024:>10.0f}KiB  {result['bytes_on_failure'] / 1024:>10.0f}KiB"
+        )
+    video, buffer = results["video"], results["trace buffer"]
+    print(
+        f"trace buffer saves {(video['cpu'] - buffer['cpu']) / args.tests * 1000:.0f} ms CPU and "
+        f"{video['bytes_per_pass'] / 1024:.0f} KiB of disk writes per passing test compared with video"
+    )
+
+
+if __name__ == "__main__":
+    main()
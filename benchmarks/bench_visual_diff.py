@@ -0,0 +1,79 @@
+"""Comparisons per second of the visual diff engine, serial versus a process pool.
+
+Generates synthetic full-page screenshots (text-like stripes on a white page)
+and their baselines, with a changed block in every other pair, then compares
+them one after another in this process and across worker processes. Both
+timings include loading the PNGs and writing the diff images.
+
+Usage:
+    python -m benchmarks.bench_visual_diff [--pairs N] [--width W] [--height H] [--workers N]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import numpy as np
+from utils.visual_diff import compare_many, save_image
+
+
+def make_page_image(width: int, height: int, seed: int) -> np.ndarray:
+    """Build a page-like RGBA image with rows of dark 'text' runs."""
+    rng = np.random.default_rng(seed)
+    image = np.full((height, width, 4), 255, dtype=np.uint8)
+    for top in range(20, height - 20, 24):
+        left = 40
+        while left < width - 80:
+            run = int(rng.integers(20, 80))
+            image[top:top + 12, left:left + run, :3] = 40
+            left += run + 8
+    return image
+
+
+def write_pairs(work_dir: str, pairs: int, width: int, height: int) -> list:
+    """Write baseline/actual pairs and return the comparison jobs."""
+    jobs = []
+    for index in range(pairs):
+        baseline = make_page_image(width, height, seed=index)
+        actual = baseline.copy()
+        if index % 2:
+            actual[100:160, 200:400, :3] = 0
+        baseline_path = os.path.join(work_dir, f"{index}-baseline.png")
+        actual_path = os.path.join(work_dir, f"{index}-actual.png")
+        save_image(baseline, baseline_path)
+        save_image(actual, actual_path)
+        jobs.append((actual_path, baseline_path, os.path.join(work_dir, f"{index}-diff.png")))
+    return jobs
+
+
+def main() -> None:
+    """Compare the generated pairs serially and in a pool and print comparisons per second."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pairs", type=int, default=60)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=2400)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="bench-visual-diff-")
+    try:
+        jobs = write_pairs(work_dir, args.pairs, args.width, args.height)
+        results = {}
+        for mode, workers in (("serial", 1), (f"pool ({args.workers} workers)", args.workers)):
+            started = time.perf_counter()
+            outcome = compare_many(jobs, workers=workers)
+            results[mode] = time.perf_counter() - started
+            mismatches = sum(not result["match"] for result in outcome)
+            assert mismatches == args.pairs // 2, f"{mode}: expected {args.pairs // 2} mismatches, got {mismatches}"
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(f"\n{args.pairs} comparisons of {args.width}x{args.height} screenshots")
+    width = max(len(mode) for mode in results)
+    for mode, seconds in results.items():
+        print(f"{mode:{width}}  {seconds:>7.2f}s  {args.pairs / seconds:>8.1f} comparisons/s  "
+              f"{seconds / args.pairs * 1000:>7.1f} ms/comparison")
+
+
+if __name__ == "__main__":
+    main()
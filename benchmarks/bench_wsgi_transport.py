@@ -0,0 +1,110 @@
+"""Request latency of app.py over TCP versus the in-process WSGI transport.
+
+The first part measures without a browser: one keep-alive HTTP round trip
+to the test server against one dispatch() through the transport, for the
+index page and a search API call, plus the time to get each ready. The
+second part opens the index in many concurrent contexts of one browser,
+once through the test server and once through the transport, and reports
+the per-page load time and the pages per second.
+
+Usage:
+    python -m benchmarks.bench_wsgi_transport [--requests N] [--contexts N] [--no-browser]
+"""
+from typing import Any, Callable, Dict, List, Optional
+import argparse
+import asyncio
+import http.client
+import statistics
+import time
+from app import app
+from benchmarks.common import measure, print_results
+from utils.async_runner import launch_browser, open_page
+from utils.test_server import start_test_server
+from utils.wsgi_transport import create_wsgi_transport
+
+PATHS = {"index": "/", "search": "/api/search?q=test+query"}
+
+
+def bench_requests(requests: int) -> None:
+    """Print per-request latency through the test server and through dispatch()."""
+    started = time.perf_counter()
+    server = start_test_server(app, backend="werkzeug")
+    server_ready_ms = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    transport = create_wsgi_transport(app)
+    transport_ready_ms = (time.perf_counter() - started) * 1000
+
+    host, port = server["base_url"].rsplit("//", 1)[1].split(":")
+    connection = http.client.HTTPConnection(host, int(port), timeout=10)
+
+    def over_tcp(path: str) -> Callable[[], None]:
+        def action() -> None:
+            connection.request("GET", path)
+            response = connection.getresponse()
+            response.read()
+        return action
+
+    def in_process(path: str) -> Callable[[], None]:
+        return lambda: transport["dispatch"]("GET", transport["base_url"] + path, {})
+
+    results = {}
+    try:
+        for name, path in PATHS.items():
+            results[f"{name} over TCP"] = measure(over_tcp(path), requests)
+            results[f"{name} in-process"] = measure(in_process(path), requests)
+    finally:
+        connection.close()
+        server["stop"]()
+    print(f"\nReady: test server {server_ready_ms:.1f}ms, WSGI transport {transport_ready_ms:.2f}ms")
+    print_results(f"Per-request latency, {requests} requests each", results)
+
+
+async def load_pages(contexts: int, base_url: str, transport: Optional[Dict[str, Any]] = None) -> List[float]:
+    """Open the index in concurrent contexts and return each page's load time in milliseconds."""
+    async with launch_browser(headless=True) as browser:
+        async def load_one() -> float:
+            async with open_page(browser) as page:
+                if transport is not None:
+                    await page.context.route(transport["pattern"], transport["handle_route_async"])
+                started = time.perf_counter()
+                await page.goto(base_url + "/", wait_until="load")
+                return (time.perf_counter() - started) * 1000
+
+        return await asyncio.gather(*(load_one() for _ in range(contexts)))
+
+
+def bench_browser(contexts: int) -> None:
+    """Print index load times with every context going over TCP and through the transport."""
+    server = start_test_server(app)
+    transport = create_wsgi_transport(app)
+    try:
+        runs = {
+            "over TCP": lambda: load_pages(contexts, server["base_url"]),
+            "in-process": lambda: load_pages(contexts, transport["base_url"], transport),
+        }
+        print(f"\nIndex load in {contexts} concurrent contexts")
+        for name, run in runs.items():
+            started = time.perf_counter()
+            samples = asyncio.run(run())
+            elapsed = time.perf_counter() - started
+            print(f"{name:10}  median {statistics.median(samples):>7.1f}ms  max {max(samples):>7.1f}ms  "
+                  f"{contexts / elapsed:>6.1f} pages/s")
+    finally:
+        server["stop"]()
+
+
+def main() -> None:
+    """Run the request and browser benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--contexts", type=int, default=100)
+    parser.add_argument("--no-browser", action="store_true", help="Only measure request latency")
+    args = parser.parse_args()
+
+    bench_requests(args.requests)
+    if not args.no_browser:
+        bench_browser(args.contexts)
+
+
+if __name__ == "__main__":
+    main()
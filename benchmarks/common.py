@@ -0,0 +1,41 @@
+"""Shared helpers for the benchmark scripts."""
+from typing import Callable, Dict, List
+import statistics
+import time
+
+
+def measure(action: Callable[[], None], repeat: int, setup: Callable[[], None] = lambda: None) -> Dict[str, float]:
+    """Time an action several times and summarize the samples in milliseconds.
+
+    Args:
+        action: Function to time
+        repeat: Number of timed runs
+        setup: Untimed function called before each run
+
+    Returns:
+        Dict with mean, median, min and max latency in milliseconds
+    """
+    samples: List[float] = []
+    for _ in range(repeat):
+        setup()
+        started = time.perf_counter()
+        action()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        "mean": statistics.mean(samples),
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "max": max(samples),
+    }
+
+
+def print_results(title: str, results: Dict[str, Dict[str, float]], unit: str = "ms") -> None:
+    """Print benchmark results as an aligned table."""
+    print(f"\n{title}")
+    width = max(len(name) for name in results)
+    print(f"{'':{width}}  {'mean':>10}  {'median':>10}  {'min':>10}  {'max':>10}")
+    for name, stats in results.items():
+        print(
+            f"{name:{width}}  {stats['mean']:>8.2f}{unit}  {stats['median']:>8.2f}{unit}  "
+            f"{stats['min']:>8.2f}{unit}  {stats['max']:>8.2f}{unit}"
+        )
@@ -1,5 +1,6 @@
 """Test configuration module."""
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse
 import os
 from dotenv import load_dotenv
 
@@ -47,9 +48,157 @@ def get_mobile_devices() -> Dict[str, Dict[str, Any]]:
         }
     }
 
-def get_browser_config() -> Dict[str, Any]:
-    """Get browser configuration."""
+# Named run profiles: browser launch, artifact policy and reporting per use case
+RUN_PROFILES: Dict[str, Dict[str, Any]] = {
+    'fast': {
+        'headless': True,
+        'slow_mo': 0,
+        'browsers': ['chromium'],
+        'video': 'off',
+        'screenshot': 'off',
+        'tracing': 'off',
+        'trace_buffer': False,
+        'html_report': False
+    },
+    'ci': {
+        'headless': True,
+        'slow_mo': 0,
+        'browsers': ['chromium', 'firefox', 'webkit'],
+        'video': 'off',
+        'screenshot': 'only-on-failure',
+        'tracing': 'off',
+        'trace_buffer': True,
+        'html_report': True
+    },
+    'debug': {
+        'headless': False,
+        'slow_mo': 50,
+        'browsers': ['chromium'],
+        'video': 'on',
+        'screenshot': 'on',
+        'tracing': 'on',
+        'trace_buffer': False,
+        'html_report': True
+    }
+}
+
+def get_run_profile_name() -> str:
+    """Get the default run profile (fast, ci or debug)."""
+    return os.getenv('RUN_PROFILE', 'fast').lower()
+
+def get_browser_config(profile: Optional[str] = None) -> Dict[str, Any]:
+    """Get browser configuration for a run profile.
+
+    HEADLESS and SLOW_MO, when set, override the profile's values.
+    """
+    config = dict(RUN_PROFILES[profile or get_run_profile_name()])
+    if os.getenv('HEADLESS'):
+        config['headless'] = os.getenv('HEADLESS').lower() == 'true'
+    if os.getenv('SLOW_MO'):
+        config['slow_mo'] = int(os.getenv('SLOW_MO'))
+    return config
+
+# Social and analytics hosts the pages under test link to or embed
+TRACKER_DOMAINS = [
+    'linkedin.com', 'twitter.com', 'x.com', 'instagram.com', 'facebook.com', 'facebook.net',
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net'
+]
+
+# Named resource blocking policies: resource types to block, domains to deny
+# and, when allow_domains is set, the only domains requests may go to
+RESOURCE_POLICIES: Dict[str, Dict[str, List[str]]] = {
+    'none': {},
+    'functional': {
+        'block_types': ['image', 'media', 'font'],
+        'deny_domains': TRACKER_DOMAINS
+    },
+    'trackers': {
+        'deny_domains': TRACKER_DOMAINS
+    },
+    'first_party': {
+        'block_types': ['image', 'media', 'font'],
+        'allow_domains': ['{base_url}']
+    }
+}
+
+def get_resource_policy_name() -> str:
+    """Get the default resource blocking policy (none, functional, trackers or first_party)."""
+    return os.getenv('RESOURCE_POLICY', 'none').lower()
+
+def get_resource_policy(name: str) -> Dict[str, List[str]]:
+    """Get a resource blocking policy, with '{base_url}' resolved to the host under test."""
+    policy = dict(RESOURCE_POLICIES[name])
+    if 'allow_domains' in policy:
+        base_host = urlparse(get_base_url()).hostname or ''
+        policy['allow_domains'] = [base_host if domain == '{base_url}' else domain for domain in policy['allow_domains']]
+    return policy
+
+def get_context_pool_settings() -> Dict[str, Any]:
+    """Get settings for the pooled browser context mode."""
+    return {
+        'enabled': os.getenv('CONTEXT_POOL', 'false').lower() == 'true',
+        'max_size': int(os.getenv('CONTEXT_POOL_SIZE', '4')),
+        'max_reuses': int(os.getenv('CONTEXT_POOL_MAX_REUSES', '50'))
+    }
+
+def get_worker_count() -> int:
+    """Get the number of worker processes for sharded runs (0 disables sharding)."""
+    return int(os.getenv('WORKERS', '0'))
+
+def get_captcha_markers_path() -> str:
+    """Get the data file whose CAPTCHA markers extend the bundled ones (the bundled file by default)."""
+    default_path = os.path.join(os.path.dirname(__file__), 'captcha_markers.json')
+    return os.getenv('CAPTCHA_MARKERS_PATH', default_path)
+
+def get_asset_cache_settings() -> Dict[str, Any]:
+    """Get settings for the shared static asset cache."""
     return {
-        'headless': os.getenv('HEADLESS', 'false').lower() == 'true',
-        'slow_mo': int(os.getenv('SLOW_MO', '0'))
+        'enabled': os.getenv('ASSET_CACHE', 'false').lower() == 'true',
+        'max_bytes': int(os.getenv('ASSET_CACHE_MAX_MB', '64')) * 1024 * 1024,
+        'ttl': float(os.getenv('ASSET_CACHE_TTL', '3600')),
+        'disk_dir': os.getenv('ASSET_CACHE_DIR') or None
     }
+
+def get_har_settings() -> Dict[str, str]:
+    """Get the default HAR mode (off, record, replay) and URL matching (strict, lenient)."""
+    return {
+        'mode': os.getenv('HAR_MODE', 'off').lower(),
+        'match': os.getenv('HAR_MATCH', 'strict').lower()
+    }
+
+def get_browser_server_enabled() -> bool:
+    """Get whether fixtures connect to a long-lived browser server instead of launching."""
+    return os.getenv('BROWSER_SERVER', 'false').lower() == 'true'
+
+def get_screenshot_settings() -> Dict[str, Any]:
+    """Get the screenshot service's output directory, format, quality and writer threads."""
+    return {
+        'output_dir': os.getenv('SCREENSHOT_DIR', 'screenshots'),
+        'image_format': os.getenv('SCREENSHOT_FORMAT', 'png').lower(),
+        'quality': int(os.getenv('SCREENSHOT_QUALITY', '80')),
+        'max_workers': int(os.getenv('SCREENSHOT_WORKERS', '2'))
+    }
+
+def get_visual_settings() -> Dict[str, Any]:
+    """Get the visual comparison baseline directory and default tolerances."""
+    return {
+        'baseline_dir': os.getenv('VISUAL_BASELINE_DIR', os.path.join('tests', 'visual_baselines')),
+        'threshold': float(os.getenv('VISUAL_THRESHOLD', '0.1')),
+        'max_diff_ratio': float(os.getenv('VISUAL_MAX_DIFF_RATIO', '0.001'))
+    }
+
+def get_test_server_settings() -> Dict[str, Any]:
+    """Get settings for the in-process test server that serves app.py."""
+    return {
+        'external': os.getenv('EXTERNAL_SERVER', 'false').lower() == 'true',
+        'backend': os.getenv('TEST_SERVER_BACKEND', 'auto').lower(),
+        'threads': int(os.getenv('TEST_SERVER_THREADS', '8'))
+    }
+
+def get_wsgi_origin() -> str:
+    """Get the origin pages use to reach app.py through the in-process WSGI transport."""
+    return os.getenv('WSGI_ORIGIN', 'http://app.wsgi.test')
+
+def get_mock_origin() -> str:
+    """Get the origin mock pages are served under from memory."""
+    return os.getenv('MOCK_ORIGIN', 'http://mock.test')
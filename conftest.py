@@ -3,9 +3,14 @@ Configuration and fixtures for BDD tests.
 Type-safe implementation with proper error handling.
 """
 import os
+import json
+import shlex
+import argparse
+import asyncio
+import inspect
 import logging
 import pytest
-from typing import Dict, Any, Generator
+from typing import Dict, Any, Callable, Generator, Optional
 from playwright.sync_api import (
     Browser,
     BrowserContext,
@@ -13,6 +18,57 @@ from playwright.sync_api import (
     Playwright,
     sync_playwright
 )
+from playwright.async_api import Browser as AsyncBrowser, Page as AsyncPage
+from config.test_config import (
+    RESOURCE_POLICIES,
+    RUN_PROFILES,
+    get_asset_cache_settings,
+    get_browser_config,
+    get_browser_server_enabled,
+    get_context_pool_settings,
+    get_har_settings,
+    get_mock_origin,
+    get_resource_policy,
+    get_resource_policy_name,
+    get_run_profile_name,
+    get_test_server_settings,
+    get_visual_settings,
+    get_worker_count,
+    get_wsgi_origin
+)
+from utils.context_pool import create_context_pool, format_pool_metrics, open_context
+from utils.durations import estimate_durations, get_duration_key, load_durations, save_durations
+from utils.scheduler import (
+    build_schedule_report,
+    format_schedule_report,
+    plan_lpt,
+    predict_round_robin_makespan
+)
+from utils.sharding import SHARDS_DIR, run_shards, select_shard_items, write_report_line
+from utils.readiness import format_wait_stats, get_wait_stats
+from utils.storage_state import DEFAULT_IDENTITY, create_storage_state_manager
+from utils.asset_cache import create_asset_cache, format_cache_stats
+from utils.har_replay import create_recorder, create_replayer, get_archive_path, load_archive
+from utils.browser_server import connect_browser
+from utils.artifacts import (
+    capture_screenshot,
+    finish_video,
+    get_artifact_path,
+    is_test_failed,
+    should_keep,
+    start_tracing,
+    stop_tracing
+)
+from utils.trace_buffer import create_trace_buffer
+from utils.network_capture import create_network_capture
+from utils.test_server import start_test_server
+from utils.mock_pages import create_mock_registry
+from utils.wsgi_transport import create_wsgi_transport, format_transport_stats
+from app import app as test_app
+from utils.resource_policy import create_resource_blocker, format_blocker_stats, merge_blocker_stats
+from utils.visual_baselines import create_visual_asserter
+from utils.test_helpers import close_screenshot_service
+from utils.async_runner import launch_browser, open_page, run_on_loop, start_event_loop, stop_event_loop
 
 # Configure logging with descriptive format
 logging.basicConfig(
@@ -21,13 +77,327 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Browser configuration
-BROWSER_TYPE = "chromium"
-BROWSER_CONFIG = {
-    "headless": True,
-    "slow_mo": 50,
+POOL_METRICS_KEY = pytest.StashKey[Dict[str, int]]()
+ASSET_CACHE_STATS_KEY = pytest.StashKey[Dict[str, int]]()
+
+# Per-run state shared between reporting hooks
+run_state: Dict[str, Any] = {
+    "config": None,
+    "durations": {},
+    "duration_keys": {},
+    "schedule": None,
+    "worker_output": None,
+    "har_unmatched": {},
+    "trace_buffer": {"tests": 0, "persisted": 0, "bytes": 0},
+    "resource_blocking": {},
+    "test_server": None,
+    "wsgi_transport": {"requests": 0, "errors": 0, "bytes": 0, "app_seconds": 0.0},
 }
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register performance related command line options."""
+    pool_settings = get_context_pool_settings()
+    group = parser.getgroup("performance", "Test run performance")
+    group.addoption(
+        "--profile",
+        choices=sorted(RUN_PROFILES),
+        default=get_run_profile_name(),
+        help="Run profile setting headedness, slow-mo, browsers, artifact policy and reporting"
+    )
+    group.addoption(
+        "--context-pool",
+        action="store_true",
+        default=pool_settings["enabled"],
+        help="Reuse reset browser contexts across tests instead of creating one per test"
+    )
+    group.addoption(
+        "--context-pool-size",
+        type=int,
+        default=pool_settings["max_size"],
+        help="Maximum idle contexts kept per browser/device profile"
+    )
+    group.addoption(
+        "--context-pool-max-reuses",
+        type=int,
+        default=pool_settings["max_reuses"],
+        help="Evict a pooled context after this many tests"
+    )
+    group.addoption(
+        "--asset-cache",
+        action="store_true",
+        default=get_asset_cache_settings()["enabled"],
+        help="Serve repeated static assets (fonts, CSS, scripts, images) from a shared cache"
+    )
+    har_settings = get_har_settings()
+    group.addoption(
+        "--har-mode",
+        choices=("off", "record", "replay"),
+        default=har_settings["mode"],
+        help="Record the network traffic of tests marked with @pytest.mark.har, or replay it offline"
+    )
+    group.addoption(
+        "--har-match",
+        choices=("strict", "lenient"),
+        default=har_settings["match"],
+        help="Replay matching: full URL and body, or only host, path and identifying query parameters"
+    )
+    group.addoption(
+        "--trace-buffer",
+        action="store_true",
+        default=False,
+        help="Keep a ring of recent actions, network events and DOM snapshots per page; write it only on failure"
+    )
+    group.addoption(
+        "--browser-server",
+        action="store_true",
+        default=get_browser_server_enabled(),
+        help="Connect to a long-lived browser server (python -m utils.browser_server) instead of launching"
+    )
+    group.addoption(
+        "--workers",
+        type=int,
+        default=get_worker_count(),
+        help="Shard tests across this many worker processes, each with its own browser"
+    )
+    group.addoption(
+        "--external-server",
+        action="store_true",
+        default=get_test_server_settings()["external"],
+        help="Test against the server already running at BASE_URL instead of serving app.py on an ephemeral port"
+    )
+    group.addoption(
+        "--resource-policy",
+        choices=sorted(RESOURCE_POLICIES),
+        default=get_resource_policy_name(),
+        help="Block resources tests do not need (images, fonts, trackers); overridden per test by the resource_policy marker"
+    )
+    group.addoption(
+        "--update-baselines",
+        action="store_true",
+        default=False,
+        help="Rewrite visual baselines from this run's screenshots instead of comparing"
+    )
+    group.addoption(
+        "--worker-shard",
+        default=None,
+        help="Internal: file listing the node ids assigned to this worker"
+    )
+    group.addoption(
+        "--worker-output",
+        default=None,
+        help="Internal: file the worker streams its test reports to"
+    )
+
+# pytest-playwright options whose defaults are also valid explicit values
+PROFILE_VALUE_OPTIONS = {"slowmo": "--slowmo", "video": "--video", "screenshot": "--screenshot", "tracing": "--tracing"}
+
+def get_explicit_profile_options(config: pytest.Config) -> set:
+    """Names of the PROFILE_VALUE_OPTIONS given on the command line, in PYTEST_ADDOPTS or in addopts.
+
+    Their parsed values cannot tell an explicit --video off from the default,
+    so the arguments are parsed again with no defaults at all.
+    """
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    for name, flag in PROFILE_VALUE_OPTIONS.items():
+        parser.add_argument(flag, dest=name, default=argparse.SUPPRESS)
+    args = shlex.split(os.environ.get("PYTEST_ADDOPTS", "")) + config.getini("addopts") + list(config.invocation_params.args)
+    given, _ = parser.parse_known_args(args)
+    return set(vars(given))
+
+def apply_run_profile(config: pytest.Config) -> None:
+    """Fill pytest-playwright and pytest-html options from the run profile.
+
+    Options given explicitly on the command line keep their values.
+    """
+    profile = get_browser_config(config.getoption("profile"))
+    option = config.option
+    explicit = get_explicit_profile_options(config)
+    option.headed = option.headed or not profile["headless"]
+    if "slowmo" not in explicit:
+        option.slowmo = profile["slow_mo"]
+    option.browser = option.browser or list(profile["browsers"])
+    for name in ("video", "screenshot", "tracing"):
+        if name not in explicit:
+            setattr(option, name, profile[name])
+    option.trace_buffer = option.trace_buffer or profile["trace_buffer"]
+    if profile["html_report"] and not option.htmlpath:
+        option.htmlpath = os.path.join("reports", "report.html")
+        option.self_contained_html = True
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Apply the run profile and open the report stream when running as a shard worker."""
+    apply_run_profile(config)
+    run_state["config"] = config
+    if config.getoption("worker_output"):
+        run_state["worker_output"] = open(config.getoption("worker_output"), "a")
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Close the worker report stream."""
+    if run_state["worker_output"] is not None:
+        run_state["worker_output"].close()
+        run_state["worker_output"] = None
+
+def get_har_archive(item: pytest.Item) -> Optional[str]:
+    """Archive path of a test marked with @pytest.mark.har, None for unmarked tests.
+
+    The marker takes the archive group, by default the test module name.
+    """
+    marker = item.get_closest_marker("har")
+    if marker is None:
+        return None
+    group = marker.args[0] if marker.args else item.module.__name__.rsplit(".", 1)[-1]
+    return get_archive_path(group, item.name)
+
+def skip_unrecorded_har_tests(items: list) -> None:
+    """Skip replayed tests without an archive before any of their fixtures run."""
+    for item in items:
+        path = get_har_archive(item)
+        if path is not None and not os.path.exists(path):
+            item.add_marker(pytest.mark.skip(
+                reason=f"--har-mode replay needs the archive {path}, which has not been recorded; "
+                       f"record it once with --har-mode record against the live site"
+            ))
+
+def pytest_collection_modifyitems(session: pytest.Session, config: pytest.Config, items: list) -> None:
+    """Skip replayed tests without an archive and restrict a shard worker to the tests planned for it."""
+    if config.getoption("har_mode") == "replay":
+        skip_unrecorded_har_tests(items)
+    if config.getoption("worker_shard"):
+        select_shard_items(config, items, config.getoption("worker_shard"))
+        return
+    run_state["duration_keys"] = {item.nodeid: get_duration_key(item) for item in items}
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtestloop(session: pytest.Session) -> Optional[bool]:
+    """Run the collected tests across worker processes when sharding is enabled."""
+    config = session.config
+    workers = config.getoption("workers")
+    if workers <= 1 or config.getoption("worker_shard") or config.option.collectonly:
+        return None
+    if session.testsfailed and not config.option.continue_on_collection_errors:
+        # Let the default loop report the collection errors
+        return None
+    keys = run_state["duration_keys"]
+    nodeids = [item.nodeid for item in session.items]
+    estimates = estimate_durations([keys[nodeid] for nodeid in nodeids], load_durations())
+    durations = {nodeid: estimates[keys[nodeid]] for nodeid in nodeids}
+    plan = plan_lpt(durations, workers)
+    shard_workers = run_shards(session, plan["shards"])
+
+    wall_times = [0.0] * workers
+    for worker in shard_workers:
+        wall_times[worker["index"]] = worker["finished"] - worker["started"]
+    run_state["schedule"] = build_schedule_report(
+        plan,
+        predict_round_robin_makespan(nodeids, durations, workers),
+        run_state["durations"],
+        wall_times
+    )
+    with open(os.path.join(SHARDS_DIR, "schedule.json"), "w") as f:
+        json.dump(run_state["schedule"], f, indent=2)
+    return True
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem: pytest.Function) -> Optional[bool]:
+    """Run async tests on the async fixtures' event loop."""
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    loop = pyfuncitem._request.getfixturevalue("async_loop")
+    kwargs = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+    run_on_loop(loop, pyfuncitem.obj(**kwargs))
+    return True
+
+def pytest_runtest_logreport(report: pytest.TestReport) -> None:
+    """Record test durations and forward reports from shard workers."""
+    if run_state["worker_output"] is not None:
+        write_report_line(run_state["config"], run_state["worker_output"], report)
+        return
+    durations = run_state["durations"]
+    durations[report.nodeid] = durations.get(report.nodeid, 0.0) + report.duration
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Write pending screenshots and persist the durations of this run for future shard planning."""
+    close_screenshot_service()
+    if run_state["durations"] and not session.config.getoption("worker_shard"):
+        keys = run_state["duration_keys"]
+        save_durations({
+            keys[nodeid]: seconds
+            for nodeid, seconds in run_state["durations"].items()
+            if nodeid in keys
+        })
+
+def pytest_terminal_summary(terminalreporter, exitstatus: int, config: pytest.Config) -> None:
+    """Report pool and cache counters, the shard schedule, readiness waits, replays, the test server, the WSGI transport, blocking and trace buffers."""
+    metrics = config.stash.get(POOL_METRICS_KEY, None)
+    if metrics is not None:
+        terminalreporter.write_sep("-", "context pool")
+        for line in format_pool_metrics(metrics):
+            terminalreporter.write_line(line)
+    cache_stats = config.stash.get(ASSET_CACHE_STATS_KEY, None)
+    if cache_stats is not None:
+        terminalreporter.write_sep("-", "asset cache")
+        for line in format_cache_stats(cache_stats):
+            terminalreporter.write_line(line)
+    if run_state["schedule"] is not None:
+        terminalreporter.write_sep("-", "shard schedule")
+        for line in format_schedule_report(run_state["schedule"]):
+            terminalreporter.write_line(line)
+    wait_stats = get_wait_stats()
+    if wait_stats:
+        terminalreporter.write_sep("-", "readiness waits")
+        for line in format_wait_stats(wait_stats):
+            terminalreporter.write_line(line)
+    if run_state["har_unmatched"]:
+        terminalreporter.write_sep("-", "HAR replay")
+        for nodeid, requests in run_state["har_unmatched"].items():
+            terminalreporter.write_line(f"{nodeid}: {len(requests)} unmatched requests")
+            for line in requests[:10]:
+                terminalreporter.write_line(f"    {line}")
+    if run_state["test_server"] is not None:
+        server = run_state["test_server"]
+        terminalreporter.write_sep("-", "test server")
+        terminalreporter.write_line(
+            f"app.py served by {server['backend']} on {server['base_url']}, ready in {server['ready_seconds'] * 1000:.0f} ms"
+        )
+    if run_state["wsgi_transport"]["requests"]:
+        terminalreporter.write_sep("-", "WSGI transport")
+        for line in format_transport_stats(run_state["wsgi_transport"]):
+            terminalreporter.write_line(line)
+    if run_state["resource_blocking"]:
+        terminalreporter.write_sep("-", "resource blocking")
+        for line in format_blocker_stats(run_state["resource_blocking"]):
+            terminalreporter.write_line(line)
+    trace_stats = run_state["trace_buffer"]
+    if trace_stats["tests"]:
+        terminalreporter.write_sep("-", "trace buffer")
+        terminalreporter.write_line(
+            f"{trace_stats['tests']} pages buffered, {trace_stats['persisted']} written on failure "
+            f"({trace_stats['bytes'] / 1024:.0f} KiB)"
+        )
+
+@pytest.fixture(scope="session", autouse=True)
+def app_server(pytestconfig: pytest.Config) -> Generator[Optional[str], None, None]:
+    """Serve app.py on an ephemeral port for this process and point BASE_URL at it.
+
+    Every shard worker gets its own server. With --external-server the
+    tests use BASE_URL as configured.
+    """
+    if pytestconfig.getoption("external_server"):
+        yield None
+        return
+    settings = get_test_server_settings()
+    server = start_test_server(test_app, threads=settings["threads"], backend=settings["backend"])
+    run_state["test_server"] = server
+    previous_base_url = os.environ.get("BASE_URL")
+    os.environ["BASE_URL"] = server["base_url"]
+    yield server["base_url"]
+    server["stop"]()
+    if previous_base_url is None:
+        os.environ.pop("BASE_URL", None)
+    else:
+        os.environ["BASE_URL"] = previous_base_url
+
 @pytest.fixture(scope="session")
 def browser_context_args() -> Dict[str, Any]:
     """Configure browser context."""
@@ -47,25 +417,271 @@ def playwright() -> Generator[Playwright, None, None]:
         yield playwright
 
 @pytest.fixture(scope="session")
-def browser(playwright: Playwright) -> Generator[Browser, None, None]:
-    """Create browser instance."""
-    browser = playwright[BROWSER_TYPE].launch(**BROWSER_CONFIG)
+def browser(
+    playwright: Playwright,
+    browser_name: str,
+    browser_type_launch_args: Dict[str, Any],
+    pytestconfig: pytest.Config
+) -> Generator[Browser, None, None]:
+    """Create browser instance, or connect to the browser server with --browser-server.
+
+    The browser and launch arguments come from the run profile through
+    pytest-playwright's --browser, --headed and --slowmo options. Closing a
+    connected browser only disconnects; the server keeps running for the
+    next invocation.
+    """
+    if pytestconfig.getoption("browser_server"):
+        browser = connect_browser(
+            playwright,
+            browser_name,
+            headless=browser_type_launch_args.get("headless", True),
+            slow_mo=browser_type_launch_args.get("slow_mo", 0)
+        )
+    else:
+        browser = playwright[browser_name].launch(**browser_type_launch_args)
     yield browser
     browser.close()
 
+@pytest.fixture(scope="session")
+def context_pool(pytestconfig: pytest.Config) -> Generator[Optional[Dict[str, Callable]], None, None]:
+    """Create the context pool when pooled mode is enabled."""
+    if not pytestconfig.getoption("context_pool"):
+        yield None
+        return
+    pool = create_context_pool(
+        max_size=pytestconfig.getoption("context_pool_size"),
+        max_reuses=pytestconfig.getoption("context_pool_max_reuses")
+    )
+    yield pool
+    pytestconfig.stash[POOL_METRICS_KEY] = pool["get_metrics"]()
+    pool["close_all"]()
+
+@pytest.fixture(scope="session")
+def asset_cache(pytestconfig: pytest.Config) -> Generator[Optional[Dict[str, Callable]], None, None]:
+    """Create the shared static asset cache when enabled."""
+    if not pytestconfig.getoption("asset_cache"):
+        yield None
+        return
+    settings = get_asset_cache_settings()
+    cache = create_asset_cache(
+        max_bytes=settings["max_bytes"],
+        ttl=settings["ttl"],
+        disk_dir=settings["disk_dir"]
+    )
+    yield cache
+    pytestconfig.stash[ASSET_CACHE_STATS_KEY] = cache["get_stats"]()
+
+@pytest.fixture(scope="session")
+def storage_state_manager() -> Dict[str, Callable]:
+    """Load, validate and regenerate saved storage states once per session."""
+    return create_storage_state_manager()
+
 @pytest.fixture
-def context(browser: Browser, browser_context_args: Dict[str, Any]) -> Generator[BrowserContext, None, None]:
-    """Create browser context."""
-    context = browser.new_context(**browser_context_args)
-    yield context
-    context.close()
+def context(
+    browser: Browser,
+    browser_context_args: Dict[str, Any],
+    context_pool: Optional[Dict[str, Callable]],
+    storage_state_manager: Dict[str, Callable],
+    asset_cache: Optional[Dict[str, Callable]],
+    request: pytest.FixtureRequest
+) -> Generator[BrowserContext, None, None]:
+    """Create browser context, leased from the pool in pooled mode.
+
+    Tests marked with @pytest.mark.identity("name") start with that identity's
+    saved storage state instead of repeating its login or consent flow.
+    Static assets go through the shared asset cache when it is enabled,
+    unless the test is marked with @pytest.mark.no_asset_cache. Requests are
+    blocked by --resource-policy or @pytest.mark.resource_policy("name").
+    Tests marked with @pytest.mark.clean_storage never get a pooled context.
+    Traces and videos are recorded as the run profile's --tracing and --video say.
+    """
+    use_cache = asset_cache is not None and not request.node.get_closest_marker("no_asset_cache")
+    if request.node.get_closest_marker("clean_storage"):
+        # The reset cannot reach storage of origins the previous test navigated away from
+        context_pool = None
+    policy_marker = request.node.get_closest_marker("resource_policy")
+    policy_name = policy_marker.args[0] if policy_marker else request.config.getoption("resource_policy")
+    blocker = create_resource_blocker(get_resource_policy(policy_name))
+    marker = request.node.get_closest_marker("identity")
+    if request.node.get_closest_marker("har") and request.config.getoption("har_mode") == "replay":
+        # The recorded traffic already carries the identity, and regenerating it needs the network
+        marker = None
+    identity = marker.args[0] if marker and marker.args else DEFAULT_IDENTITY
+    context_args = browser_context_args
+    if request.config.getoption("video") != "off":
+        output_dir = request.config.getoption("output")
+        context_args = {**context_args, "record_video_dir": os.path.join(output_dir, ".videos")}
+    if marker and context_pool is None:
+        state = storage_state_manager["get_state"](browser, identity)
+        if state is not None:
+            context_args = {**context_args, "storage_state": state}
+
+    with open_context(context_pool, browser, context_args) as context:
+        if marker and context_pool is not None:
+            # Pooled contexts already exist, so only the cookies can be injected
+            storage_state_manager["inject"](context, browser, identity)
+        if use_cache:
+            asset_cache["attach"](context)
+        # Attached last so it runs first; allowed requests fall back to the cache
+        blocker["attach"](context)
+        tracing = request.config.getoption("tracing")
+        if tracing != "off":
+            start_tracing(context, request.node.nodeid)
+        yield context
+        if blocker["is_active"]():
+            blocker["detach"](context)
+            merge_blocker_stats(run_state["resource_blocking"], blocker["get_stats"]())
+        if tracing != "off":
+            keep = should_keep(tracing, is_test_failed(request.node))
+            output_dir = request.config.getoption("output")
+            stop_tracing(context, get_artifact_path(output_dir, request.node.nodeid, "trace.zip") if keep else None)
 
 @pytest.fixture
-def page(context: BrowserContext) -> Generator[Page, None, None]:
-    """Create page instance."""
+def page(context: BrowserContext, request: pytest.FixtureRequest) -> Generator[Page, None, None]:
+    """Create page instance, keeping its screenshot, video and trace buffer as the run profile says."""
     page = context.new_page()
+    trace_buffer = None
+    if request.config.getoption("trace_buffer"):
+        trace_buffer = create_trace_buffer(page)
+        trace_buffer["start"]()
+        run_state["trace_buffer"]["tests"] += 1
     yield page
+    failed = is_test_failed(request.node)
+    output_dir = request.config.getoption("output")
+    if trace_buffer is not None and failed:
+        artifact_dir = os.path.dirname(get_artifact_path(output_dir, request.node.nodeid, "trace-buffer.json"))
+        written = trace_buffer["persist"](artifact_dir, "trace-buffer")
+        run_state["trace_buffer"]["persisted"] += 1
+        run_state["trace_buffer"]["bytes"] += written["bytes"]
+    if should_keep(request.config.getoption("screenshot"), failed):
+        capture_screenshot(page, get_artifact_path(output_dir, request.node.nodeid, "screenshot.png"))
     page.close()
+    keep_video = should_keep(request.config.getoption("video"), failed)
+    finish_video(page, get_artifact_path(output_dir, request.node.nodeid, "video.webm") if keep_video else None)
+
+@pytest.fixture
+def network_capture(page: Page) -> Generator[Callable[..., Dict[str, Callable]], None, None]:
+    """Start filtered response captures on the page: network_capture(url_pattern, resource_types=..., ...).
+
+    Every capture is detached at teardown.
+    """
+    captures = []
+
+    def start_capture(*args: Any, **kwargs: Any) -> Dict[str, Callable]:
+        capture = create_network_capture(page, *args, **kwargs)
+        capture["start"]()
+        captures.append(capture)
+        return capture
+
+    yield start_capture
+    for capture in captures:
+        capture["stop"]()
+
+@pytest.fixture(scope="session")
+def mock_pages() -> Dict[str, Callable]:
+    """Registry of mock pages, read once per session and served from memory under MOCK_ORIGIN."""
+    return create_mock_registry(get_mock_origin())
+
+@pytest.fixture
+def wsgi_transport(context: BrowserContext) -> Generator[Dict[str, Any], None, None]:
+    """Route the WSGI origin of this context straight into app.py, without a socket.
+
+    Open pages under wsgi_transport["base_url"] instead of BASE_URL.
+    """
+    transport = create_wsgi_transport(test_app, get_wsgi_origin())
+    transport["attach"](context)
+    yield transport
+    transport["detach"](context)
+    for name, value in transport["get_stats"]().items():
+        run_state["wsgi_transport"][name] += value
+
+@pytest.fixture
+def assert_visual(browser_name: str, request: pytest.FixtureRequest) -> Callable[..., Dict[str, Any]]:
+    """Compare a page screenshot with its baseline: assert_visual(page, name, device=None, ...)."""
+    settings = get_visual_settings()
+    output_dir = request.config.getoption("output")
+    return create_visual_asserter(
+        baseline_dir=settings['baseline_dir'],
+        browser_name=browser_name,
+        artifact_dir=os.path.dirname(get_artifact_path(output_dir, request.node.nodeid, "visual")),
+        update=request.config.getoption("update_baselines"),
+        threshold=settings['threshold'],
+        max_diff_ratio=settings['max_diff_ratio']
+    )
+
+@pytest.fixture(scope="session")
+def har_mode(pytestconfig: pytest.Config) -> str:
+    """HAR mode of this run: off, record or replay."""
+    return pytestconfig.getoption("har_mode")
+
+@pytest.fixture(autouse=True)
+def har_replay(har_mode: str, request: pytest.FixtureRequest) -> Generator[None, None, None]:
+    """Record or replay the page traffic of tests marked with @pytest.mark.har.
+
+    The marker takes the archive group (default: the test module name) and an
+    optional match="strict"|"lenient" overriding --har-match. Archives live in
+    tests/har/<group>/<test name>.json.gz; replayed tests without one are
+    skipped at collection.
+    """
+    marker = request.node.get_closest_marker("har")
+    if marker is None or har_mode == "off":
+        yield
+        return
+    path = get_har_archive(request.node)
+
+    page = request.getfixturevalue("page")
+    if har_mode == "record":
+        recorder = create_recorder(page)
+        recorder["start"]()
+        yield
+        recorder["stop"]()
+        recorder["save"](path)
+        return
+
+    match = marker.kwargs.get("match", request.config.getoption("har_match"))
+    replayer = create_replayer(page, load_archive(path), strict=match == "strict")
+    replayer["start"]()
+    yield
+    replayer["stop"]()
+    unmatched = replayer["get_unmatched"]()
+    if unmatched:
+        logger.warning(f"{len(unmatched)} requests had no recorded response in {path}")
+        run_state["har_unmatched"][request.node.nodeid] = unmatched
+
+@pytest.fixture(scope="session")
+def async_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+    """Event loop for the async API, running in its own thread."""
+    loop, thread = start_event_loop()
+    yield loop
+    stop_event_loop(loop, thread)
+
+@pytest.fixture(scope="session")
+def async_browser(
+    async_loop: asyncio.AbstractEventLoop,
+    browser_name: str,
+    browser_type_launch_args: Dict[str, Any]
+) -> Generator[AsyncBrowser, None, None]:
+    """Create an async browser instance shared by async tests."""
+    manager = launch_browser(browser_name, **browser_type_launch_args)
+    browser = run_on_loop(async_loop, manager.__aenter__())
+    yield browser
+    run_on_loop(async_loop, manager.__aexit__(None, None, None))
+
+@pytest.fixture
+def async_page(
+    async_loop: asyncio.AbstractEventLoop,
+    async_browser: AsyncBrowser,
+    browser_context_args: Dict[str, Any]
+) -> Generator[AsyncPage, None, None]:
+    """Create an async page in a fresh context.
+
+    Async tests taking only this fixture can also be run concurrently with
+    python -m utils.async_runner.
+    """
+    manager = open_page(async_browser, browser_context_args)
+    page = run_on_loop(async_loop, manager.__aenter__())
+    yield page
+    run_on_loop(async_loop, manager.__aexit__(None, None, None))
 
 # Import step definitions
 from tests.features.steps.search_steps import (  # noqa: E402
@@ -0,0 +1,46 @@
+from typing import Optional, Dict, Callable
+from playwright.async_api import Page, Locator
+
+def async_base_page(page: Page) -> Dict[str, Callable]:
+    """Base page object for pages driven through playwright.async_api.
+
+    Mirrors base_page; every action is a coroutine function.
+    """
+
+    async def wait_for_element(selector: str, timeout: Optional[float] = None) -> Locator:
+        """Wait for element to be visible."""
+        element = page.locator(selector)
+        await element.wait_for(timeout=timeout)
+        return element
+
+    async def get_element_text(selector: str) -> str:
+        """Get text content of element."""
+        element = page.locator(selector)
+        return await element.text_content() or ""
+
+    async def click_element(selector: str) -> None:
+        """Click element with retry logic."""
+        element = page.locator(selector)
+        try:
+            await element.click()
+        except Exception:
+            # Retry with force if initial click fails
+            await element.click(force=True)
+
+    async def fill_input(selector: str, value: str) -> None:
+        """Fill input field with value."""
+        element = page.locator(selector)
+        await element.fill(value)
+
+    async def is_element_visible(selector: str) -> bool:
+        """Check if element is visible."""
+        element = page.locator(selector)
+        return await element.is_visible()
+
+    return {
+        "wait_for_element": wait_for_element,
+        "get_element_text": get_element_text,
+        "click_element": click_element,
+        "fill_input": fill_input,
+        "is_element_visible": is_element_visible
+    }
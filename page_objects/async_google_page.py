@@ -0,0 +1,149 @@
+from typing import Dict, Any, Callable, Optional
+from playwright.async_api import Page, Locator
+import asyncio
+import random
+import logging
+from page_objects.captcha_detector import detect_captcha_async
+from page_objects.consent_resolver import resolve_consent_dialog_async
+from page_objects.google_page import CONSENT_SELECTORS, RESULTS_SELECTOR
+
+logger = logging.getLogger(__name__)
+
+RESULT_TITLES_SELECTOR = 'xpath=//h3[contains(@class, "r") or contains(@class, "LC20lb") or @role="heading"]'
+
+def async_fast_pacing() -> Dict[str, Any]:
+    """
+    Returns the async counterpart of fast_pacing: no pauses and a single fill.
+    """
+
+    async def pause() -> None:
+        """No artificial delay."""
+
+    async def approach(locator: Locator) -> None:
+        """No pointer movement needed before acting."""
+
+    async def type_text(locator: Locator, text: str) -> None:
+        """Fills the whole text at once."""
+        await locator.fill(text)
+
+    return {
+        "name": "fast",
+        "pause": pause,
+        "approach": approach,
+        "type_text": type_text
+    }
+
+def async_human_pacing() -> Dict[str, Any]:
+    """
+    Returns the async counterpart of human_pacing.
+
+    Pauses use asyncio.sleep, so other pages on the same event loop keep
+    running while this one waits.
+    """
+
+    async def pause() -> None:
+        """Adds a small random delay to simulate human behavior."""
+        await asyncio.sleep(random.uniform(0.5, 1.5))
+
+    async def approach(locator: Locator) -> None:
+        """Moves the mouse to the element naturally."""
+        await locator.hover()
+        await pause()
+
+    async def type_text(locator: Locator, text: str) -> None:
+        """Types text with human-like delays between characters."""
+        await locator.click()
+        for char in text:
+            await locator.type(char, delay=random.uniform(50, 150))
+            await asyncio.sleep(random.uniform(0.1, 0.3))
+
+    return {
+        "name": "human",
+        "pause": pause,
+        "approach": approach,
+        "type_text": type_text
+    }
+
+def get_async_google_page_actions(page: Page, pacing: Optional[Dict[str, Any]] = None) -> Dict[str, Callable]:
+    """
+    Returns a dictionary of coroutine actions for the Google search page.
+
+    Args:
+        page: Async page object
+        pacing: Pacing strategy from async_fast_pacing() or async_human_pacing(), fast by default
+
+    Returns:
+        Dict of async action functions mirroring get_google_page_actions
+    """
+    pacing = pacing or async_fast_pacing()
+
+    async def get_captcha_verdict() -> Dict[str, Any]:
+        """Returns which CAPTCHA signal fired, checked in one round-trip."""
+        return await detect_captcha_async(page)
+
+    async def is_captcha_present() -> bool:
+        """Checks if we're on a CAPTCHA page."""
+        return (await get_captcha_verdict())["detected"]
+
+    async def handle_consent_dialog() -> None:
+        """Handles the initial Google consent dialog."""
+        try:
+            await pacing["pause"]()
+            await resolve_consent_dialog_async(page, CONSENT_SELECTORS, approach=pacing["approach"])
+        except Exception as e:
+            # Log error but don't fail - dialog might not be present
+            logger.warning(f"Failed to handle consent dialog: {str(e)}")
+
+    async def perform_search(search_term: str) -> None:
+        """Performs a search on Google and waits for results."""
+        try:
+            await handle_consent_dialog()
+
+            verdict = await get_captcha_verdict()
+            if verdict["detected"]:
+                raise Exception(
+                    f"CAPTCHA detected before search ({verdict['signal']}: {verdict['marker']}) "
+                    "- manual intervention needed"
+                )
+
+            search_input = page.locator('textarea[name="q"]')
+            await search_input.wait_for(state="visible", timeout=5000)
+
+            await pacing["approach"](search_input)
+            await pacing["type_text"](search_input, search_term)
+            await pacing["pause"]()
+            await search_input.press("Enter")
+
+            await page.wait_for_url(
+                lambda url: "/search" in url or "sorry/index" in url,
+                wait_until="domcontentloaded",
+                timeout=10000
+            )
+
+            verdict = await get_captcha_verdict()
+            if verdict["detected"]:
+                raise Exception(
+                    f"CAPTCHA detected after search ({verdict['signal']}: {verdict['marker']}) "
+                    "- manual intervention needed"
+                )
+
+            await page.wait_for_selector(RESULTS_SELECTOR, timeout=10000)
+
+        except Exception as e:
+            raise Exception(f"Failed to perform Google search: {str(e)}")
+
+    async def get_search_results() -> list[str]:
+        """Returns list of search result titles."""
+        try:
+            titles = await page.locator(RESULT_TITLES_SELECTOR).all_inner_texts()
+            return [title for title in titles if title]
+        except Exception as e:
+            raise Exception(f"Failed to get search results: {str(e)}")
+
+    return {
+        "perform_search": perform_search,
+        "get_search_results": get_search_results,
+        "handle_consent_dialog": handle_consent_dialog,
+        "is_captcha_present": is_captcha_present,
+        "get_captcha_verdict": get_captcha_verdict
+    }
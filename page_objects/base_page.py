@@ -1,43 +1,140 @@
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List
+from types import SimpleNamespace
+from weakref import WeakKeyDictionary
 from playwright.sync_api import Page, Locator
 
+# Fills plain text fields in one round trip. Fields the script cannot fill
+# like a user would (missing, ambiguous, hidden, disabled, read-only or not a
+# text input) are returned so they can go through locator.fill instead, as are
+# Playwright-only selectors (text=, role=, xpath=, chains) that are not CSS.
+FILL_FORM_SCRIPT = """fields => {
+    const textTypes = ["text", "email", "password", "search", "tel", "url"];
+    const skipped = [];
+    for (const [selector, value] of fields) {
+        let matches;
+        try {
+            matches = document.querySelectorAll(selector);
+        } catch (error) {
+            skipped.push(selector);
+            continue;
+        }
+        const element = matches.length === 1 ? matches[0] : null;
+        const fillable = element && !element.disabled && !element.readOnly
+            && element.getClientRects().length > 0
+            && (element.tagName === "TEXTAREA"
+                || (element.tagName === "INPUT" && textTypes.includes(element.type)));
+        if (!fillable) {
+            skipped.push(selector);
+            continue;
+        }
+        // The prototype setter keeps frameworks that track the value property in sync
+        const prototype = element.tagName === "TEXTAREA" ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        element.focus();
+        Object.getOwnPropertyDescriptor(prototype, "value").set.call(element, value);
+        element.dispatchEvent(new Event("input", { bubbles: true }));
+        element.dispatchEvent(new Event("change", { bubbles: true }));
+    }
+    return skipped;
+}"""
+
+# Actions and locators per page, shared by every base_page(page) call
+_page_states: "WeakKeyDictionary[Page, Dict[str, Any]]" = WeakKeyDictionary()
+
+def get_page_state(page: Page) -> Dict[str, Any]:
+    """Get the page's cached actions and locators.
+
+    The locator cache is cleared whenever the main frame navigates, and the
+    whole state is dropped when the page closes (the cached closures refer
+    to the page, so the weak key alone would never be released).
+    """
+    state = _page_states.get(page)
+    if state is None:
+        state = _page_states[page] = {"locators": {}}
+
+        def on_navigation(frame: Any) -> None:
+            if frame == page.main_frame:
+                state["locators"].clear()
+
+        page.on("framenavigated", on_navigation)
+        page.on("close", lambda closed_page: _page_states.pop(page, None))
+    return state
+
+def page_elements(page: Page, selectors: Dict[str, str]) -> SimpleNamespace:
+    """Expose named selectors as locator attributes: page_elements(page, {"email": ".email-input"}).email.
+
+    Locators resolve lazily on every action, so the namespace stays usable
+    after a navigation; it only saves rebuilding the locator objects.
+    """
+    actions = base_page(page)
+    return SimpleNamespace(**{name: actions["locate"](selector) for name, selector in selectors.items()})
+
 def base_page(page: Page) -> Dict[str, Callable]:
-    """Base page object with common functionality."""
-    
+    """Base page object with common functionality.
+
+    The actions are built once per page and locators are cached per selector,
+    so calling base_page(page) again, or acting on the same selector
+    repeatedly, costs a dictionary lookup.
+    """
+    state = get_page_state(page)
+    if "actions" in state:
+        return state["actions"]
+    locators = state["locators"]
+
+    def locate(selector: str) -> Locator:
+        """Get the cached locator for a selector."""
+        element = locators.get(selector)
+        if element is None:
+            element = locators[selector] = page.locator(selector)
+        return element
+
     def wait_for_element(selector: str, timeout: Optional[float] = None) -> Locator:
         """Wait for element to be visible."""
-        element = page.locator(selector)
+        element = locate(selector)
         element.wait_for(timeout=timeout)
         return element
-    
+
     def get_element_text(selector: str) -> str:
         """Get text content of element."""
-        element = page.locator(selector)
+        element = locate(selector)
         return element.text_content() or ""
-    
+
     def click_element(selector: str) -> None:
         """Click element with retry logic."""
+        element = locate(selector)
         try:
-            element = page.locator(selector)
             element.click()
         except Exception as e:
             # Retry with force if initial click fails
             element.click(force=True)
-            
+
     def fill_input(selector: str, value: str) -> None:
         """Fill input field with value."""
-        element = page.locator(selector)
+        element = locate(selector)
         element.fill(value)
-        
+
+    def fill_form(fields: Dict[str, str]) -> List[str]:
+        """Fill several text fields in one in-page operation.
+
+        Fields that are not plain, visible, editable text inputs fall back to
+        fill_input. Returns the selectors that took the fallback.
+        """
+        skipped = page.evaluate(FILL_FORM_SCRIPT, list(fields.items()))
+        for selector in skipped:
+            fill_input(selector, fields[selector])
+        return skipped
+
     def is_element_visible(selector: str) -> bool:
         """Check if element is visible."""
-        element = page.locator(selector)
+        element = locate(selector)
         return element.is_visible()
-    
-    return {
+
+    state["actions"] = {
+        "locate": locate,
         "wait_for_element": wait_for_element,
         "get_element_text": get_element_text,
         "click_element": click_element,
         "fill_input": fill_input,
+        "fill_form": fill_form,
         "is_element_visible": is_element_visible
     }
+    return state["actions"]
@@ -0,0 +1,110 @@
+from typing import Dict, Any, List, Optional
+from functools import lru_cache
+import json
+import os
+from playwright.sync_api import Page, Error as PlaywrightError
+from playwright.async_api import Page as AsyncPage
+from config.test_config import get_captcha_markers_path
+
+# Evaluates every marker inside the page and reports the first signal that fires
+DETECT_CAPTCHA_SCRIPT = """markers => {
+    const verdict = (signal, marker, locale) => ({ detected: true, signal, marker, locale });
+    const url = window.location.href;
+    for (const marker of markers.url_markers) {
+        if (url.includes(marker)) return verdict("url", marker, null);
+    }
+    for (const selector of markers.iframe_selectors) {
+        if (document.querySelector(selector)) return verdict("iframe", selector, null);
+    }
+    const text = document.body ? document.body.innerText : "";
+    for (const [locale, localeMarkers] of Object.entries(markers.text_markers)) {
+        for (const marker of localeMarkers) {
+            if (text.includes(marker)) return verdict("text", marker, locale);
+        }
+    }
+    return { detected: false, signal: null, marker: null, locale: null };
+}"""
+
+NO_CAPTCHA = {"detected": False, "signal": None, "marker": None, "locale": None}
+
+BUNDLED_MARKERS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "captcha_markers.json")
+
+def read_marker_file(path: str) -> Dict[str, Any]:
+    """Read one marker file, rejecting locales whose markers are not a list of strings."""
+    with open(path, "r", encoding="utf-8") as f:
+        markers = json.load(f)
+    for locale, locale_markers in markers.get("text_markers", {}).items():
+        if not isinstance(locale_markers, list) or not all(isinstance(marker, str) and marker for marker in locale_markers):
+            raise ValueError(f"CAPTCHA text markers for locale {locale!r} in {path} must be a list of non-empty strings")
+    return markers
+
+def merge_unique(*lists: List[str]) -> List[str]:
+    """Concatenate marker lists, keeping the first occurrence of each marker."""
+    return list(dict.fromkeys(marker for markers in lists for marker in markers))
+
+@lru_cache(maxsize=None)
+def load_captcha_markers(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Loads CAPTCHA markers from config/captcha_markers.json and an optional extra file.
+    
+    The extra file extends the bundled markers: its URL markers and iframe
+    selectors are added, and its "text_markers" are merged locale by locale,
+    so a file with only {"text_markers": {"it": [...]}} adds Italian while
+    keeping every bundled locale.
+    
+    Args:
+        path: Extra marker file, defaults to CAPTCHA_MARKERS_PATH when set
+        
+    Returns:
+        Dict with url_markers, iframe_selectors and text_markers by locale
+        
+    Raises:
+        ValueError: When a locale's markers are not a list of non-empty strings
+    """
+    sources = [read_marker_file(BUNDLED_MARKERS_PATH)]
+    path = path or get_captcha_markers_path()
+    if os.path.abspath(path) != BUNDLED_MARKERS_PATH:
+        sources.append(read_marker_file(path))
+    text_markers: Dict[str, List[str]] = {}
+    for source in sources:
+        for locale, locale_markers in source.get("text_markers", {}).items():
+            text_markers[locale] = merge_unique(text_markers.get(locale, []), locale_markers)
+    return {
+        "url_markers": merge_unique(*(source.get("url_markers", []) for source in sources)),
+        "iframe_selectors": merge_unique(*(source.get("iframe_selectors", []) for source in sources)),
+        "text_markers": text_markers
+    }
+
+def detect_captcha(page: Page, markers: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Checks every CAPTCHA signal in a single in-page evaluation.
+    
+    Args:
+        page: Page object
+        markers: Markers from load_captcha_markers(), loaded from the data file by default
+        
+    Returns:
+        Verdict with detected flag, the signal that fired (url, iframe or text),
+        the matching marker and its locale for text markers
+    """
+    try:
+        return page.evaluate(DETECT_CAPTCHA_SCRIPT, markers or load_captcha_markers())
+    except PlaywrightError:
+        # Page is navigating or closed; assume no CAPTCHA to avoid false positives
+        return dict(NO_CAPTCHA)
+
+async def detect_captcha_async(page: AsyncPage, markers: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Async variant of detect_captcha for pages driven through playwright.async_api.
+    
+    Args:
+        page: Async page object
+        markers: Markers from load_captcha_markers(), loaded from the data file by default
+        
+    Returns:
+        Verdict in the same shape as detect_captcha
+    """
+    try:
+        return await page.evaluate(DETECT_CAPTCHA_SCRIPT, markers or load_captcha_markers())
+    except PlaywrightError:
+        return dict(NO_CAPTCHA)
@@ -0,0 +1,191 @@
+from typing import Awaitable, Dict, Callable, List, Optional
+from urllib.parse import urlparse
+from playwright.sync_api import Page, Locator, TimeoutError
+from playwright.async_api import Page as AsyncPage, Locator as AsyncLocator
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+CONSENT_FRAME_SELECTOR = 'iframe[src*="consent.google.com"]'
+IS_FRAME_SCRIPT = "element => element.tagName === 'IFRAME'"
+
+DEFAULT_CONSENT_SELECTORS = [
+    'button:has-text("Accept all")',
+    'button:has-text("Aceptar todo")',
+    'button:has-text("I agree")',
+    'button:has-text("Acepto")',
+    'div[role="dialog"] button:has-text("Accept")',
+    'div[role="dialog"] button:has-text("Aceptar")'
+]
+
+# Probe for any consent button once the DOM is loaded. The dialog is part of
+# the served page, so a page without one should not wait long; callers that
+# expect a dialog (e.g. when generating a consent storage state) pass
+# EXPECTED_CONSENT_TIMEOUT or their own timeout.
+DEFAULT_CONSENT_TIMEOUT = 400
+EXPECTED_CONSENT_TIMEOUT = 5000
+
+# Deadline for finding the button inside the consent iframe and for the
+# dialog to close once a dialog has been seen
+CONSENT_ACTION_TIMEOUT = 3000
+
+# Origins and storage states known to show no consent dialog
+_consent_verdicts: Dict[str, str] = {}
+
+def build_consent_cache_key(url: str, cookies: List[Dict]) -> str:
+    """Builds the cache key from a page URL and the cookies sent to it."""
+    parsed = urlparse(url)
+    cookie_names = sorted({cookie["name"] for cookie in cookies})
+    return f"{parsed.scheme}://{parsed.netloc}|{','.join(cookie_names)}"
+
+def get_consent_cache_key(page: Page) -> str:
+    """
+    Builds the cache key for the current origin and storage state.
+
+    The storage state is fingerprinted by the names of the cookies sent to the
+    page, so accepting consent (which sets a consent cookie) yields a new key.
+    """
+    return build_consent_cache_key(page.url, page.context.cookies(page.url))
+
+def combine_consent_candidates(page: Page, selectors: List[str]) -> Locator:
+    """Combines the candidate buttons into one locator matching the first visible one."""
+    candidates = [page.locator(f"{selector} >> visible=true") for selector in selectors]
+    combined = candidates[0]
+    for candidate in candidates[1:]:
+        combined = combined.or_(candidate)
+    return combined
+
+def build_consent_locator(page: Page, selectors: List[str]) -> Locator:
+    """
+    Races every candidate button on the page and the consent iframe itself
+    in one locator that resolves to the first visible match.
+
+    Frame locators are not allowed inside composite locators, so the iframe
+    stands in for the buttons inside it; build_frame_consent_locator finds those.
+    """
+    frame = page.locator(f"{CONSENT_FRAME_SELECTOR} >> visible=true")
+    return combine_consent_candidates(page, selectors).or_(frame).first
+
+def build_frame_consent_locator(page: Page, selectors: List[str]) -> Locator:
+    """Combines the candidate buttons inside the consent iframe into one locator."""
+    return page.frame_locator(CONSENT_FRAME_SELECTOR).locator(combine_consent_candidates(page, selectors)).first
+
+def get_remaining_timeout(deadline: float) -> float:
+    """Milliseconds left until a monotonic deadline, at least 1."""
+    return max((deadline - time.monotonic()) * 1000, 1)
+
+def resolve_consent_dialog(
+    page: Page,
+    selectors: Optional[List[str]] = None,
+    timeout: float = DEFAULT_CONSENT_TIMEOUT,
+    approach: Optional[Callable[[Locator], None]] = None
+) -> str:
+    """
+    Waits on all consent buttons at once and clicks whichever appears first.
+
+    The wait starts once the DOM is loaded and gives up after a short probe
+    by default; pass a longer timeout when a dialog is expected.
+
+    Args:
+        page: Page object
+        selectors: Candidate button selectors, checked on the page and in the consent iframe
+        timeout: Milliseconds for any button or the consent iframe to appear
+        approach: Optional pacing hook called before clicking (e.g. hover)
+
+    Returns:
+        "accepted" if a button was clicked, "absent" if none appeared,
+        "cached" if this origin and storage state is known to have no dialog
+    """
+    key = get_consent_cache_key(page)
+    if _consent_verdicts.get(key) == "absent":
+        return "cached"
+
+    selectors = selectors or DEFAULT_CONSENT_SELECTORS
+    page.wait_for_load_state("domcontentloaded")
+    button = build_consent_locator(page, selectors)
+    try:
+        button.wait_for(state="visible", timeout=timeout)
+    except TimeoutError:
+        _consent_verdicts[key] = "absent"
+        return "absent"
+
+    # A dialog is showing; finding its button and closing it share one deadline
+    deadline = time.monotonic() + CONSENT_ACTION_TIMEOUT / 1000
+    if button.evaluate(IS_FRAME_SCRIPT):
+        # The consent iframe won the race; look for its button inside it
+        button = build_frame_consent_locator(page, selectors)
+        try:
+            button.wait_for(state="visible", timeout=get_remaining_timeout(deadline))
+        except TimeoutError:
+            logger.warning("Consent iframe shown without a known consent button")
+            return "absent"
+
+    if approach:
+        approach(button)
+    button.click()
+    try:
+        button.wait_for(state="hidden", timeout=get_remaining_timeout(deadline))
+    except TimeoutError:
+        logger.warning("Consent dialog still visible after clicking the consent button")
+        return "accepted"
+
+    # The accepted storage state will not show the dialog again
+    _consent_verdicts[get_consent_cache_key(page)] = "absent"
+    return "accepted"
+
+async def resolve_consent_dialog_async(
+    page: AsyncPage,
+    selectors: Optional[List[str]] = None,
+    timeout: float = DEFAULT_CONSENT_TIMEOUT,
+    approach: Optional[Callable[[AsyncLocator], Awaitable[None]]] = None
+) -> str:
+    """
+    Async variant of resolve_consent_dialog sharing its verdict cache.
+
+    Args:
+        page: Async page object
+        selectors: Candidate button selectors, checked on the page and in the consent iframe
+        timeout: Milliseconds for any button or the consent iframe to appear
+        approach: Optional async pacing hook awaited before clicking
+
+    Returns:
+        "accepted", "absent" or "cached" as for resolve_consent_dialog
+    """
+    key = build_consent_cache_key(page.url, await page.context.cookies(page.url))
+    if _consent_verdicts.get(key) == "absent":
+        return "cached"
+
+    selectors = selectors or DEFAULT_CONSENT_SELECTORS
+    await page.wait_for_load_state("domcontentloaded")
+    button = build_consent_locator(page, selectors)
+    try:
+        await button.wait_for(state="visible", timeout=timeout)
+    except TimeoutError:
+        _consent_verdicts[key] = "absent"
+        return "absent"
+
+    deadline = time.monotonic() + CONSENT_ACTION_TIMEOUT / 1000
+    if await button.evaluate(IS_FRAME_SCRIPT):
+        button = build_frame_consent_locator(page, selectors)
+        try:
+            await button.wait_for(state="visible", timeout=get_remaining_timeout(deadline))
+        except TimeoutError:
+            logger.warning("Consent iframe shown without a known consent button")
+            return "absent"
+
+    if approach:
+        await approach(button)
+    await button.click()
+    try:
+        await button.wait_for(state="hidden", timeout=get_remaining_timeout(deadline))
+    except TimeoutError:
+        logger.warning("Consent dialog still visible after clicking the consent button")
+        return "accepted"
+
+    _consent_verdicts[build_consent_cache_key(page.url, await page.context.cookies(page.url))] = "absent"
+    return "accepted"
+
+def clear_consent_cache() -> None:
+    """Forgets all cached consent verdicts."""
+    _consent_verdicts.clear()
@@ -1,79 +1,106 @@
-from typing import Dict, Any, Callable
-from playwright.sync_api import Page, expect, TimeoutError
+from typing import Dict, Any, Callable, Optional
+from playwright.sync_api import Page, Locator, expect
 import time
 import random
+import logging
+from page_objects.captcha_detector import detect_captcha
+from page_objects.consent_resolver import resolve_consent_dialog
 
-def get_google_page_actions(page: Page) -> Dict[str, Callable]:
+logger = logging.getLogger(__name__)
+
+CONSENT_SELECTORS = [
+    f'button:text-is("{text}")'
+    for text in ["Aceptar todo", "Accept all", "Rechazar todo", "Reject all"]
+]
+
+RESULTS_SELECTOR = 'xpath=//div[@id="search"] | //div[@id="main"] | //div[@id="rso"]'
+
+def fast_pacing() -> Dict[str, Any]:
+    """
+    Returns a pacing strategy that acts as soon as the page is ready.
+    
+    Text is entered with a single fill and no artificial pauses are added;
+    the page actions rely on Playwright's event-based waits instead.
+    """
+    
+    def pause() -> None:
+        """No artificial delay."""
+    
+    def approach(locator: Locator) -> None:
+        """No pointer movement needed before acting."""
+    
+    def type_text(locator: Locator, text: str) -> None:
+        """Fills the whole text at once."""
+        locator.fill(text)
+    
+    return {
+        "name": "fast",
+        "pause": pause,
+        "approach": approach,
+        "type_text": type_text
+    }
+
+def human_pacing() -> Dict[str, Any]:
+    """
+    Returns a pacing strategy that imitates a person using the page.
+    
+    Opt in to this strategy when talking to sites with bot detection: it moves
+    the pointer before acting, adds random pauses and types character by character.
+    """
+    
+    def pause() -> None:
+        """Adds a small random delay to simulate human behavior."""
+        time.sleep(random.uniform(0.5, 1.5))
+    
+    def approach(locator: Locator) -> None:
+        """Moves the mouse to the element naturally."""
+        locator.hover()
+        pause()
+    
+    def type_text(locator: Locator, text: str) -> None:
+        """Types text with human-like delays between characters."""
+        locator.click()
+        for char in text:
+            locator.type(char, delay=random.uniform(50, 150))
+            time.sleep(random.uniform(0.1, 0.3))
+    
+    return {
+        "name": "human",
+        "pause": pause,
+        "approach": approach,
+        "type_text": type_text
+    }
+
+def get_google_page_actions(page: Page, pacing: Optional[Dict[str, Any]] = None) -> Dict[str, Callable]:
     """
     Returns a dictionary of actions that can be performed on the Google search page.
     
     Args:
         page: Page object
+        pacing: Pacing strategy from fast_pacing() or human_pacing(), fast by default
         
     Returns:
         Dict of action functions for Google page interactions
     """
-    
-    def add_human_delay() -> None:
-        """Adds a small random delay to simulate human behavior."""
-        time.sleep(random.uniform(0.5, 1.5))
+    pacing = pacing or fast_pacing()
+
+    def get_captcha_verdict() -> Dict[str, Any]:
+        """Returns which CAPTCHA signal fired, checked in one round-trip."""
+        return detect_captcha(page)
 
     def is_captcha_present() -> bool:
         """Checks if we're on a CAPTCHA page."""
-        try:
-            return any([
-                "sorry/index" in page.url,
-                page.get_by_text("Our systems have detected unusual traffic").is_visible(timeout=1000),
-                page.get_by_text("Nuestros sistemas han detectado tráfico inusual").is_visible(timeout=1000),
-                # More reliable CAPTCHA detection that handles multiple iframes
-                page.locator("iframe[title*='reCAPTCHA']").count() > 0
-            ])
-        except Exception:
-            # If any check fails, assume no CAPTCHA to avoid false positives
-            return False
+        return get_captcha_verdict()["detected"]
     
     def handle_consent_dialog() -> None:
         """Handles the initial Google consent dialog."""
         try:
-            # Wait for any dialog to appear with random delay
-            add_human_delay()
-            
-            # Try direct button click first (most common case)
-            for text in ["Aceptar todo", "Accept all", "Rechazar todo", "Reject all"]:
-                try:
-                    button = page.get_by_role("button", name=text, exact=True)
-                    if button.is_visible(timeout=1000):
-                        # Move mouse to button naturally
-                        button.hover()
-                        add_human_delay()
-                        button.click()
-                        page.wait_for_load_state("networkidle", timeout=5000)
-                        return
-                except:
-                    continue
-            
-            # If direct button didn't work, try iframe
-            iframe = page.frame_locator('iframe[src*="consent.google.com"]').first
-            if iframe:
-                for text in ["Aceptar todo", "Accept all", "Rechazar todo", "Reject all"]:
-                    try:
-                        button = iframe.get_by_role("button", name=text, exact=True)
-                        if button.is_visible(timeout=1000):
-                            # Move mouse to button naturally
-                            button.hover()
-                            add_human_delay()
-                            button.click()
-                            page.wait_for_load_state("networkidle", timeout=5000)
-                            return
-                    except:
-                        continue
-                        
-        except TimeoutError:
-            # If we timeout, the dialog might not be present, which is fine
-            pass
+            # Give the dialog a moment to appear when pacing like a human
+            pacing["pause"]()
+            resolve_consent_dialog(page, CONSENT_SELECTORS, approach=pacing["approach"])
         except Exception as e:
             # Log error but don't fail - dialog might not be present
-            print(f"Warning: Failed to handle consent dialog: {str(e)}")
+            logger.warning(f"Failed to handle consent dialog: {str(e)}")
 
     def perform_search(search_term: str) -> None:
         """Performs a search on Google and waits for results."""
@@ -82,36 +109,39 @@ def get_google_page_actions(page: Page) -> Dict[str, Callable]:
             handle_consent_dialog()
             
             # Check for CAPTCHA before proceeding
-            if is_captcha_present():
-                raise Exception("CAPTCHA detected before search - manual intervention needed")
+            verdict = get_captcha_verdict()
+            if verdict["detected"]:
+                raise Exception(
+                    f"CAPTCHA detected before search ({verdict['signal']}: {verdict['marker']}) "
+                    "- manual intervention needed"
+                )
             
             # Enter search term and submit
             search_input = page.locator('textarea[name="q"]')
             search_input.wait_for(state="visible", timeout=5000)
             
-            # Move mouse to search box naturally
-            search_input.hover()
-            add_human_delay()
-            search_input.click()
-            
-            # Type search term with human-like delays
-            for char in search_term:
-                search_input.type(char, delay=random.uniform(50, 150))
-                time.sleep(random.uniform(0.1, 0.3))
-            
-            # Add natural delay before pressing Enter
-            add_human_delay()
+            pacing["approach"](search_input)
+            pacing["type_text"](search_input, search_term)
+            pacing["pause"]()
             search_input.press("Enter")
             
-            # Wait for navigation and check for CAPTCHA
-            page.wait_for_load_state("networkidle", timeout=10000)
+            # Wait for the results page (or the CAPTCHA interstitial) to be committed
+            page.wait_for_url(
+                lambda url: "/search" in url or "sorry/index" in url,
+                wait_until="domcontentloaded",
+                timeout=10000
+            )
             
             # Check for CAPTCHA after search
-            if is_captcha_present():
-                raise Exception("CAPTCHA detected after search - manual intervention needed")
+            verdict = get_captcha_verdict()
+            if verdict["detected"]:
+                raise Exception(
+                    f"CAPTCHA detected after search ({verdict['signal']}: {verdict['marker']}) "
+                    "- manual intervention needed"
+                )
             
             # Wait for search results
-            page.wait_for_selector('xpath=//div[@id="search"] | //div[@id="main"] | //div[@id="rso"]', timeout=10000)
+            page.wait_for_selector(RESULTS_SELECTOR, timeout=10000)
             
         except Exception as e:
             raise Exception(f"Failed to perform Google search: {str(e)}")
@@ -129,5 +159,6 @@ def get_google_page_actions(page: Page) -> Dict[str, Callable]:
         "perform_search": perform_search,
         "get_search_results": get_search_results,
         "handle_consent_dialog": handle_consent_dialog,
-        "is_captcha_present": is_captcha_present
+        "is_captcha_present": is_captcha_present,
+        "get_captcha_verdict": get_captcha_verdict
     }
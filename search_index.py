@@ -0,0 +1,141 @@
+"""In-memory inverted index over a seeded document corpus for the test app's search API.
+
+The corpus is generated from a fixed seed, so every run and every worker
+serves the same documents and a query always returns the same results.
+Documents are scored with TF-IDF over the query terms; scoring stops once
+the latency budget is spent and the response is flagged as partial.
+"""
+from typing import Any, Dict, List, Tuple
+from collections import Counter, defaultdict
+import heapq
+import math
+import random
+import re
+import time
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+DEFAULT_PER_PAGE = 10
+MAX_PER_PAGE = 50
+DEFAULT_BUDGET_MS = 50.0
+
+TOPICS = [
+    "test", "testing", "automation", "browser", "mobile", "query", "search", "playwright", "python",
+    "design", "layout", "performance", "accessibility", "api", "contact", "form", "navigation",
+    "responsive", "network", "cache", "screenshot", "visual", "regression", "server", "agency",
+]
+WORDS = [
+    "guide", "notes", "tips", "patterns", "checklist", "overview", "deep", "dive", "practical",
+    "quick", "start", "advanced", "common", "pitfalls", "study", "case", "team", "workflow",
+    "project", "release", "review", "strategy", "tooling", "metrics", "budget", "speed",
+]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case alphanumeric tokens of a text."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def generate_corpus(size: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Generate a deterministic corpus of titled documents with short bodies."""
+    rng = random.Random(seed)
+    documents = []
+    for doc_id in range(1, size + 1):
+        topics = rng.sample(TOPICS, 2)
+        title = f"{topics[0].capitalize()} {rng.choice(WORDS)} for {topics[1]} {rng.choice(WORDS)}"
+        body = " ".join(rng.choice(TOPICS + WORDS) for _ in range(rng.randint(20, 40)))
+        documents.append({
+            "id": doc_id,
+            "title": title,
+            "body": f"{' '.join(topics)} {body}",
+            "url": f"/docs/{doc_id}",
+        })
+    return documents
+
+
+def build_index(documents: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build an inverted index with term frequencies per document.
+
+    Args:
+        documents: Documents with id, title, body and url
+
+    Returns:
+        Dict with postings (term -> [(doc id, weighted tf)]), idf and the documents by id
+    """
+    postings: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+    for document in documents:
+        # Title words count three times as much as body words
+        counts = Counter(tokenize(document["body"]))
+        for token in tokenize(document["title"]):
+            counts[token] += 3
+        length = sum(counts.values())
+        for token, count in counts.items():
+            postings[token].append((document["id"], count / length))
+    total = len(documents)
+    idf = {token: math.log(1 + total / len(entries)) for token, entries in postings.items()}
+    return {
+        "postings": dict(postings),
+        "idf": idf,
+        "documents": {document["id"]: document for document in documents},
+    }
+
+
+def search(
+    index: Dict[str, Any],
+    query: str,
+    page: int = 1,
+    per_page: int = DEFAULT_PER_PAGE,
+    budget_ms: float = DEFAULT_BUDGET_MS
+) -> Dict[str, Any]:
+    """
+    Rank documents for a query and return one page of results.
+
+    Args:
+        index: Index from build_index
+        query: Free-text query; documents matching any term are ranked
+        page: 1-based result page
+        per_page: Results per page, capped at MAX_PER_PAGE
+        budget_ms: Time budget for scoring; rarer terms are scored first
+
+    Returns:
+        Dict with total, page, per_page, results, took_ms and partial
+    """
+    started = time.perf_counter()
+    deadline = started + budget_ms / 1000
+    per_page = max(1, min(per_page, MAX_PER_PAGE))
+    page = max(1, page)
+    terms = [term for term in dict.fromkeys(tokenize(query)) if term in index["postings"]]
+    # Rare terms carry the most weight and have the shortest posting lists
+    terms.sort(key=lambda term: len(index["postings"][term]))
+    scores: Dict[int, float] = defaultdict(float)
+    partial = False
+    for term in terms:
+        if time.perf_counter() > deadline:
+            partial = True
+            break
+        weight = index["idf"][term]
+        for doc_id, tf in index["postings"][term]:
+            scores[doc_id] += tf * weight
+
+    end = page * per_page
+    ranked = heapq.nlargest(end, scores.items(), key=lambda item: (item[1], -item[0]))
+    results = []
+    for doc_id, score in ranked[end - per_page:end]:
+        document = index["documents"][doc_id]
+        results.append({
+            "id": doc_id,
+            "title": document["title"],
+            "snippet": document["body"][:120],
+            "url": document["url"],
+            "score": round(score, 4),
+        })
+    return {
+        "query": query,
+        "total": len(scores),
+        "page": page,
+        "per_page": per_page,
+        "results": results,
+        "took_ms": round((time.perf_counter() - started) * 1000, 3),
+        "partial": partial,
+    }
@@ -0,0 +1,59 @@
+"""Tests for the cached, compressed pages of the Flask test app."""
+import gzip
+from app import CONTACT_MESSAGES, app
+
+def test_index_serves_gzip_with_validators() -> None:
+    """Tests that the index is sent gzipped when accepted, with a per-encoding ETag and Vary."""
+    client = app.test_client()
+
+    plain = client.get("/")
+    compressed = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert plain.status_code == compressed.status_code == 200
+    assert "Content-Encoding" not in plain.headers
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(compressed.data) == plain.data
+    assert b"Let's Talk" in plain.data
+    assert plain.headers["ETag"] != compressed.headers["ETag"]
+    assert compressed.headers["Vary"] == "Accept-Encoding"
+
+def test_matching_etag_gets_not_modified() -> None:
+    """Tests that If-None-Match with the current ETag is answered with an empty 304."""
+    client = app.test_client()
+    etag = client.get("/", headers={"Accept-Encoding": "gzip"}).headers["ETag"]
+
+    cached = client.get("/", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    other_encoding = client.get("/", headers={"If-None-Match": etag})
+
+    assert cached.status_code == 304 and cached.data == b""
+    assert cached.headers["ETag"] == etag
+    assert other_encoding.status_code == 200
+
+def test_search_api_paginates_deterministic_results() -> None:
+    """Tests that search pages do not overlap, cover the ranking in order and reject bad paging."""
+    client = app.test_client()
+
+    first = client.get("/api/search?q=test+query&per_page=5").json
+    second = client.get("/api/search?q=test+query&page=2&per_page=5").json
+    both = client.get("/api/search?q=test+query&per_page=10").json
+
+    assert first["total"] == both["total"] > 10 and not first["partial"]
+    assert [r["id"] for r in first["results"] + second["results"]] == [r["id"] for r in both["results"]]
+    assert client.get("/api/search?q=zzzz").json["results"] == []
+    assert client.get("/api/search?q=test&page=two").status_code == 400
+
+def test_contact_api_validates_and_accepts_messages() -> None:
+    """Tests that invalid submissions list their field errors and valid ones are stored."""
+    client = app.test_client()
+
+    invalid = client.post("/api/contact", json={"name": "", "email": "not-an-email", "message": "Hi"})
+    valid = client.post("/api/contact", json={"name": "Test User", "email": "test@example.com", "message": "Hi"})
+
+    assert invalid.status_code == 400
+    assert set(invalid.json["errors"]) == {"name", "email"}
+    assert valid.status_code == 201
+    assert CONTACT_MESSAGES[-1]["email"] == "test@example.com"
+    assert client.get("/contact").status_code == 200
+    for body in ([], "x", [1]):
+        assert client.post("/api/contact", json=body).status_code == 400
+    assert client.post("/api/contact", data="{", content_type="application/json").status_code == 400
@@ -0,0 +1,113 @@
+"""Tests for the shared static asset cache."""
+from pathlib import Path
+from typing import Dict, Optional
+from unittest.mock import MagicMock
+import pytest
+import utils.asset_cache as asset_cache
+from utils.asset_cache import create_asset_cache
+
+STYLE_URL = "https://example.test/style.css"
+
+def make_route(
+    url: str = STYLE_URL,
+    body: bytes = b"body",
+    response_headers: Optional[Dict[str, str]] = None,
+    method: str = "GET",
+    headers: Optional[Dict[str, str]] = None
+) -> MagicMock:
+    """Build a route for a stylesheet request whose fetch returns the given response."""
+    route = MagicMock()
+    route.request.method = method
+    route.request.url = url
+    route.request.resource_type = "stylesheet"
+    route.request.headers = headers or {"accept": "text/css", "accept-language": "en"}
+    route.fetch.return_value.status = 200
+    route.fetch.return_value.headers = response_headers or {"content-type": "text/css"}
+    route.fetch.return_value.body.return_value = body
+    return route
+
+def request(cache: Dict, **kwargs) -> MagicMock:
+    """Send one request through the cache and return its route."""
+    route = make_route(**kwargs)
+    cache["handle_route"](route)
+    return route
+
+def test_lru_evicts_least_recently_used_by_bytes() -> None:
+    """Tests that the memory budget is enforced in bytes, evicting the least recently used entry."""
+    cache = create_asset_cache(max_bytes=10)
+    for name in ("a", "b"):
+        request(cache, url=f"https://example.test/{name}.css", body=b"1234")
+    request(cache, url="https://example.test/a.css")
+    request(cache, url="https://example.test/c.css", body=b"1234")
+
+    assert not request(cache, url="https://example.test/a.css").fetch.called
+    assert request(cache, url="https://example.test/b.css").fetch.called
+    stats = cache["get_stats"]()
+    assert stats["evicted"] >= 1 and stats["memory_bytes"] <= 10
+
+def test_entries_expire_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that an entry older than the TTL is fetched again."""
+    now = [1000.0]
+    monkeypatch.setattr(asset_cache.time, "time", lambda: now[0])
+    cache = create_asset_cache(ttl=60)
+    request(cache)
+
+    now[0] += 30
+    assert not request(cache).fetch.called
+    now[0] += 31
+    assert request(cache).fetch.called
+    assert cache["get_stats"]()["misses"] == 2
+
+def test_disk_tier_is_promoted_to_memory(tmp_path: Path) -> None:
+    """Tests that a new cache answers from the disk tier once and from memory afterwards."""
+    request(create_asset_cache(disk_dir=str(tmp_path)), body=b"from disk")
+    cache = create_asset_cache(disk_dir=str(tmp_path))
+
+    first, second = request(cache), request(cache)
+
+    assert not first.fetch.called and not second.fetch.called
+    assert first.fulfill.call_args.kwargs["body"] == b"from disk"
+    stats = cache["get_stats"]()
+    assert (stats["disk_hits"], stats["hits"], stats["entries"]) == (1, 1, 1)
+
+def test_lookups_are_keyed_on_accept_headers() -> None:
+    """Tests that another Accept or Accept-Language selects another cache entry."""
+    cache = create_asset_cache()
+    request(cache, headers={"accept": "text/css", "accept-language": "en"})
+
+    assert not request(cache, headers={"accept": "text/css", "accept-language": "en"}).fetch.called
+    assert request(cache, headers={"accept": "text/css", "accept-language": "es"}).fetch.called
+    assert request(cache, headers={"accept": "*/*", "accept-language": "en"}).fetch.called
+
+def test_non_get_requests_fall_back() -> None:
+    """Tests that requests other than GET go to the network untouched."""
+    cache = create_asset_cache()
+    route = request(cache, method="POST")
+
+    route.fallback.assert_called_once()
+    assert not route.fetch.called and not route.fulfill.called
+
+@pytest.mark.parametrize("response_headers", [
+    {"set-cookie": "sid=1"},
+    {"vary": "*"},
+    {"vary": "Accept-Encoding, Cookie"},
+    {"cache-control": "private, max-age=60"},
+])
+def test_session_bound_responses_are_not_stored(response_headers: Dict[str, str]) -> None:
+    """Tests that responses tied to a session are passed through with their headers but never replayed."""
+    cache = create_asset_cache()
+    route = request(cache, response_headers=response_headers)
+
+    assert route.fulfill.call_args.kwargs["headers"] == response_headers
+    assert request(cache, response_headers=response_headers).fetch.called
+    assert cache["get_stats"]()["stored"] == 0
+
+def test_set_cookie_is_never_replayed_from_disk(tmp_path: Path) -> None:
+    """Tests that a Set-Cookie header in an older disk entry is dropped when it is served."""
+    request(create_asset_cache(disk_dir=str(tmp_path)))
+    meta_path = next(tmp_path.glob("*.json"))
+    meta_path.write_text(meta_path.read_text().replace('"headers": {', '"headers": {"set-cookie": "sid=1", '))
+
+    route = request(create_asset_cache(disk_dir=str(tmp_path)))
+
+    assert "set-cookie" not in route.fulfill.call_args.kwargs["headers"]
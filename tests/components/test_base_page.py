@@ -0,0 +1,61 @@
+"""Tests for the cached base page object."""
+from unittest.mock import MagicMock
+from playwright.sync_api import Page, expect
+from page_objects.base_page import base_page, page_elements
+
+def make_page() -> MagicMock:
+    """Build a page that keeps its event handlers so tests can fire them."""
+    page = MagicMock()
+    page.handlers = {}
+    page.on.side_effect = lambda event, handler: page.handlers.setdefault(event, []).append(handler)
+    page.locator.side_effect = lambda selector: MagicMock(name=selector)
+    return page
+
+def test_actions_and_locators_are_cached_until_navigation() -> None:
+    """Tests that base_page and locators are reused per page and rebuilt after a main frame navigation."""
+    page = make_page()
+    actions = base_page(page)
+
+    assert base_page(page) is actions
+    first = actions["locate"](".email-input")
+    assert actions["locate"](".email-input") is first
+    elements = page_elements(page, {"email": ".email-input"})
+    assert elements.email is first
+    assert page.locator.call_count == 1
+
+    page.handlers["framenavigated"][0](MagicMock())
+    assert actions["locate"](".email-input") is first
+    page.handlers["framenavigated"][0](page.main_frame)
+    assert actions["locate"](".email-input") is not first
+
+    page.handlers["close"][0](page)
+    assert base_page(page) is not actions
+
+def test_fill_form_falls_back_for_fields_the_script_skips() -> None:
+    """Tests that one evaluate fills the form and skipped fields go through locator.fill."""
+    page = make_page()
+    page.evaluate.return_value = [".country-select"]
+    actions = base_page(page)
+    fields = {".name-input": "Test User", ".country-select": "NL"}
+
+    skipped = actions["fill_form"](fields)
+
+    assert skipped == [".country-select"]
+    assert page.evaluate.call_args.args[1] == list(fields.items())
+    actions["locate"](".country-select").fill.assert_called_once_with("NL")
+    assert page.locator.call_count == 1
+
+def test_fill_form_falls_back_for_playwright_only_selectors(page: Page) -> None:
+    """Tests that selectors querySelectorAll rejects take the fallback instead of failing the whole form."""
+    page.set_content('''
+        <input class="name-input" type="text">
+        <label>Email <input name="email" type="email"></label>
+    ''')
+    actions = base_page(page)
+    fields = {".name-input": "Test User", "xpath=//input[@name='email']": "test@example.com"}
+
+    skipped = actions["fill_form"](fields)
+
+    assert skipped == ["xpath=//input[@name='email']"]
+    expect(page.locator(".name-input")).to_have_value("Test User")
+    expect(page.locator("input[name=email]")).to_have_value("test@example.com")
@@ -0,0 +1,80 @@
+"""Tests for the browser server state files, lock and lifecycle."""
+from pathlib import Path
+import json
+import os
+import socket
+import time
+import pytest
+import utils.browser_server as browser_server
+
+@pytest.fixture
+def server_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the server state directory at a temporary folder."""
+    monkeypatch.setattr(browser_server, "SERVER_DIR", str(tmp_path))
+    return tmp_path
+
+def write_state(server_dir: Path, name: str, state: dict) -> None:
+    """Write a server state file as start_server would."""
+    (server_dir / f"{name}.json").write_text(json.dumps(state))
+
+def test_acquire_lock_removes_a_stale_lock(server_dir: Path) -> None:
+    """Tests that a lock left behind by a crashed worker is taken over."""
+    lock_path = server_dir / "chromium-headless.lock"
+    lock_path.touch()
+    stale = time.time() - browser_server.LOCK_STALE_AFTER - 1
+    os.utime(lock_path, (stale, stale))
+
+    browser_server.acquire_lock(str(lock_path), timeout=1)
+
+    assert lock_path.exists() and time.time() - lock_path.stat().st_mtime < browser_server.LOCK_STALE_AFTER
+
+def test_acquire_lock_times_out_on_a_held_lock(server_dir: Path) -> None:
+    """Tests that a fresh lock held by another worker is waited on until the timeout."""
+    lock_path = server_dir / "chromium-headless.lock"
+    lock_path.touch()
+
+    with pytest.raises(TimeoutError):
+        browser_server.acquire_lock(str(lock_path), timeout=0.2)
+
+def test_ensure_server_rereads_state_after_the_lock(server_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that a server started by another worker while waiting for the lock is reused."""
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    state = {"pid": os.getpid(), "port": listener.getsockname()[1], "ws_endpoint": "ws://127.0.0.1/x",
+             "browser": "chromium", "headless": True}
+    acquire_lock = browser_server.acquire_lock
+
+    def acquire_after_other_worker(path: str) -> None:
+        write_state(server_dir, "chromium-headless", state)
+        acquire_lock(path)
+
+    monkeypatch.setattr(browser_server, "acquire_lock", acquire_after_other_worker)
+    monkeypatch.setattr(browser_server, "start_server", lambda *args: pytest.fail("started a second server"))
+    try:
+        assert browser_server.ensure_server("chromium", True) == state
+    finally:
+        listener.close()
+    assert not (server_dir / "chromium-headless.lock").exists()
+
+def test_stop_server_with_a_dead_pid(server_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that stopping a server whose process is gone only removes its state file."""
+    write_state(server_dir, "chromium-headless", {"pid": 999999, "port": 1, "ws_endpoint": "ws://x"})
+    monkeypatch.setattr(browser_server, "is_process_alive", lambda pid: False)
+    monkeypatch.setattr(browser_server.os, "killpg", lambda *args: pytest.fail("signalled a dead server"))
+
+    assert browser_server.stop_server("chromium", True) is False
+    assert not (server_dir / "chromium-headless.json").exists()
+
+def test_list_servers_skips_configs_and_half_written_states(server_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that launch configs, logs and unreadable state files are not listed as servers."""
+    write_state(server_dir, "chromium-headless", {"pid": 1, "port": 1, "ws_endpoint": "ws://x",
+                                                  "browser": "chromium", "headless": True})
+    (server_dir / "chromium-headless.config.json").write_text(json.dumps({"headless": True, "port": 0}))
+    (server_dir / "chromium-headless.log").write_text("ws://x\n")
+    (server_dir / "firefox-headless.json").write_text('{"pid": 12')
+    monkeypatch.setattr(browser_server, "is_process_alive", lambda pid: False)
+
+    servers = browser_server.list_servers()
+
+    assert [(server["browser"], server["healthy"]) for server in servers] == [("chromium", False)]
@@ -0,0 +1,58 @@
+"""Tests for loading CAPTCHA markers and the single-evaluation detector."""
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+import pytest
+from playwright.sync_api import Error as PlaywrightError
+from page_objects.captcha_detector import DETECT_CAPTCHA_SCRIPT, NO_CAPTCHA, detect_captcha, load_captcha_markers
+
+@pytest.fixture(autouse=True)
+def clear_marker_cache():
+    """Reload the marker files in every test."""
+    load_captcha_markers.cache_clear()
+    yield
+    load_captcha_markers.cache_clear()
+
+def test_extra_file_merges_locales_into_bundled_markers(tmp_path: Path) -> None:
+    """Tests that an extra file adds a locale and extends an existing one without dropping the others."""
+    extra = tmp_path / "markers.json"
+    extra.write_text(json.dumps({
+        "url_markers": ["sorry/index", "captcha/check"],
+        "text_markers": {"it": ["I nostri sistemi hanno rilevato traffico insolito"], "en": ["Please verify you are human"]},
+    }), encoding="utf-8")
+    bundled = load_captcha_markers()
+
+    markers = load_captcha_markers(str(extra))
+
+    assert markers["url_markers"] == ["sorry/index", "captcha/check"]
+    assert markers["iframe_selectors"] == bundled["iframe_selectors"]
+    assert markers["text_markers"]["en"] == bundled["text_markers"]["en"] + ["Please verify you are human"]
+    assert markers["text_markers"]["it"] == ["I nostri sistemi hanno rilevato traffico insolito"]
+    assert set(bundled["text_markers"]) < set(markers["text_markers"])
+
+@pytest.mark.parametrize("locale_markers", ["unusual traffic", None, [""], [42]])
+def test_bad_locale_is_rejected(tmp_path: Path, locale_markers) -> None:
+    """Tests that a locale whose markers are not a list of non-empty strings raises a clear error."""
+    extra = tmp_path / "markers.json"
+    extra.write_text(json.dumps({"text_markers": {"it": locale_markers}}), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="locale 'it'"):
+        load_captcha_markers(str(extra))
+
+def test_missing_marker_file_is_an_error(tmp_path: Path) -> None:
+    """Tests that pointing at a file that does not exist fails instead of silently detecting nothing."""
+    with pytest.raises(FileNotFoundError):
+        load_captcha_markers(str(tmp_path / "missing.json"))
+
+def test_detect_captcha_makes_one_evaluate_call() -> None:
+    """Tests that every marker is checked in one evaluate call and its verdict is returned as is."""
+    page = MagicMock()
+    verdict = {"detected": True, "signal": "text", "marker": "Unsere Systeme haben ungewöhnlichen Datenverkehr", "locale": "de"}
+    page.evaluate.return_value = verdict
+    markers = load_captcha_markers()
+
+    assert detect_captcha(page) == verdict
+    page.evaluate.assert_called_once_with(DETECT_CAPTCHA_SCRIPT, markers)
+
+    page.evaluate.side_effect = PlaywrightError("Execution context was destroyed")
+    assert detect_captcha(page) == NO_CAPTCHA
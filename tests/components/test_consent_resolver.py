@@ -0,0 +1,52 @@
+"""Tests for the consent resolver against pages served through routing."""
+from typing import Callable, Dict, Generator
+import time
+import pytest
+from playwright.sync_api import Page, expect
+from page_objects.consent_resolver import clear_consent_cache, resolve_consent_dialog
+
+SITE = "http://consent-site.test"
+CONSENT_FRAME_URL = "https://consent.google.com/frame"
+ACCEPT_BUTTON = '<button onclick="this.remove()">Accept all</button>'
+
+@pytest.fixture
+def serve(page: Page) -> Generator[Callable[[Dict[str, str]], None], None, None]:
+    """Serve HTML bodies by URL from memory: serve({url: html})."""
+    clear_consent_cache()
+
+    def add(bodies: Dict[str, str]) -> None:
+        for url, body in bodies.items():
+            page.route(url, lambda route, body=body: route.fulfill(content_type="text/html", body=body))
+
+    yield add
+    clear_consent_cache()
+
+def test_accepts_a_button_on_the_page(page: Page, serve: Callable[[Dict[str, str]], None]) -> None:
+    """Tests that a page-level consent button is clicked and a second call hits the cache."""
+    serve({f"{SITE}/": f"<main>{ACCEPT_BUTTON}</main>"})
+    page.goto(f"{SITE}/")
+
+    assert resolve_consent_dialog(page, timeout=2000) == "accepted"
+    expect(page.locator("button")).to_have_count(0)
+    assert resolve_consent_dialog(page, timeout=2000) == "cached"
+
+def test_accepts_a_button_inside_the_consent_iframe(page: Page, serve: Callable[[Dict[str, str]], None]) -> None:
+    """Tests that the consent iframe wins the race and its button is clicked within the deadline."""
+    serve({
+        f"{SITE}/": f'<iframe src="{CONSENT_FRAME_URL}"></iframe>',
+        CONSENT_FRAME_URL: ACCEPT_BUTTON,
+    })
+    page.goto(f"{SITE}/")
+
+    assert resolve_consent_dialog(page, timeout=2000) == "accepted"
+    expect(page.frame_locator("iframe").locator("button")).to_have_count(0)
+
+def test_reports_absent_without_a_dialog(page: Page, serve: Callable[[Dict[str, str]], None]) -> None:
+    """Tests that a page without any consent UI resolves as absent after the short default probe."""
+    serve({f"{SITE}/": "<main>No dialog</main>"})
+    page.goto(f"{SITE}/", wait_until="commit")
+
+    started = time.monotonic()
+    assert resolve_consent_dialog(page) == "absent"
+    assert time.monotonic() - started < 2
+    assert resolve_consent_dialog(page) == "cached"
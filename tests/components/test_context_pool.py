@@ -0,0 +1,79 @@
+"""Tests for the pool of reusable browser contexts."""
+from unittest.mock import MagicMock
+from utils.context_pool import create_context_pool, open_context
+
+ARGS = {"viewport": {"width": 1920, "height": 1080}}
+
+def make_browser() -> MagicMock:
+    """Build a connected browser whose contexts come back clean after a reset."""
+    browser = MagicMock()
+    browser.browser_type.name = "chromium"
+    browser.is_connected.return_value = True
+
+    def new_context(**kwargs) -> MagicMock:
+        context = MagicMock()
+        context.pages = []
+        context.service_workers = []
+        context.storage_state.return_value = {"cookies": [], "origins": []}
+        return context
+
+    browser.new_context.side_effect = new_context
+    return browser
+
+def test_released_contexts_are_reset_and_reused() -> None:
+    """Tests that a released context is reset, handed out again and counted as reused."""
+    pool = create_context_pool(max_size=2, max_reuses=10)
+    browser = make_browser()
+
+    with open_context(pool, browser, ARGS) as first:
+        pass
+    with open_context(pool, browser, ARGS) as second:
+        pass
+
+    assert second is first
+    first.clear_cookies.assert_called()
+    first.unroute_all.assert_called_with(behavior="ignoreErrors")
+    metrics = pool["get_metrics"]()
+    assert (metrics["created"], metrics["reused"], metrics["isolation_verified"]) == (1, 1, 2)
+
+def test_contexts_are_evicted_after_max_reuses() -> None:
+    """Tests that a context is closed once it has served max_reuses leases."""
+    pool = create_context_pool(max_size=2, max_reuses=2)
+    browser = make_browser()
+    leased = []
+
+    for _ in range(3):
+        with open_context(pool, browser, ARGS) as context:
+            leased.append(context)
+
+    assert leased[0] is leased[1] and leased[2] is not leased[0]
+    leased[0].close.assert_called_once()
+    assert pool["get_metrics"]()["evicted_max_reuses"] == 1
+
+def test_contexts_with_leaked_state_are_evicted() -> None:
+    """Tests that cookies or service workers left after the reset evict the context."""
+    pool = create_context_pool()
+    browser = make_browser()
+    context = pool["acquire"](browser, ARGS)
+    context.storage_state.return_value = {"cookies": [{"name": "sid"}], "origins": []}
+    context.service_workers = [MagicMock()]
+
+    pool["release"](browser, ARGS, context)
+
+    context.close.assert_called_once()
+    metrics = pool["get_metrics"]()
+    assert (metrics["evicted_leak"], metrics["idle"]) == (1, 0)
+
+def test_full_pool_closes_extra_contexts() -> None:
+    """Tests that contexts beyond max_size per profile are closed instead of kept idle."""
+    pool = create_context_pool(max_size=1)
+    browser = make_browser()
+    first, second = pool["acquire"](browser, ARGS), pool["acquire"](browser, ARGS)
+
+    pool["release"](browser, ARGS, first)
+    pool["release"](browser, ARGS, second)
+
+    second.close.assert_called_once()
+    assert pool["acquire"](browser, ARGS) is first
+    metrics = pool["get_metrics"]()
+    assert (metrics["evicted_pool_full"], metrics["created"]) == (1, 2)
@@ -0,0 +1,69 @@
+"""Tests for running a script on several device profiles."""
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from utils.async_runner import run_on_loop, start_event_loop, stop_event_loop
+from utils.fan_out import assert_fan_out, run_device
+
+def make_browser() -> MagicMock:
+    """Build an async browser whose contexts open stub pages; created contexts are kept in browser.contexts."""
+    browser = MagicMock()
+    browser.contexts = []
+
+    async def new_context(**kwargs) -> MagicMock:
+        context = MagicMock(new_page=AsyncMock(), close=AsyncMock())
+        browser.contexts.append(context)
+        return context
+
+    browser.new_context = AsyncMock(side_effect=new_context)
+    return browser
+
+def run(coroutine):
+    """Run a coroutine on a loop of its own; the sync Playwright fixtures may own this thread's loop."""
+    loop, loop_thread = start_event_loop()
+    try:
+        return run_on_loop(loop, coroutine)
+    finally:
+        stop_event_loop(loop, loop_thread)
+
+def test_run_device_records_a_raising_script() -> None:
+    """Tests that a raising script fails its device, keeps earlier checks and still closes the context."""
+    browser = make_browser()
+
+    async def script(page, probe) -> None:
+        with probe["timed"]("open"):
+            probe["check"]("opened", True)
+        raise RuntimeError(f"menu missing on {probe['device']}")
+
+    result = run(run_device(browser, "Pixel 5", {"viewport": {"width": 393, "height": 851}}, script))
+
+    browser.new_context.assert_awaited_once_with(viewport={"width": 393, "height": 851})
+    browser.contexts[0].close.assert_awaited_once()
+    assert result["passed"] is False
+    assert result["error"] == "RuntimeError: menu missing on Pixel 5"
+    assert result["checks"] == [{"name": "opened", "passed": True, "detail": ""}]
+    assert set(result["timings"]) == {"open"}
+
+def test_assert_fan_out_reports_every_failed_device() -> None:
+    """Tests that one AssertionError lists the error and failed checks of each failing device only."""
+    def device(name: str, passed: bool, error=None, checks=()) -> dict:
+        return {"device": name, "passed": passed, "error": error, "checks": list(checks),
+                "timings": {"open": 10.0}, "duration": 12.0}
+
+    result = {
+        "devices": {
+            "iPhone 12": device("iPhone 12", False, error="TimeoutError: no menu"),
+            "Pixel 5": device("Pixel 5", False, checks=[{"name": "navigation has 4 items", "passed": False, "detail": "(found 3)"}]),
+            "iPad Pro 11": device("iPad Pro 11", True),
+        },
+        "passed": False,
+        "duration": 15.0,
+    }
+
+    with pytest.raises(AssertionError) as error:
+        assert_fan_out(result)
+
+    message = str(error.value)
+    assert "iPhone 12: FAILED" in message and "error: TimeoutError: no menu" in message
+    assert "Pixel 5: FAILED" in message and "failed check: navigation has 4 items (found 3)" in message
+    assert "iPad Pro 11: passed" in message
+    assert_fan_out(dict(result, passed=True))
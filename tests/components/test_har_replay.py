@@ -0,0 +1,57 @@
+"""Tests for HAR archive matching and replay."""
+from pathlib import Path
+from unittest.mock import MagicMock
+from utils.har_replay import create_replayer, get_lenient_key, get_strict_key, load_archive, save_archive
+
+SEARCH_URL = "https://www.google.com/search?q=playwright&sxsrf=abc&ei=123"
+
+def make_archive() -> dict:
+    """Build an archive holding two responses for the same search."""
+    return {
+        "version": 1,
+        "entries": [
+            {"method": "GET", "url": SEARCH_URL, "post_data": "", "status": 200, "headers": {}, "body": "first"},
+            {"method": "GET", "url": SEARCH_URL, "post_data": "", "status": 200, "headers": {}, "body": "second"},
+        ],
+        "bodies": {"first": "Zmlyc3Q=", "second": "c2Vjb25k"},
+    }
+
+def make_route(url: str) -> MagicMock:
+    """Build a route for a GET request without a body."""
+    route = MagicMock()
+    route.request.method = "GET"
+    route.request.url = url
+    route.request.post_data_buffer = None
+    return route
+
+def test_lenient_key_ignores_volatile_query_parameters() -> None:
+    """Tests that lenient matching keeps the query but drops session tokens."""
+    other = "https://www.google.com/search?ei=999&q=playwright&sxsrf=xyz"
+    assert get_lenient_key("GET", SEARCH_URL) == get_lenient_key("GET", other)
+    assert get_strict_key("GET", SEARCH_URL, None) != get_strict_key("GET", other, None)
+    assert get_lenient_key("GET", SEARCH_URL) != get_lenient_key("GET", "https://www.google.com/search?q=python")
+
+def test_archive_round_trip(tmp_path: Path) -> None:
+    """Tests that a saved archive loads back unchanged."""
+    path = str(tmp_path / "group" / "test.json.gz")
+    save_archive(make_archive(), path)
+    assert load_archive(path) == make_archive()
+
+def test_replayer_serves_in_order_and_reports_unmatched() -> None:
+    """Tests repeated requests get successive responses and unknown ones are aborted."""
+    page = MagicMock()
+    replayer = create_replayer(page, make_archive(), strict=False)
+    replayer["start"]()
+    handle_route = page.route.call_args.args[1]
+
+    bodies = []
+    for _ in range(3):
+        route = make_route("https://www.google.com/search?q=playwright&sxsrf=new")
+        handle_route(route)
+        bodies.append(route.fulfill.call_args.kwargs["body"])
+    missing = make_route("https://www.google.com/gen_204?atyp=i")
+    handle_route(missing)
+
+    assert bodies == [b"first", b"second", b"second"]
+    missing.abort.assert_called_once()
+    assert replayer["get_unmatched"]() == ["GET https://www.google.com/gen_204?atyp=i"]
@@ -0,0 +1,44 @@
+"""Tests for the in-memory mock page registry."""
+import json
+import re
+from unittest.mock import MagicMock
+from utils.mock_pages import create_mock_registry
+
+def make_route(url: str) -> MagicMock:
+    """Build a route for a request to the mock origin."""
+    route = MagicMock()
+    route.request.url = url
+    return route
+
+def test_pages_are_read_once_and_served_with_their_result_sets(tmp_path) -> None:
+    """Tests that a template shared by two result sets is read once and each page gets its data."""
+    template = tmp_path / "page.html"
+    template.write_text('<script type="application/json">{{ mock_results }}</script>')
+    (tmp_path / "found.json").write_text(json.dumps({"q": [{"title": "</script>"}]}))
+    (tmp_path / "empty.json").write_text(json.dumps({}))
+    registry = create_mock_registry("http://mock.test")
+    context = MagicMock()
+    registry["attach"](context)
+    handler = context.route.call_args.args[1]
+
+    for _ in range(3):
+        url = registry["register"]("found", str(template), str(tmp_path / "found.json"))
+    registry["register"]("empty", str(template), str(tmp_path / "empty.json"))
+    route = make_route(url)
+    handler(route)
+
+    body = route.fulfill.call_args.kwargs["body"].decode()
+    payload = re.search(r"json\">(.*)</script>$", body).group(1)
+    assert url == "http://mock.test/found"
+    assert json.loads(payload) == {"q": [{"title": "</script>"}]}
+    assert registry["get_stats"]() == {"files_read": 3, "served": 1, "not_found": 0, "pages": 2}
+
+def test_unknown_pages_get_a_404() -> None:
+    """Tests that requests for unregistered names are answered with 404."""
+    registry = create_mock_registry()
+    route = make_route(registry["get_url"]("missing"))
+
+    registry["handle_route"](route)
+
+    assert route.fulfill.call_args.kwargs["status"] == 404
+    assert registry["get_stats"]()["not_found"] == 1
@@ -0,0 +1,77 @@
+"""Tests for the filtered network response capture."""
+from typing import Any, Dict
+from unittest.mock import MagicMock
+import re
+from utils.network_capture import compile_url_pattern, create_network_capture, get_json
+
+def make_page() -> MagicMock:
+    """Build a page that records its response listeners."""
+    page = MagicMock()
+    page.listeners = []
+    page.on.side_effect = lambda event, handler: page.listeners.append(handler)
+    page.remove_listener.side_effect = lambda event, handler: page.listeners.remove(handler)
+    return page
+
+def make_response(url: str, resource_type: str = "fetch", body: bytes = b"{}") -> MagicMock:
+    """Build a response with its request's resource type and a body."""
+    response = MagicMock(url=url, status=200, ok=True)
+    response.request.resource_type = resource_type
+    response.request.method = "GET"
+    response.body.return_value = body
+    return response
+
+def emit(page: MagicMock, response: MagicMock) -> None:
+    """Deliver a response to every listener on the page."""
+    for handler in list(page.listeners):
+        handler(response)
+
+def test_filters_before_reading_bodies_and_detaches() -> None:
+    """Tests that only matching responses are kept, bodies are read lazily and stop() detaches."""
+    page = make_page()
+    capture = create_network_capture(page, "**/api/*", resource_types=["fetch"])
+    capture["start"]()
+    image = make_response("https://example.com/api/logo.png", resource_type="image")
+    other = make_response("https://example.com/style.css")
+    api = make_response("https://example.com/api/search?q=x", body=b'{"results": [1, 2]}')
+
+    for response in (image, other, api):
+        emit(page, response)
+
+    captures = capture["get_captures"]()
+    assert [entry["url"] for entry in captures] == [api.url]
+    assert not any(response.body.called for response in (image, other, api))
+    assert get_json(captures[0]) == {"results": [1, 2]}
+    get_json(captures[0])
+    api.body.assert_called_once()
+    capture["stop"]()
+    assert page.listeners == []
+    assert capture["get_stats"]() == {"seen": 3, "matched": 1, "buffered": 1}
+
+def test_buffer_is_bounded_and_wait_for_returns_the_nth_match() -> None:
+    """Tests that old captures are evicted and wait_for pumps events until the Nth match."""
+    page = make_page()
+    capture = create_network_capture(page, re.compile(r".*/items/\d+$"), max_entries=2)
+    capture["start"]()
+    pending = [make_response(f"https://example.com/items/{index}") for index in range(1, 5)]
+
+    def deliver_next(event: str, predicate: Any, timeout: float) -> Dict[str, Any]:
+        response = pending.pop(0)
+        emit(page, response)
+        return response
+
+    page.wait_for_event.side_effect = deliver_next
+
+    assert capture["wait_for"](count=3)["url"].endswith("/items/3")
+    assert [entry["index"] for entry in capture["get_captures"]()] == [2, 3]
+    emit(page, pending.pop(0))
+    assert [entry["index"] for entry in capture["get_captures"]()] == [3, 4]
+
+def test_globs_follow_playwright_rules() -> None:
+    """Tests that {a,b} groups alternate and a single * stays within one path segment."""
+    api = compile_url_pattern("**/api/{search,contact}")
+    scripts = compile_url_pattern("http://x/*.js")
+
+    assert api.match("http://x/api/search") and api.match("http://x/api/contact")
+    assert not api.match("http://x/api/searches")
+    assert scripts.match("http://x/b.js")
+    assert not scripts.match("http://x/a/b.js")
@@ -0,0 +1,29 @@
+"""Tests for the readiness conditions."""
+from unittest.mock import MagicMock
+import pytest
+from utils.readiness import expect_ready, response_ready
+
+def test_response_expectation_is_entered_and_exited() -> None:
+    """Tests that the armed expect_response is waited on and closed after the step."""
+    page = MagicMock()
+    manager = page.expect_response.return_value
+
+    with expect_ready(page, "submit", response_ready("**/api/search?*"), timeout=500):
+        page.click("button")
+
+    page.expect_response.assert_called_once_with("**/api/search?*", timeout=500)
+    manager.__enter__.assert_called_once()
+    manager.__exit__.assert_called_once()
+    assert manager.__exit__.call_args.args[-3:] == (None, None, None)
+
+def test_failed_action_cancels_the_response_expectation() -> None:
+    """Tests that an exception in the action reaches the expectation's __exit__ so it is cancelled."""
+    page = MagicMock()
+    manager = page.expect_response.return_value
+    manager.__exit__.return_value = False
+
+    with pytest.raises(RuntimeError):
+        with expect_ready(page, "submit", response_ready("**/api/contact")):
+            raise RuntimeError("click failed")
+
+    assert manager.__exit__.call_args.args[-3] is RuntimeError
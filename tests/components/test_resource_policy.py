@@ -0,0 +1,53 @@
+"""Tests for the declarative resource blocking policies."""
+from unittest.mock import MagicMock
+from config.test_config import RESOURCE_POLICIES, get_resource_policy
+from utils.resource_policy import create_resource_blocker
+
+def make_route(url: str, resource_type: str) -> MagicMock:
+    """Build a route for a request of the given type."""
+    route = MagicMock()
+    route.request.url = url
+    route.request.resource_type = resource_type
+    return route
+
+def test_functional_policy_blocks_types_and_trackers_only() -> None:
+    """Tests that images, fonts and tracker domains are aborted and the rest falls back."""
+    blocker = create_resource_blocker(RESOURCE_POLICIES["functional"])
+    context = MagicMock()
+    blocker["attach"](context)
+    handler = context.route.call_args.args[1]
+    routes = [
+        make_route("http://localhost:5000/logo.png", "image"),
+        make_route("https://fonts.example.com/inter.woff2", "font"),
+        make_route("https://platform.linkedin.com/in.js", "script"),
+        make_route("http://localhost:5000/", "document"),
+    ]
+
+    for route in routes:
+        handler(route)
+
+    assert [route.abort.called for route in routes] == [True, True, True, False]
+    routes[3].fallback.assert_called_once()
+    stats = blocker["get_stats"]()
+    assert (stats["blocked"], stats["allowed"]) == (3, 1)
+    assert stats["by_type"] == {"image": 1, "font": 1, "script": 1}
+
+def test_deny_only_policy_routes_just_the_denied_hosts() -> None:
+    """Tests that a deny list installs a host regex instead of routing every request."""
+    blocker = create_resource_blocker(RESOURCE_POLICIES["trackers"])
+    context = MagicMock()
+    blocker["attach"](context)
+    pattern = context.route.call_args.args[0]
+
+    assert pattern.match("https://www.twitter.com/widgets.js")
+    assert not pattern.match("https://nottwitter.com/")
+    assert not pattern.match("http://localhost:5000/?ref=twitter.com")
+    assert not create_resource_blocker(RESOURCE_POLICIES["none"])["is_active"]()
+
+def test_first_party_policy_allows_only_the_base_url_host(monkeypatch) -> None:
+    """Tests that first_party resolves the host under test and blocks every other host."""
+    monkeypatch.setenv("BASE_URL", "http://app.test:8080")
+    blocker = create_resource_blocker(get_resource_policy("first_party"))
+
+    assert blocker["should_block"]("http://app.test:8080/api", "fetch") is None
+    assert blocker["should_block"]("https://cdn.example.com/lib.js", "script") == "domain cdn.example.com not allowed"
@@ -0,0 +1,62 @@
+"""Tests for run profiles and how explicit options override them."""
+from typing import List
+import pytest
+from _pytest.config import _prepareconfig
+from config.test_config import RUN_PROFILES, get_browser_config
+from conftest import apply_run_profile, get_explicit_profile_options
+
+@pytest.fixture(autouse=True)
+def clean_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the caller's profile settings out of the parsed options."""
+    for name in ("PYTEST_ADDOPTS", "RUN_PROFILE", "HEADLESS", "SLOW_MO"):
+        monkeypatch.delenv(name, raising=False)
+
+def parse_options(args: List[str]) -> pytest.Config:
+    """Parse a command line the way pytest does, without configuring the session, and apply its profile."""
+    config = _prepareconfig([*args, "--assert=plain", "-p", "no:cacheprovider", "tests/components"])
+    apply_run_profile(config)
+    return config
+
+def test_ci_profile_fills_unset_options() -> None:
+    """Tests that --profile ci sets browsers, artifacts and the report when nothing is given explicitly."""
+    config = parse_options(["--profile", "ci"])
+    option = config.option
+
+    assert get_explicit_profile_options(config) == set()
+    assert option.headed is False and option.slowmo == 0
+    assert option.browser == ["chromium", "firefox", "webkit"]
+    assert (option.video, option.screenshot, option.tracing) == ("off", "only-on-failure", "off")
+    assert option.trace_buffer is True
+    assert option.htmlpath == "reports/report.html"
+
+def test_explicit_options_beat_the_ci_profile() -> None:
+    """Tests that --headed and explicit artifact options keep their values, even when they equal the defaults."""
+    config = parse_options(["--profile", "ci", "--headed", "--video", "off", "--screenshot=off", "--browser", "firefox"])
+    option = config.option
+
+    assert get_explicit_profile_options(config) == {"video", "screenshot"}
+    assert option.headed is True
+    assert option.browser == ["firefox"]
+    assert (option.video, option.screenshot, option.tracing) == ("off", "off", "off")
+
+def test_explicit_options_from_pytest_addopts(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that options in PYTEST_ADDOPTS count as explicit and the rest come from the debug profile."""
+    monkeypatch.setenv("PYTEST_ADDOPTS", "--video off --tracing=retain-on-failure")
+    config = parse_options(["--profile", "debug"])
+    option = config.option
+
+    assert get_explicit_profile_options(config) == {"video", "tracing"}
+    assert (option.video, option.screenshot, option.tracing) == ("off", "on", "retain-on-failure")
+    assert option.headed is True and option.slowmo == 50
+
+def test_get_browser_config_applies_environment_overrides(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that RUN_PROFILE picks the default profile and HEADLESS/SLOW_MO override it without changing RUN_PROFILES."""
+    monkeypatch.setenv("RUN_PROFILE", "DEBUG")
+    assert get_browser_config() == RUN_PROFILES["debug"]
+
+    monkeypatch.setenv("HEADLESS", "true")
+    monkeypatch.setenv("SLOW_MO", "10")
+    config = get_browser_config("debug")
+
+    assert (config["headless"], config["slow_mo"]) == (True, 10)
+    assert (RUN_PROFILES["debug"]["headless"], RUN_PROFILES["debug"]["slow_mo"]) == (False, 50)
@@ -0,0 +1,49 @@
+"""Tests for the duration history and the LPT shard scheduler."""
+import os
+from pathlib import Path
+import pytest
+from utils.durations import estimate_durations, load_durations, save_durations
+from utils.scheduler import plan_lpt, predict_round_robin_makespan
+
+def test_lpt_balances_shards() -> None:
+    """Tests that LPT spreads a slow test away from the other long ones."""
+    durations = {"slow": 5.0, "a": 3.0, "b": 3.0, "c": 2.0, "d": 2.0, "e": 1.0}
+    plan = plan_lpt(durations, 2)
+
+    assert plan["predicted_makespan"] == 8.0
+    assert sorted(plan["predicted_loads"]) == [8.0, 8.0]
+    assert sorted(nodeid for shard in plan["shards"] for nodeid in shard) == sorted(durations)
+
+def test_lpt_orders_each_shard_longest_first() -> None:
+    """Tests that the slowest test of a shard runs first."""
+    durations = {"fast": 0.1, "slow": 4.0, "medium": 1.0}
+    plan = plan_lpt(durations, 1)
+
+    assert plan["shards"] == [["slow", "medium", "fast"]]
+
+def test_lpt_beats_round_robin() -> None:
+    """Tests that the planned makespan is never worse than round-robin."""
+    nodeids = ["a", "b", "c", "d"]
+    durations = {"a": 4.0, "b": 1.0, "c": 4.0, "d": 1.0}
+
+    assert plan_lpt(durations, 2)["predicted_makespan"] == 5.0
+    assert predict_round_robin_makespan(nodeids, durations, 2) == 8.0
+
+def test_duration_history_smooths_runs(tmp_path: Path) -> None:
+    """Tests that repeated runs update a moving average per key."""
+    path = os.path.join(str(tmp_path), "durations.json")
+    key = "tests/e2e/test_mobile.py::test_mobile_form[iPhone_12]|chromium|iPhone_12"
+
+    save_durations({key: 2.0}, path)
+    save_durations({key: 4.0}, path)
+
+    average, samples = load_durations(path)[key]
+    assert samples == 2
+    assert average == pytest.approx(2.6)
+
+def test_unseen_tests_use_median_estimate() -> None:
+    """Tests that tests without history get the median recorded duration."""
+    history = {"a": [1.0, 3], "b": [3.0, 1], "c": [10.0, 2]}
+    estimates = estimate_durations(["a", "new"], history)
+
+    assert estimates == {"a": 1.0, "new": 3.0}
@@ -0,0 +1,38 @@
+"""Tests for the background screenshot writer."""
+from pathlib import Path
+from unittest.mock import MagicMock
+from utils.screenshot_service import create_screenshot_service
+
+def make_page(*frames: bytes) -> MagicMock:
+    """Build a page whose screenshots return the given frames in order."""
+    page = MagicMock()
+    page.screenshot.side_effect = list(frames)
+    return page
+
+def test_identical_frames_are_written_once(tmp_path: Path) -> None:
+    """Tests that a repeated frame reuses the first path and is not written again."""
+    service = create_screenshot_service(output_dir=str(tmp_path))
+    page = make_page(b"frame", b"frame", b"other")
+
+    first = service["capture"](page, "home")
+    second = service["capture"](page, "home")
+    third = service["capture"](page, "results")
+    service["close"]()
+
+    assert first == second != third
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted([Path(first).name, Path(third).name])
+    stats = service["get_stats"]()
+    assert (stats["captured"], stats["deduplicated"], stats["written"]) == (3, 1, 2)
+
+def test_jpeg_quality_and_clip_are_passed_to_the_browser(tmp_path: Path) -> None:
+    """Tests that JPEG frames are encoded by the browser with the requested region."""
+    service = create_screenshot_service(output_dir=str(tmp_path))
+    page = make_page(b"jpeg bytes")
+    clip = {"x": 0, "y": 0, "width": 100, "height": 50}
+
+    path = service["capture"](page, "header", clip=clip, image_format="jpeg", quality=60, wait_for_write=True)
+
+    assert Path(path).suffix == ".jpg"
+    assert Path(path).read_bytes() == b"jpeg bytes"
+    page.screenshot.assert_called_once_with(full_page=True, type="jpeg", clip=clip, quality=60)
+    service["close"]()
@@ -1,20 +1,27 @@
 import pytest
 import os
-from typing import Generator
+from typing import Callable, Dict, Generator
 from playwright.sync_api import Page, expect
 
+MOCK_DIR = os.path.dirname(__file__)
+
 @pytest.fixture(scope="function")
-def mock_page(page: Page) -> Generator[Page, None, None]:
+def mock_page(page: Page, mock_pages: Dict[str, Callable]) -> Generator[Page, None, None]:
     """
     Fixture that loads our mock search page.
+
+    The page and its result sets are read once per session and served from
+    memory under the mock origin.
     """
-    # Get absolute path to mock file
-    mock_path = os.path.join(
-        os.path.dirname(__file__),
-        "mock_google.html"
+    url = mock_pages["register"](
+        "google",
+        os.path.join(MOCK_DIR, "mock_google.html"),
+        os.path.join(MOCK_DIR, "mock_results.json")
     )
-    page.goto(f"file://{mock_path}")
+    mock_pages["attach"](page.context)
+    page.goto(url)
     yield page
+    mock_pages["detach"](page.context)
 
 def test_search_functionality(mock_page: Page) -> None:
     """
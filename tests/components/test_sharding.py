@@ -0,0 +1,49 @@
+"""Tests for the worker command line, shard selection and report draining."""
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from utils.sharding import drain_worker, get_worker_args, select_shard_items
+
+def test_worker_args_drop_controller_and_per_shard_options() -> None:
+    """Tests that --workers and --output are stripped in both spellings and everything else is kept."""
+    args = ["tests/e2e", "--workers", "4", "--output=artifacts", "--headed", "--workers=2", "--output", "out", "-k", "search"]
+
+    assert get_worker_args(args) == ["tests/e2e", "--headed", "-k", "search"]
+
+def test_select_shard_items_keeps_planned_order(tmp_path: Path) -> None:
+    """Tests that a worker runs only its shard, in the planned order, and deselects the rest."""
+    shard_file = tmp_path / "shard-0.txt"
+    shard_file.write_text("test_b\ntest_a\n\n")
+    items = [SimpleNamespace(nodeid=nodeid) for nodeid in ("test_a", "test_b", "test_c")]
+    config = MagicMock()
+
+    select_shard_items(config, items, str(shard_file))
+
+    assert [item.nodeid for item in items] == ["test_b", "test_a"]
+    deselected = config.hook.pytest_deselected.call_args.kwargs["items"]
+    assert [item.nodeid for item in deselected] == ["test_c"]
+
+def test_drain_worker_replays_finished_tests_only(tmp_path: Path) -> None:
+    """Tests that reports are replayed per finished test and a half-written line is left for the next read."""
+    output_file = tmp_path / "shard-0.jsonl"
+    lines = [
+        {"nodeid": "test_a", "when": "setup", "location": ["test_x.py", 1, "test_a"]},
+        {"nodeid": "test_a", "when": "call", "location": ["test_x.py", 1, "test_a"]},
+        {"nodeid": "test_b", "when": "setup", "location": ["test_x.py", 5, "test_b"]},
+        {"nodeid": "test_a", "when": "teardown", "location": ["test_x.py", 1, "test_a"]},
+    ]
+    output_file.write_text("".join(json.dumps(line) + "\n" for line in lines) + '{"nodeid": "test_b"')
+    config = MagicMock()
+    config.hook.pytest_report_from_serializable.side_effect = lambda config, data: SimpleNamespace(**data)
+    worker = {"output_file": str(output_file), "offset": 0, "done": set()}
+    pending = {}
+
+    drain_worker(config, worker, pending)
+
+    assert worker["done"] == {"test_a"}
+    assert list(pending) == ["test_b"]
+    assert pending["test_b"][0].location == ("test_x.py", 5, "test_b")
+    replayed = [call.kwargs["report"].when for call in config.hook.pytest_runtest_logreport.call_args_list]
+    assert replayed == ["setup", "call", "teardown"]
+    assert worker["offset"] == len("".join(json.dumps(line) + "\n" for line in lines))
@@ -0,0 +1,29 @@
+"""Tests for saved identity storage states."""
+import json
+import time
+from unittest.mock import MagicMock
+import utils.storage_state as storage_state
+from utils.storage_state import create_storage_state_manager
+
+def make_state(expires_in: float) -> dict:
+    """Build a storage state with one cookie expiring after the given seconds."""
+    return {"cookies": [{"name": "SOCS", "expires": time.time() + expires_in}], "origins": []}
+
+def test_stale_seed_is_regenerated_into_the_untracked_cache(tmp_path, monkeypatch) -> None:
+    """Tests that regeneration leaves the tracked seed alone and the cached state is reused."""
+    seed_dir, cache_dir = tmp_path / "auth", tmp_path / ".auth-cache"
+    seed_dir.mkdir()
+    seed = seed_dir / "storage.json"
+    seed.write_text(json.dumps(make_state(60)))
+    monkeypatch.setattr(storage_state, "AUTH_DIR", str(seed_dir))
+    monkeypatch.setattr(storage_state, "AUTH_CACHE_DIR", str(cache_dir))
+    browser = MagicMock()
+    browser.new_context.return_value.storage_state.return_value = make_state(86400)
+    monkeypatch.setitem(storage_state.IDENTITY_GENERATORS, "default", MagicMock())
+
+    state = create_storage_state_manager()["get_state"](browser)
+    reloaded = create_storage_state_manager()["get_state"](browser)
+
+    assert json.loads(seed.read_text())["cookies"][0]["expires"] < time.time() + 3600
+    assert json.loads((cache_dir / "storage.json").read_text()) == state == reloaded
+    assert browser.new_context.call_count == 1
@@ -0,0 +1,27 @@
+"""Tests for the in-process test server."""
+import socket
+import urllib.request
+import pytest
+from app import app
+from utils.test_server import start_test_server, wait_until_healthy
+
+def test_server_starts_on_an_ephemeral_port_and_stops() -> None:
+    """Tests that the app is served on a free port once healthy and the port is released on stop."""
+    server = start_test_server(app, backend="werkzeug")
+    try:
+        assert not server["base_url"].endswith(":5000")
+        with urllib.request.urlopen(server["base_url"] + "/healthz") as response:
+            assert response.read() == b"ok"
+    finally:
+        server["stop"]()
+    port = int(server["base_url"].rsplit(":", 1)[1])
+    with pytest.raises(ConnectionRefusedError):
+        socket.create_connection(("127.0.0.1", port), timeout=1)
+
+def test_readiness_times_out_without_a_server() -> None:
+    """Tests that waiting for a port nobody listens on fails with the last error."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    with pytest.raises(RuntimeError, match="not ready"):
+        wait_until_healthy(f"http://127.0.0.1:{port}", timeout=0.2)
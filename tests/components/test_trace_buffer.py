@@ -0,0 +1,19 @@
+"""Tests for the per-page trace ring buffer."""
+import json
+from unittest.mock import MagicMock
+from utils.trace_buffer import create_trace_buffer
+
+def test_persist_writes_everything_into_the_given_directory(tmp_path) -> None:
+    """Tests that the buffer and the failure screenshot land in the test's artifact directory under the given name."""
+    page = MagicMock()
+    page.url = "http://localhost/"
+    page.is_closed.return_value = False
+    page.content.return_value = "<html></html>"
+    page.screenshot.side_effect = lambda path, timeout: open(path, "wb").write(b"png")
+    artifact_dir = tmp_path / "test-results" / "test-one"
+
+    written = create_trace_buffer(page)["persist"](str(artifact_dir), "checkout")
+
+    assert sorted(written["paths"]) == [str(artifact_dir / "checkout.json"), str(artifact_dir / "checkout.png")]
+    assert json.loads((artifact_dir / "checkout.json").read_text())["final_dom"] == "<html></html>"
+    assert written["bytes"] == sum(len(open(path, "rb").read()) for path in written["paths"])
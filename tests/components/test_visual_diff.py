@@ -0,0 +1,87 @@
+"""Tests for the vectorized screenshot comparison and the baseline store."""
+from pathlib import Path
+import io
+import numpy as np
+import pytest
+from PIL import Image
+from utils.visual_baselines import create_visual_asserter, get_baseline_path
+from utils.visual_diff import compare_images, compare_many, save_image
+
+def make_image(width: int = 40, height: int = 30, color: int = 255) -> np.ndarray:
+    """Build a solid RGBA image."""
+    image = np.full((height, width, 4), color, dtype=np.uint8)
+    image[..., 3] = 255
+    return image
+
+def test_changed_block_is_reported_unless_ignored() -> None:
+    """Tests that a changed block is counted and that an ignore region hides it."""
+    expected = make_image()
+    actual = expected.copy()
+    actual[10:15, 10:20, :3] = 0
+
+    result = compare_images(actual, expected)
+    ignored = compare_images(actual, expected, ignore_regions=[{"x": 10, "y": 10, "width": 10, "height": 5}])
+
+    assert not result["match"] and result["diff_pixels"] > 0
+    assert result["mask"][12, 15] and not result["mask"][0, 0]
+    assert ignored["match"] and ignored["diff_pixels"] == 0
+
+def test_threshold_and_size_mismatch() -> None:
+    """Tests that faint changes stay under the threshold and different sizes never match."""
+    expected = make_image()
+    faint = make_image(color=250)
+
+    assert compare_images(faint, expected, threshold=0.1)["match"]
+    assert not compare_images(faint, expected, threshold=0.01)["match"]
+    mismatch = compare_images(make_image(width=41), expected)
+    assert mismatch["size_mismatch"] and mismatch["actual_size"] == (41, 30)
+
+def test_shifted_edge_counts_as_anti_aliasing() -> None:
+    """Tests that a blended edge pixel is tolerated while a real change is not."""
+    expected = make_image()
+    expected[:, 20:, :3] = 0
+    actual = expected.copy()
+    # The edge pixels render half way between white and black
+    actual[:, 20, :3] = 128
+
+    assert compare_images(actual, expected)["match"]
+    assert not compare_images(actual, expected, anti_aliasing=False)["match"]
+
+def test_compare_many_writes_diffs_in_job_order(tmp_path: Path) -> None:
+    """Tests that pooled comparisons keep job order and write diff images only for mismatches."""
+    baseline = make_image()
+    changed = baseline.copy()
+    changed[:5, :5, :3] = 0
+    for name, image in (("baseline", baseline), ("same", baseline), ("changed", changed)):
+        save_image(image, str(tmp_path / f"{name}.png"))
+    jobs = [
+        (str(tmp_path / "same.png"), str(tmp_path / "baseline.png"), str(tmp_path / "same-diff.png")),
+        (str(tmp_path / "changed.png"), str(tmp_path / "baseline.png"), str(tmp_path / "changed-diff.png")),
+    ]
+
+    results = compare_many(jobs, workers=2)
+
+    assert [result["match"] for result in results] == [True, False]
+    assert results[1]["diff_pixels"] == 25
+    assert not (tmp_path / "same-diff.png").exists() and (tmp_path / "changed-diff.png").exists()
+
+def encode_png(pixels: np.ndarray) -> bytes:
+    """Encode an RGBA array as PNG bytes, like a page screenshot."""
+    buffer = io.BytesIO()
+    Image.fromarray(pixels, "RGBA").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+def test_missing_baseline_fails_unless_updating(tmp_path: Path) -> None:
+    """Tests that a missing baseline fails without writing it, and that --update-baselines records it."""
+    baseline_path = get_baseline_path(str(tmp_path / "baselines"), "chromium", "homepage", "Pixel_5")
+    screenshot = encode_png(make_image())
+    compare = create_visual_asserter(str(tmp_path / "baselines"), "chromium", str(tmp_path / "artifacts"))
+
+    with pytest.raises(AssertionError, match="--update-baselines"):
+        compare(None, "homepage", device="Pixel_5", screenshot=screenshot)
+    assert not Path(baseline_path).exists()
+    assert (tmp_path / "artifacts" / "homepage-Pixel_5-actual.png").exists()
+
+    update = create_visual_asserter(str(tmp_path / "baselines"), "chromium", str(tmp_path / "artifacts"), update=True)
+    assert update(None, "homepage", device="Pixel_5", screenshot=screenshot)["baseline_written"]
+    assert compare(None, "homepage", device="Pixel_5", screenshot=screenshot)["match"]
@@ -0,0 +1,87 @@
+"""Tests for the in-process WSGI transport."""
+import json
+import threading
+from unittest.mock import AsyncMock, MagicMock
+from app import app
+from utils.async_runner import run_on_loop, start_event_loop, stop_event_loop
+from utils.wsgi_transport import create_wsgi_transport
+
+def make_route(method: str, url: str, headers: dict, body: bytes = None) -> MagicMock:
+    """Build a route for a request to the transport origin."""
+    route = MagicMock()
+    route.request.method = method
+    route.request.url = url
+    # Route handlers only see Cookie through all_headers()
+    route.request.headers = {name: value for name, value in headers.items() if name != "cookie"}
+    route.request.all_headers.return_value = headers
+    route.request.post_data_buffer = body
+    return route
+
+def test_routed_requests_are_fulfilled_from_the_app() -> None:
+    """Tests that GET and POST requests reach the Flask app and come back uncompressed."""
+    transport = create_wsgi_transport(app, "http://app.wsgi.test")
+    context = MagicMock()
+    transport["attach"](context)
+    pattern, handler = context.route.call_args.args
+    page_route = make_route("GET", "http://app.wsgi.test/", {"accept-encoding": "gzip, br"})
+    post_route = make_route(
+        "POST",
+        "http://app.wsgi.test/api/contact",
+        {"content-type": "application/json"},
+        json.dumps({"name": "Test User", "email": "test@example.com", "message": "Hi"}).encode()
+    )
+
+    handler(page_route)
+    handler(post_route)
+
+    assert pattern == "http://app.wsgi.test/**"
+    page_response = page_route.fulfill.call_args.kwargs
+    assert page_response["status"] == 200
+    assert "content-encoding" not in page_response["headers"]
+    assert b"Let's Talk" in page_response["body"]
+    assert post_route.fulfill.call_args.kwargs["status"] == 201
+    assert transport["get_stats"]()["requests"] == 2
+
+def test_query_strings_and_app_errors() -> None:
+    """Tests that query strings are passed through and an exception in the app becomes a 502."""
+    def broken_app(environ, start_response):
+        raise ValueError("boom")
+
+    transport = create_wsgi_transport(app)
+    search = transport["dispatch"]("GET", transport["base_url"] + "/api/search?q=test&per_page=3", {})
+    route = make_route("GET", "http://app.wsgi.test/", {})
+    broken = create_wsgi_transport(broken_app)
+    broken["handle_route"](route)
+
+    assert len(json.loads(search["body"])["results"]) == 3
+    assert route.fulfill.call_args.kwargs["status"] == 502
+    assert broken["get_stats"]()["errors"] == 1
+
+def test_async_handler_forwards_cookies_from_an_executor_thread() -> None:
+    """Tests that the async handler passes the Cookie header and runs the app off the event loop thread."""
+    seen = {}
+
+    def echo_app(environ, start_response):
+        seen["cookie"] = environ.get("HTTP_COOKIE")
+        seen["thread"] = threading.get_ident()
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return [b"ok"]
+
+    transport = create_wsgi_transport(echo_app)
+    route = MagicMock()
+    route.request.method = "GET"
+    route.request.url = transport["base_url"] + "/"
+    route.request.post_data_buffer = None
+    route.request.all_headers = AsyncMock(return_value={"cookie": "session=abc"})
+    route.fulfill = AsyncMock()
+
+    # A loop of its own, since the sync Playwright fixtures may own this thread's loop
+    loop, loop_thread = start_event_loop()
+    try:
+        run_on_loop(loop, transport["handle_route_async"](route))
+    finally:
+        stop_event_loop(loop, loop_thread)
+
+    assert seen["cookie"] == "session=abc"
+    assert seen["thread"] != loop_thread.ident
+    assert route.fulfill.await_args.kwargs["body"] == b"ok"
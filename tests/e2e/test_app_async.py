@@ -0,0 +1,32 @@
+"""Async end-to-end tests for the contact page.
+
+Run one at a time under pytest, or concurrently in one browser with:
+    python -m utils.async_runner tests/e2e/test_app_async.py --concurrency 4
+"""
+from playwright.async_api import Page, expect
+from config.test_config import get_base_url
+from page_objects.async_base_page import async_base_page
+
+async def test_hero_content(async_page: Page) -> None:
+    """Test the hero section introduces the contact page."""
+    page_actions = async_base_page(async_page)
+    await async_page.goto(get_base_url(), wait_until="domcontentloaded")
+
+    await page_actions["wait_for_element"](".hero__title")
+    assert await page_actions["get_element_text"](".hero__title") == "Let's Talk"
+    await expect(async_page).to_have_title("Contact Us")
+
+async def test_contact_cards(async_page: Page) -> None:
+    """Test every contact channel is listed with a link."""
+    await async_page.goto(get_base_url(), wait_until="domcontentloaded")
+
+    cards = async_page.locator(".contact-card")
+    await expect(cards).to_have_count(3)
+    await expect(cards.locator(".contact-card__link").first).to_have_attribute("href", "mailto:inquiry@example.com")
+
+async def test_navigation_links(async_page: Page) -> None:
+    """Test the navigation menu links to every section."""
+    await async_page.goto(get_base_url(), wait_until="domcontentloaded")
+
+    links = async_page.locator(".navigation-menu .nav-item")
+    await expect(links).to_have_text(["About", "Services", "Work", "Contact"])
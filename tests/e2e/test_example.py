@@ -4,7 +4,7 @@ import pytest
 from playwright.sync_api import Page, expect
 from config.test_config import get_base_url, get_timeout
 from page_objects.base_page import base_page
-from utils.test_helpers import wait_for_network_idle
+from utils.readiness import expect_ready, response_ready
 
 @pytest.mark.browser_specific
 def test_search_functionality(page: Page) -> None:
@@ -20,19 +20,16 @@ def test_search_functionality(page: Page) -> None:
     
     # Navigate to homepage
     page.goto(get_base_url())
-    wait_for_network_idle(page)
     
     # Test search input
     search_input = ".search-input"
     search_button = ".search-button"
     results_container = ".search-results"
     
-    # Fill and submit search
+    # Fill and submit search, waiting for the search API to answer
     page_actions["fill_input"](search_input, "test query")
-    page_actions["click_element"](search_button)
-    
-    # Wait for network idle after search
-    wait_for_network_idle(page)
+    with expect_ready(page, "submit search", response_ready("**/api/search?*")):
+        page_actions["click_element"](search_button)
     
     # Verify results appear
     results = page.locator(results_container)
@@ -78,7 +75,6 @@ def test_form_submission(page: Page) -> None:
     
     # Navigate to contact page
     page.goto(f"{get_base_url()}/contact")
-    wait_for_network_idle(page)
     
     # Fill form fields
     form_fields: Dict[str, str] = {
@@ -87,17 +83,32 @@ def test_form_submission(page: Page) -> None:
         "message": ".message-input"
     }
     
-    page_actions["fill_input"](form_fields["name"], "Test User")
-    page_actions["fill_input"](form_fields["email"], "test@example.com")
-    page_actions["fill_input"](form_fields["message"], "Test message")
+    page_actions["fill_form"]({
+        form_fields["name"]: "Test User",
+        form_fields["email"]: "test@example.com",
+        form_fields["message"]: "Test message"
+    })
     
     # Submit form
     submit_button = ".submit-button"
     success_message = ".success-message"
     
-    # Click submit and wait for network idle
-    page_actions["click_element"](submit_button)
-    wait_for_network_idle(page)
+    # Click submit and wait for the contact API to answer
+    with expect_ready(page, "submit contact form", response_ready("**/api/contact")):
+        page_actions["click_element"](submit_button)
     
     # Verify success message appears
     expect(page.locator(success_message)).to_be_visible(timeout=get_timeout())
+
+@pytest.mark.e2e
+def test_search_through_wsgi_transport(page: Page, wsgi_transport: Dict[str, Any]) -> None:
+    """Test the search flow with app.py served in-process instead of over TCP."""
+    page_actions = base_page(page)
+    page.goto(wsgi_transport["base_url"] + "/")
+
+    page_actions["fill_input"](".search-input", "test query")
+    with expect_ready(page, "submit search", response_ready("**/api/search?*")):
+        page_actions["click_element"](".search-button")
+
+    expect(page.locator(".search-results")).to_contain_text("Result")
+    assert wsgi_transport["get_stats"]()["requests"] >= 2
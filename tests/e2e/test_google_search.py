@@ -5,7 +5,16 @@ import os
 from typing import Dict, Any, Callable, Generator
 from playwright.sync_api import Page, expect, BrowserContext
 
-from page_objects.google_page import get_google_page_actions
+from page_objects.google_page import get_google_page_actions, fast_pacing, human_pacing
+from utils.readiness import dom_ready, expect_ready
+
+# The search box is usable once it is in the DOM and enabled; a CAPTCHA
+# redirect has no search box and is reported by the check after loading
+SEARCH_BOX_READY = """() => {
+    if (window.location.pathname.startsWith("/sorry/")) return true;
+    const box = document.querySelector('textarea[name="q"], input[name="q"]');
+    return Boolean(box && !box.disabled);
+}"""
 
 @pytest.fixture(scope="function")
 def browser_context(context: BrowserContext) -> None:
@@ -26,15 +35,20 @@ def browser_context(context: BrowserContext) -> None:
     })
 
 @pytest.fixture(scope="function")
-def search_delay() -> Generator[None, None, None]:
+def search_delay(har_mode: str) -> Generator[None, None, None]:
     """
     Adds delay between test runs to avoid triggering automated testing detection.
+    Replayed runs never reach Google and skip the delay.
     """
     yield
+    if har_mode == "replay":
+        return
     # Random delay between 3-5 seconds between tests
     time.sleep(random.uniform(3, 5))
 
-def test_google_search_components(page: Page, browser_context: None, search_delay: None) -> None:
+@pytest.mark.identity("default")
+@pytest.mark.har("google_search", match="lenient")
+def test_google_search_components(page: Page, browser_context: None, search_delay: None, har_mode: str) -> None:
     """
     Component-level test for Google search functionality.
     Tests individual components with proper delays to avoid CAPTCHA.
@@ -43,6 +57,7 @@ def test_google_search_components(page: Page, browser_context: None, search_dela
         page: Page object
         browser_context: Fixture that sets up stealth browser settings
         search_delay: Fixture that adds delay between tests
+        har_mode: HAR mode of the run; replayed traffic needs no human pacing
     """
     # Configure viewport for more human-like appearance
     page.set_viewport_size({
@@ -51,8 +66,11 @@ def test_google_search_components(page: Page, browser_context: None, search_dela
     })
     
     # Test 1: Page Load and Initial State
-    page.goto("https://www.google.com", wait_until="networkidle")
-    google_actions = get_google_page_actions(page)
+    with expect_ready(page, "open google", dom_ready(SEARCH_BOX_READY)):
+        page.goto("https://www.google.com", wait_until="domcontentloaded")
+    # Live Google needs human pacing to stay clear of bot detection
+    pacing = fast_pacing() if har_mode == "replay" else human_pacing()
+    google_actions = get_google_page_actions(page, pacing=pacing)
     
     # Check for CAPTCHA before proceeding
     if google_actions["is_captcha_present"]():
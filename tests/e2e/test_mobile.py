@@ -1,10 +1,27 @@
 """Mobile-specific end-to-end tests using Playwright."""
 from typing import Dict, Any, Optional, Generator, Callable
+import asyncio
+import logging
 import pytest
 from playwright.sync_api import Page, expect, Browser, BrowserContext
-from utils.test_helpers import wait_for_network_idle
+from playwright.async_api import Browser as AsyncBrowser, Page as AsyncPage
 from config.test_config import get_base_url, get_mobile_devices, get_timeout
 from page_objects.base_page import base_page
+from utils.context_pool import open_context
+from utils.async_runner import run_on_loop
+from utils.fan_out import assert_fan_out, fan_out, format_fan_out_report
+from utils.visual_baselines import SCREENSHOT_OPTIONS
+
+logger = logging.getLogger(__name__)
+
+# Below this width the navigation collapses behind the menu toggle
+MOBILE_BREAKPOINT = 768
+
+CONTACT_FORM_VALUES = {
+    ".name-input": "Mobile User",
+    ".email-input": "mobile@example.com",
+    ".message-input": "Test from mobile",
+}
 
 def get_device_config(device_name: str) -> Dict[str, Any]:
     """Get device configuration for mobile testing.
@@ -18,19 +35,21 @@ def get_device_config(device_name: str) -> Dict[str, Any]:
     return get_mobile_devices()[device_name]
 
 @pytest.fixture
-def mobile_context(browser: Browser, request: pytest.FixtureRequest) -> Generator[BrowserContext, None, None]:
+def mobile_context(
+    browser: Browser,
+    context_pool: Optional[Dict[str, Callable]],
+    request: pytest.FixtureRequest
+) -> Generator[BrowserContext, None, None]:
     """Create a mobile browser context with specified device emulation.
 
     Args:
         browser: Playwright browser instance
+        context_pool: Context pool, or None when pooled mode is off
         request: Pytest request object containing device name
     """
     device_config = get_device_config(request.param)
-    context = browser.new_context(**device_config)
-    try:
+    with open_context(context_pool, browser, device_config) as context:
         yield context
-    finally:
-        context.close()
 
 @pytest.fixture
 def mobile_page(mobile_context: BrowserContext) -> Generator[Page, None, None]:
@@ -73,7 +92,6 @@ def test_mobile_navigation(mobile_page: Page) -> None:
     
     # Navigate to homepage and wait for load
     mobile_page.goto(get_base_url())
-    wait_for_network_idle(mobile_page)
     
     # Test menu interactions
     menu_button = ".menu-toggle"
@@ -94,72 +112,103 @@ def test_mobile_navigation(mobile_page: Page) -> None:
     page_actions["click_element"](".main")
     verify_menu_state(mobile_page, False)
 
+async def check_mobile_layout(page: AsyncPage, probe: Dict[str, Callable]) -> None:
+    """Fan-out script checking the responsive layout of the homepage on one device."""
+    with probe["timed"]("open"):
+        await page.goto(get_base_url(), wait_until="domcontentloaded")
+    with probe["timed"]("inspect"):
+        width = page.viewport_size["width"]
+        toggle_visible = await page.locator(".menu-toggle").is_visible()
+        nav_items = await page.locator(".navigation-menu .nav-item").count()
+        cards = await page.locator(".contact-card").count()
+    probe["check"]("menu toggle matches breakpoint", toggle_visible == (width <= MOBILE_BREAKPOINT),
+                   f"(width {width}, toggle visible: {toggle_visible})")
+    probe["check"]("navigation has 4 items", nav_items == 4, f"(found {nav_items})")
+    probe["check"]("contact cards rendered", cards == 3, f"(found {cards})")
+
+async def check_mobile_search(page: AsyncPage, probe: Dict[str, Callable]) -> None:
+    """Fan-out script searching from the homepage on one device."""
+    with probe["timed"]("open"):
+        await page.goto(get_base_url(), wait_until="domcontentloaded")
+    with probe["timed"]("search"):
+        await page.locator(".search-input").fill("mobile test")
+        async with page.expect_response("**/api/search?*") as response_info:
+            await page.locator(".search-button").click()
+        response = await response_info.value
+        # The summary line is rendered from the response
+        summary = page.locator(".search-results__summary")
+        await summary.wait_for(timeout=get_timeout())
+        text = await summary.inner_text()
+    probe["check"]("search API answered", response.ok, f"(status {response.status})")
+    probe["check"]("results shown", "Result" in text, f"({text!r})")
+
+async def check_mobile_form(page: AsyncPage, probe: Dict[str, Callable]) -> None:
+    """Fan-out script submitting the contact form on one device."""
+    with probe["timed"]("open"):
+        await page.goto(f"{get_base_url()}/contact", wait_until="domcontentloaded")
+    with probe["timed"]("fill"):
+        for selector, value in CONTACT_FORM_VALUES.items():
+            await page.locator(selector).fill(value)
+    with probe["timed"]("submit"):
+        async with page.expect_response("**/api/contact") as response_info:
+            await page.locator(".submit-button").click()
+        response = await response_info.value
+        await page.locator(".success-message").wait_for(timeout=get_timeout())
+    probe["check"]("contact API accepted the form", response.ok, f"(status {response.status})")
+
+def run_on_all_devices(async_loop: asyncio.AbstractEventLoop, async_browser: AsyncBrowser, script: Callable) -> None:
+    """Run a fan-out script on every mobile device, log the report and fail on any device."""
+    result = run_on_loop(async_loop, fan_out(async_browser, get_mobile_devices(), script))
+    for line in format_fan_out_report(result):
+        logger.info(line)
+    assert_fan_out(result)
+
 @pytest.mark.browser_specific
-@pytest.mark.parametrize("mobile_context", get_mobile_devices().keys(), indirect=True)
-def test_mobile_search(mobile_page: Page) -> None:
-    """Test search functionality on mobile devices.
+def test_mobile_layout_all_devices(async_loop: asyncio.AbstractEventLoop, async_browser: AsyncBrowser) -> None:
+    """Test the responsive layout on every mobile device at once.
     
-    This test verifies search works across different devices:
-    - iPhone 12
-    - Pixel 5
-    - iPad Pro
+    All device profiles open in one browser and run concurrently, so the
+    matrix takes about as long as a single device.
     """
-    page_actions = base_page(mobile_page)
-    
-    # Navigate to homepage
-    mobile_page.goto(get_base_url())
-    wait_for_network_idle(mobile_page)
-    
-    # Test search input
-    search_input = ".search-input"
-    search_button = ".search-button"
-    results_container = ".search-results"
-    
-    # Fill and submit search
-    page_actions["fill_input"](search_input, "mobile test")
-    page_actions["click_element"](search_button)
-    
-    # Wait for network idle after search
-    wait_for_network_idle(mobile_page)
-    
-    # Verify results appear
-    results = mobile_page.locator(results_container)
-    expect(results).to_contain_text("Result")
+    run_on_all_devices(async_loop, async_browser, check_mobile_layout)
 
 @pytest.mark.browser_specific
-@pytest.mark.parametrize("mobile_context", get_mobile_devices().keys(), indirect=True)
-def test_mobile_form(mobile_page: Page) -> None:
-    """Test form submission on mobile devices.
-    
-    This test verifies forms work across different devices:
-    - iPhone 12
-    - Pixel 5
-    - iPad Pro
+def test_mobile_search_all_devices(async_loop: asyncio.AbstractEventLoop, async_browser: AsyncBrowser) -> None:
+    """Test search on every mobile device at once."""
+    run_on_all_devices(async_loop, async_browser, check_mobile_search)
+
+@pytest.mark.browser_specific
+def test_mobile_form_all_devices(async_loop: asyncio.AbstractEventLoop, async_browser: AsyncBrowser) -> None:
+    """Test the contact form on every mobile device at once."""
+    run_on_all_devices(async_loop, async_browser, check_mobile_form)
+
+@pytest.mark.visual
+def test_mobile_homepage_visual(
+    async_loop: asyncio.AbstractEventLoop,
+    async_browser: AsyncBrowser,
+    assert_visual: Callable[..., Dict[str, Any]]
+) -> None:
+    """Test that the homepage on each mobile device still matches its visual baseline.
+    
+    The screenshots are taken on all devices at once and then compared one
+    by one; every mismatching device is reported. A device without a
+    baseline fails; record the baselines with --update-baselines, and rerun
+    with it after an intended design change.
     """
-    page_actions = base_page(mobile_page)
-    
-    # Navigate to contact page
-    mobile_page.goto(f"{get_base_url()}/contact")
-    wait_for_network_idle(mobile_page)
-    
-    # Fill form fields
-    form_fields: Dict[str, str] = {
-        "name": ".name-input",
-        "email": ".email-input",
-        "message": ".message-input"
-    }
-    
-    page_actions["fill_input"](form_fields["name"], "Mobile User")
-    page_actions["fill_input"](form_fields["email"], "mobile@example.com")
-    page_actions["fill_input"](form_fields["message"], "Test from mobile")
-    
-    # Submit form
-    submit_button = ".submit-button"
-    success_message = ".success-message"
-    
-    # Click submit and wait for network idle
-    page_actions["click_element"](submit_button)
-    wait_for_network_idle(mobile_page)
-    
-    # Verify success message appears
-    expect(mobile_page.locator(success_message)).to_be_visible(timeout=get_timeout())
+    screenshots: Dict[str, bytes] = {}
+
+    async def capture_homepage(page: AsyncPage, probe: Dict[str, Callable]) -> None:
+        with probe["timed"]("open"):
+            await page.goto(get_base_url())
+        with probe["timed"]("screenshot"):
+            screenshots[probe["device"]] = await page.screenshot(full_page=True, **SCREENSHOT_OPTIONS)
+
+    run_on_all_devices(async_loop, async_browser, capture_homepage)
+    failures = []
+    for device_name, screenshot in screenshots.items():
+        try:
+            assert_visual(None, "homepage", device=device_name.replace(" ", "_"), screenshot=screenshot)
+        except AssertionError as e:
+            failures.append(str(e))
+    assert not failures, "\n".join(failures)
+
@@ -7,6 +7,8 @@ import pytest
 from pytest_bdd import given, when, then, parsers
 from playwright.sync_api import Page, expect, Error as PlaywrightError
 import logging
+from page_objects.consent_resolver import DEFAULT_CONSENT_SELECTORS, resolve_consent_dialog
+from utils.readiness import expect_ready, response_ready, selector_ready, wait_until
 
 # Configure logging with descriptive format
 logging.basicConfig(
@@ -22,14 +24,9 @@ DEFAULT_EXPECT_TIMEOUT = 30000  # Increased timeout for expect operations
 RETRY_COUNT = 3  # Number of retries for network operations
 
 def wait_for_element(page: Page, selector: str, timeout: int = DEFAULT_TIMEOUT) -> None:
-    """Wait for element to be visible and stable."""
+    """Wait for element to be visible, without waiting for unrelated traffic."""
     try:
-        # Wait for network to be idle first
-        page.wait_for_load_state("networkidle", timeout=timeout)
-        page.wait_for_load_state("domcontentloaded", timeout=timeout)
-        
-        # Now wait for the element
-        page.wait_for_selector(selector, state="visible", timeout=timeout)
+        wait_until(page, f"wait for {selector}", selector_ready(selector), timeout=timeout)
     except PlaywrightError as e:
         logger.error(f"Failed to wait for element {selector}: {str(e)}")
         raise
@@ -37,26 +34,12 @@ def wait_for_element(page: Page, selector: str, timeout: int = DEFAULT_TIMEOUT)
 def handle_consent_dialog(page: Page) -> None:
     """Handle Google's consent dialog if present."""
     try:
-        consent_selectors = [
-            'button:has-text("Accept all")',
-            'button:has-text("Aceptar todo")',
-            'button:has-text("I agree")',
-            'button:has-text("Acepto")',
-            'div[role="dialog"] button:has-text("Accept")',
-            'div[role="dialog"] button:has-text("Aceptar")'
-        ]
-        
-        for selector in consent_selectors:
-            try:
-                if page.locator(selector).is_visible(timeout=5000):  # Quick check
-                    page.locator(selector).click()
-                    logger.info(f"Clicked consent button with selector: {selector}")
-                    wait_for_element(page, 'input[name="q"]')
-                    return
-            except PlaywrightError:
-                continue
-                
-        logger.info("No consent dialog found or already accepted")
+        verdict = resolve_consent_dialog(page, DEFAULT_CONSENT_SELECTORS)
+        if verdict == "accepted":
+            logger.info("Accepted consent dialog")
+            wait_for_element(page, 'input[name="q"]')
+        else:
+            logger.info(f"No consent dialog found or already accepted ({verdict})")
     except PlaywrightError as e:
         logger.warning(f"Consent dialog handling failed: {str(e)}")
 
@@ -73,7 +56,7 @@ def visit_search_page(page: Page) -> Page:
             try:
                 # Navigate and wait for initial load
                 logger.info(f"Attempt {attempt + 1} to navigate to {BASE_URL}")
-                page.goto(BASE_URL, wait_until="networkidle")
+                page.goto(BASE_URL, wait_until="domcontentloaded")
                 
                 # Wait for key elements
                 wait_for_element(page, 'input[name="q"]')
@@ -116,10 +99,16 @@ def click_search_button(search_page: Page) -> None:
         # Use more reliable button selector
         search_button = search_page.locator('input[name="btnK"], button[name="btnK"]').first
         search_button.wait_for(state="visible", timeout=DEFAULT_TIMEOUT)
-        search_button.click()
         
-        # Wait for search results
-        wait_for_element(search_page, "#search", timeout=DEFAULT_TIMEOUT)
+        # Continue as soon as the results page has arrived and rendered
+        with expect_ready(
+            search_page,
+            "click search button",
+            response_ready("**/search?*"),
+            selector_ready("#search"),
+            timeout=DEFAULT_TIMEOUT
+        ):
+            search_button.click()
         logger.info("Successfully clicked search button")
     except PlaywrightError as e:
         logger.error(f"Failed to click search button: {str(e)}")
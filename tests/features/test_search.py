@@ -20,6 +20,13 @@ from tests.features.steps.search_steps import (
     verify_page_title
 )
 
+# Start every scenario with the saved consent cookies; with --har-mode replay
+# the scenarios are served offline from tests/har/google_search
+pytestmark = [
+    pytest.mark.identity("default"),
+    pytest.mark.har("google_search", match="lenient"),
+]
+
 # Register scenarios from feature files
 FEATURE_DIR = Path(__file__).parent
 scenarios(str(FEATURE_DIR / 'search.feature'))
@@ -0,0 +1,69 @@
+"""Per-test traces, screenshots and videos kept according to the run's policy.
+
+Policies use pytest-playwright's values (off, on, retain-on-failure,
+only-on-failure) and are set by the run profile; artifacts are written under
+the --output directory in one folder per test.
+"""
+from typing import Optional
+import logging
+import os
+import re
+import pytest
+from playwright.sync_api import BrowserContext, Page, Error as PlaywrightError
+
+logger = logging.getLogger(__name__)
+
+FAILURE_POLICIES = ("retain-on-failure", "only-on-failure")
+
+
+def get_artifact_path(output_dir: str, nodeid: str, file_name: str) -> str:
+    """Get the path of an artifact in the test's own folder."""
+    folder = re.sub(r"[^A-Za-z0-9._-]+", "-", nodeid).strip("-")[:200]
+    return os.path.join(output_dir, folder, file_name)
+
+
+def should_keep(policy: str, failed: bool) -> bool:
+    """Check whether an artifact is kept under a policy."""
+    return policy == "on" or (failed and policy in FAILURE_POLICIES)
+
+
+def is_test_failed(item: pytest.Item) -> bool:
+    """Check whether the test failed in setup or call, using the reports pytest-playwright attaches."""
+    reports = (getattr(item, "rep_setup", None), getattr(item, "rep_call", None))
+    return any(report is not None and report.failed for report in reports)
+
+
+def start_tracing(context: BrowserContext, title: str) -> None:
+    """Start recording a trace with screenshots, DOM snapshots and sources."""
+    context.tracing.start(title=title, screenshots=True, snapshots=True, sources=True)
+
+
+def stop_tracing(context: BrowserContext, path: Optional[str]) -> None:
+    """Stop tracing, writing the trace only when a path is given."""
+    try:
+        if path:
+            context.tracing.stop(path=path)
+        else:
+            context.tracing.stop()
+    except PlaywrightError as e:
+        logger.warning(f"Could not stop tracing: {str(e)}")
+
+
+def capture_screenshot(page: Page, path: str) -> None:
+    """Take a screenshot of a page, ignoring pages that already crashed or closed."""
+    try:
+        page.screenshot(path=path, timeout=5000)
+    except PlaywrightError as e:
+        logger.warning(f"Could not capture screenshot: {str(e)}")
+
+
+def finish_video(page: Page, path: Optional[str]) -> None:
+    """Save a closed page's video to a path, or delete it when no path is given."""
+    if page.video is None:
+        return
+    try:
+        if path:
+            page.video.save_as(path)
+        page.video.delete()
+    except PlaywrightError as e:
+        logger.warning(f"Could not finish video: {str(e)}")
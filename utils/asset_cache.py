@@ -0,0 +1,225 @@
+"""Shared cache for static assets served through context routing.
+
+Browser contexts share no HTTP cache, so every test re-downloads the same
+fonts, stylesheets, scripts and images. The cache answers repeated GET
+requests for those resources from an in-memory LRU (with an optional on-disk
+tier) keyed by URL and the request headers that select a representation.
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import os
+import time
+from playwright.sync_api import BrowserContext, Route, Error as PlaywrightError
+
+logger = logging.getLogger(__name__)
+
+CACHEABLE_RESOURCE_TYPES = ("stylesheet", "script", "font", "image")
+
+# Request headers that change which representation a server returns
+KEY_HEADERS = ("accept", "accept-language")
+
+# Response headers that no longer describe the decoded body we replay
+DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+# Response headers never replayed from the cache: cookies belong to the test that got them
+UNSTORED_HEADERS = ("set-cookie",)
+
+# Vary values that make a response depend on more than the key headers
+UNCACHEABLE_VARY = ("*", "cookie")
+
+
+def get_cache_key(url: str, headers: Dict[str, str]) -> str:
+    """Build the cache key from the URL and the representation-selecting headers."""
+    selected = "|".join(f"{name}={headers.get(name, '')}" for name in KEY_HEADERS)
+    return f"GET {url} {selected}"
+
+
+def is_cacheable(status: int, headers: Dict[str, str]) -> bool:
+    """Check whether a response may be replayed to other tests.
+
+    Responses that set cookies or vary on cookies (or on anything, with
+    ``Vary: *``) are tied to the session that requested them.
+    """
+    cache_control = headers.get("cache-control", "").lower()
+    vary = {value.strip() for value in headers.get("vary", "").lower().split(",")}
+    return (
+        status == 200
+        and "no-store" not in cache_control
+        and "private" not in cache_control
+        and "set-cookie" not in headers
+        and not vary & set(UNCACHEABLE_VARY)
+    )
+
+
+def get_stored_headers(headers: Dict[str, str]) -> Dict[str, str]:
+    """Drop the headers that must not be replayed to other tests."""
+    return {name: value for name, value in headers.items() if name not in UNSTORED_HEADERS}
+
+
+def create_asset_cache(
+    max_bytes: int = 64 * 1024 * 1024,
+    ttl: float = 3600,
+    disk_dir: Optional[str] = None,
+    disk_max_bytes: int = 256 * 1024 * 1024
+) -> Dict[str, Callable]:
+    """
+    Returns a dictionary of actions for a static asset cache.
+
+    Args:
+        max_bytes: Memory budget for cached bodies
+        ttl: Seconds a cached response stays valid
+        disk_dir: Optional directory for the on-disk tier
+        disk_max_bytes: Budget for the on-disk tier
+
+    Returns:
+        Dict of cache functions (handle_route, attach, detach, get_stats)
+    """
+    memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    stats = {
+        "hits": 0,
+        "disk_hits": 0,
+        "misses": 0,
+        "stored": 0,
+        "evicted": 0,
+        "bytes_served": 0,
+        "memory_bytes": 0,
+    }
+
+    def get_disk_paths(key: str) -> Tuple[str, str]:
+        """Return the body and metadata file paths for a key."""
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(disk_dir, f"{digest}.body"), os.path.join(disk_dir, f"{digest}.json")
+
+    def store_in_memory(key: str, entry: Dict[str, Any]) -> None:
+        """Insert an entry and evict least recently used ones over the budget."""
+        if len(entry["body"]) > max_bytes:
+            return
+        if key in memory:
+            stats["memory_bytes"] -= len(memory.pop(key)["body"])
+        memory[key] = entry
+        stats["memory_bytes"] += len(entry["body"])
+        while stats["memory_bytes"] > max_bytes:
+            _, evicted = memory.popitem(last=False)
+            stats["memory_bytes"] -= len(evicted["body"])
+            stats["evicted"] += 1
+
+    def store_on_disk(key: str, entry: Dict[str, Any]) -> None:
+        """Write an entry to the disk tier and trim it to its budget."""
+        body_path, meta_path = get_disk_paths(key)
+        with open(body_path, "wb") as f:
+            f.write(entry["body"])
+        with open(meta_path, "w") as f:
+            json.dump({"status": entry["status"], "headers": entry["headers"], "stored_at": entry["stored_at"]}, f)
+
+        bodies = [item for item in os.scandir(disk_dir) if item.name.endswith(".body")]
+        total = sum(item.stat().st_size for item in bodies)
+        for item in sorted(bodies, key=lambda item: item.stat().st_mtime):
+            if total <= disk_max_bytes:
+                break
+            total -= item.stat().st_size
+            for path in (item.path, item.path[:-len(".body")] + ".json"):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def load_from_disk(key: str) -> Optional[Dict[str, Any]]:
+        """Read a still valid entry from the disk tier."""
+        body_path, meta_path = get_disk_paths(key)
+        try:
+            with open(meta_path, "r") as f:
+                entry = json.load(f)
+            if time.time() - entry["stored_at"] > ttl:
+                return None
+            entry["headers"] = get_stored_headers(entry["headers"])
+            with open(body_path, "rb") as f:
+                entry["body"] = f.read()
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def lookup(key: str) -> Optional[Dict[str, Any]]:
+        """Find a valid entry in memory, then on disk."""
+        entry = memory.get(key)
+        if entry is not None:
+            if time.time() - entry["stored_at"] <= ttl:
+                memory.move_to_end(key)
+                stats["hits"] += 1
+                return entry
+            stats["memory_bytes"] -= len(memory.pop(key)["body"])
+        if disk_dir:
+            entry = load_from_disk(key)
+            if entry is not None:
+                store_in_memory(key, entry)
+                stats["disk_hits"] += 1
+                return entry
+        return None
+
+    def handle_route(route: Route) -> None:
+        """Serve cacheable requests from the cache and pass everything else on."""
+        request = route.request
+        if request.method != "GET" or request.resource_type not in CACHEABLE_RESOURCE_TYPES:
+            route.fallback()
+            return
+
+        key = get_cache_key(request.url, request.headers)
+        entry = lookup(key)
+        if entry is not None:
+            stats["bytes_served"] += len(entry["body"])
+            route.fulfill(status=entry["status"], headers=entry["headers"], body=entry["body"])
+            return
+
+        stats["misses"] += 1
+        try:
+            response = route.fetch()
+            body = response.body()
+        except PlaywrightError as e:
+            logger.warning(f"Asset cache could not fetch {request.url}: {str(e)}")
+            route.fallback()
+            return
+
+        headers = {name: value for name, value in response.headers.items() if name not in DROPPED_HEADERS}
+        if is_cacheable(response.status, headers):
+            entry = {"status": response.status, "headers": get_stored_headers(headers), "body": body, "stored_at": time.time()}
+            store_in_memory(key, entry)
+            if disk_dir:
+                store_on_disk(key, entry)
+            stats["stored"] += 1
+        route.fulfill(status=response.status, headers=headers, body=body)
+
+    def attach(context: BrowserContext) -> None:
+        """Start serving the context's static assets through the cache."""
+        context.route("**/*", handle_route)
+
+    def detach(context: BrowserContext) -> None:
+        """Stop routing the context through the cache."""
+        context.unroute("**/*", handle_route)
+
+    def get_stats() -> Dict[str, int]:
+        """Return a snapshot of the cache counters."""
+        return dict(stats, entries=len(memory))
+
+    if disk_dir:
+        os.makedirs(disk_dir, exist_ok=True)
+
+    return {
+        "handle_route": handle_route,
+        "attach": attach,
+        "detach": detach,
+        "get_stats": get_stats,
+    }
+
+
+def format_cache_stats(stats: Dict[str, int]) -> List[str]:
+    """Format cache counters as lines for the run summary."""
+    lookups = stats["hits"] + stats["disk_hits"] + stats["misses"]
+    hit_rate = (stats["hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+    return [
+        f"hits: {stats['hits']} memory, {stats['disk_hits']} disk, misses: {stats['misses']} "
+        f"(hit rate {hit_rate:.0%})",
+        f"served from cache: {stats['bytes_served'] / 1024:.0f} KiB, "
+        f"entries: {stats['entries']} ({stats['memory_bytes'] / 1024:.0f} KiB), evicted: {stats['evicted']}",
+    ]
@@ -0,0 +1,188 @@
+"""Run independent async Playwright tests concurrently on one event loop.
+
+The sync fixtures drive one page at a time, so a worker's browser sits idle
+while a test waits on the network. Tests written as coroutine functions that
+take an ``async_page`` argument can instead be run side by side: each gets its
+own context in a shared browser and a semaphore bounds how many run at once.
+
+    python -m utils.async_runner tests/e2e/test_app_async.py --concurrency 4
+
+Under pytest the same tests run one at a time through the async fixtures in
+conftest.py; the runner is for throughput, pytest for reporting.
+"""
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional, Tuple
+from contextlib import asynccontextmanager
+import argparse
+import asyncio
+import importlib.util
+import inspect
+import os
+import sys
+import threading
+import time
+from playwright.async_api import Browser, Page, async_playwright
+from config.test_config import get_viewport_size
+
+AsyncTest = Callable[[Page], Awaitable[None]]
+
+DEFAULT_CONCURRENCY = 4
+
+
+def start_event_loop() -> Tuple[asyncio.AbstractEventLoop, threading.Thread]:
+    """Run a new event loop in a daemon thread.
+
+    A separate thread keeps the async API clear of the event loop the sync
+    API runs in the main thread, so both can be used in one session.
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="async-playwright", daemon=True)
+    thread.start()
+    return loop, thread
+
+
+def run_on_loop(loop: asyncio.AbstractEventLoop, coroutine: Awaitable[Any]) -> Any:
+    """Run a coroutine on the loop thread and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+
+def stop_event_loop(loop: asyncio.AbstractEventLoop, thread: threading.Thread) -> None:
+    """Stop the loop thread and close the loop."""
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+@asynccontextmanager
+async def launch_browser(browser_name: str = "chromium", **launch_args: Any) -> AsyncGenerator[Browser, None]:
+    """Start Playwright and launch one browser shared by all tests."""
+    async with async_playwright() as playwright:
+        browser = await playwright[browser_name].launch(**launch_args)
+        try:
+            yield browser
+        finally:
+            await browser.close()
+
+
+@asynccontextmanager
+async def open_page(browser: Browser, context_args: Optional[Dict[str, Any]] = None) -> AsyncGenerator[Page, None]:
+    """Open a page in a fresh context and close the context afterwards."""
+    context = await browser.new_context(**(context_args or {}))
+    try:
+        yield await context.new_page()
+    finally:
+        await context.close()
+
+
+async def run_test(
+    browser: Browser,
+    name: str,
+    test: AsyncTest,
+    semaphore: asyncio.Semaphore,
+    context_args: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Run one test in its own context once the semaphore admits it."""
+    async with semaphore:
+        started = time.perf_counter()
+        error = None
+        try:
+            async with open_page(browser, context_args) as page:
+                await test(page)
+        except Exception as e:
+            error = f"{type(e).__name__}: {str(e)}"
+        return {
+            "name": name,
+            "passed": error is None,
+            "error": error,
+            "duration": time.perf_counter() - started,
+        }
+
+
+async def run_concurrently(
+    browser: Browser,
+    tests: Dict[str, AsyncTest],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    context_args: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Run tests side by side in one browser.
+
+    Args:
+        browser: Shared async browser
+        tests: Test coroutine functions by name, each taking a page
+        concurrency: Maximum number of tests running at once
+        context_args: Arguments for each test's browser context
+
+    Returns:
+        Per-test results (name, passed, error, duration) in the order given
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    return list(await asyncio.gather(*(
+        run_test(browser, name, test, semaphore, context_args)
+        for name, test in tests.items()
+    )))
+
+
+def collect_async_tests(path: str) -> Dict[str, AsyncTest]:
+    """Import a test module and return its async tests that take only async_page.
+
+    Parametrized tests and tests needing other fixtures are left to pytest.
+    """
+    module_name = os.path.splitext(os.path.relpath(path))[0].replace(os.sep, ".")
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return {
+        f"{path}::{name}": function
+        for name, function in inspect.getmembers(module, inspect.iscoroutinefunction)
+        if name.startswith("test_")
+        and list(inspect.signature(function).parameters) == ["async_page"]
+        and not hasattr(function, "pytestmark")
+    }
+
+
+def format_run_summary(results: List[Dict[str, Any]], wall_time: float) -> List[str]:
+    """Format pass/fail counts, throughput and failures as summary lines."""
+    passed = sum(1 for result in results if result["passed"])
+    throughput = len(results) / wall_time * 60 if wall_time else 0.0
+    lines = [
+        f"{passed} passed, {len(results) - passed} failed in {wall_time:.2f}s "
+        f"({throughput:.1f} tests/minute)"
+    ]
+    lines += [f"FAILED {result['name']} - {result['error']}" for result in results if not result["passed"]]
+    return lines
+
+
+async def run_paths(
+    paths: List[str],
+    concurrency: int,
+    browser_name: str,
+    headless: bool
+) -> Tuple[List[Dict[str, Any]], float]:
+    """Collect the async tests of several modules and run them concurrently."""
+    tests: Dict[str, AsyncTest] = {}
+    for path in paths:
+        tests.update(collect_async_tests(path))
+    context_args = {"viewport": get_viewport_size(), "ignore_https_errors": True}
+    async with launch_browser(browser_name, headless=headless) as browser:
+        started = time.perf_counter()
+        results = await run_concurrently(browser, tests, concurrency, context_args)
+        return results, time.perf_counter() - started
+
+
+def main() -> None:
+    """Run async test modules concurrently and exit non-zero on failures."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", help="Test modules containing async tests")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--browser", default="chromium", choices=("chromium", "firefox", "webkit"))
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+
+    results, wall_time = asyncio.run(run_paths(args.paths, args.concurrency, args.browser, not args.headed))
+    for line in format_run_summary(results, wall_time):
+        print(line)
+    sys.exit(0 if all(result["passed"] for result in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
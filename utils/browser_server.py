@@ -0,0 +1,269 @@
+"""Long-lived local browser servers that pytest runs connect to.
+
+Launching the browser is most of the startup cost of a short pytest run.
+A browser server is launched once with ``playwright launch-server`` and kept
+running between invocations; fixtures connect to it with
+``browser_type.connect`` instead of launching. There is one server per
+browser and headed/headless mode, described by a state file under
+reports/browser_server/. A server found dead or unreachable is restarted the
+next time it is needed.
+
+    python -m utils.browser_server start [--browser chromium] [--headed]
+    python -m utils.browser_server status
+    python -m utils.browser_server stop [--browser chromium] [--headed]
+"""
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+import argparse
+import json
+import logging
+import os
+import secrets
+import signal
+import socket
+import subprocess
+import sys
+import time
+from playwright.sync_api import Browser, Playwright, Error as PlaywrightError
+
+logger = logging.getLogger(__name__)
+
+SERVER_DIR = os.path.join("reports", "browser_server")
+START_TIMEOUT = 30.0
+LOCK_STALE_AFTER = 60.0
+
+
+def get_server_name(browser_name: str, headless: bool) -> str:
+    """Name of the server for a browser and mode, e.g. chromium-headless."""
+    return f"{browser_name}-{'headless' if headless else 'headed'}"
+
+
+def get_state_path(browser_name: str, headless: bool) -> str:
+    """Get the state file of a server."""
+    return os.path.join(SERVER_DIR, f"{get_server_name(browser_name, headless)}.json")
+
+
+def read_state_file(path: str) -> Optional[Dict[str, Any]]:
+    """Load a state file, returning None when it is missing, half-written or not a state."""
+    try:
+        with open(path, "r") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def write_state_file(path: str, state: Dict[str, Any]) -> None:
+    """Write a state file atomically so readers never see it half-written."""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(state, f, indent=2)
+    os.replace(temp_path, path)
+
+
+def read_server_state(browser_name: str, headless: bool) -> Optional[Dict[str, Any]]:
+    """Load a server's state file, returning None when there is none."""
+    return read_state_file(get_state_path(browser_name, headless))
+
+
+def is_process_alive(pid: int) -> bool:
+    """Check whether a process still exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def is_server_healthy(state: Optional[Dict[str, Any]], timeout: float = 1.0) -> bool:
+    """Check that the server process is alive and accepts connections on its port."""
+    if not state or not is_process_alive(state["pid"]):
+        return False
+    try:
+        with socket.create_connection(("127.0.0.1", state["port"]), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def start_server(browser_name: str = "chromium", headless: bool = True, port: int = 0) -> Dict[str, Any]:
+    """
+    Launch a detached browser server and wait until it accepts connections.
+
+    Args:
+        browser_name: chromium, firefox or webkit
+        headless: Launch the browser headless
+        port: Port to listen on, 0 picks a free one
+
+    Returns:
+        Server state (pid, port, ws_endpoint, browser, headless, started_at)
+    """
+    os.makedirs(SERVER_DIR, exist_ok=True)
+    name = get_server_name(browser_name, headless)
+    config_path = os.path.join(SERVER_DIR, f"{name}.config.json")
+    log_path = os.path.join(SERVER_DIR, f"{name}.log")
+    with open(config_path, "w") as f:
+        # A random path keeps other local processes from driving the browser by accident
+        json.dump({"headless": headless, "port": port, "wsPath": f"/{secrets.token_hex(8)}"}, f)
+
+    with open(log_path, "w") as log:
+        process = subprocess.Popen(
+            [sys.executable, "-m", "playwright", "launch-server", "--browser", browser_name, "--config", config_path],
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
+            start_new_session=True
+        )
+
+    deadline = time.monotonic() + START_TIMEOUT
+    ws_endpoint = None
+    while ws_endpoint is None:
+        if process.poll() is not None or time.monotonic() > deadline:
+            with open(log_path, "r") as f:
+                output = f.read().strip()
+            if process.poll() is None:
+                os.killpg(process.pid, signal.SIGTERM)
+            raise RuntimeError(f"Browser server {name} failed to start: {output or 'no output'}")
+        with open(log_path, "r") as f:
+            ws_endpoint = next((line.strip() for line in f if line.startswith("ws://")), None)
+        if ws_endpoint is None:
+            time.sleep(0.1)
+
+    state = {
+        "pid": process.pid,
+        "port": urlsplit(ws_endpoint).port,
+        "ws_endpoint": ws_endpoint,
+        "browser": browser_name,
+        "headless": headless,
+        "started_at": time.time(),
+    }
+    write_state_file(get_state_path(browser_name, headless), state)
+    logger.info(f"Started browser server {name} at {ws_endpoint} (pid {process.pid})")
+    return state
+
+
+def stop_server(browser_name: str = "chromium", headless: bool = True) -> bool:
+    """Stop a server and remove its state file; returns whether one was running."""
+    state = read_server_state(browser_name, headless)
+    if state is None:
+        return False
+    running = is_process_alive(state["pid"])
+    if running:
+        try:
+            os.killpg(state["pid"], signal.SIGTERM)
+        except ProcessLookupError:
+            running = False
+        deadline = time.monotonic() + 5
+        while running and is_process_alive(state["pid"]) and time.monotonic() < deadline:
+            time.sleep(0.1)
+    try:
+        os.remove(get_state_path(browser_name, headless))
+    except OSError:
+        pass
+    return running
+
+
+def acquire_lock(path: str, timeout: float = START_TIMEOUT) -> None:
+    """Take an exclusive lock file so parallel workers start only one server."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(path) > LOCK_STALE_AFTER:
+                    os.remove(path)
+                    continue
+            except OSError:
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Timed out waiting for {path}")
+            time.sleep(0.1)
+
+
+def ensure_server(browser_name: str = "chromium", headless: bool = True, port: int = 0) -> Dict[str, Any]:
+    """Return a healthy server, starting or restarting it when needed."""
+    state = read_server_state(browser_name, headless)
+    if is_server_healthy(state):
+        return state
+
+    os.makedirs(SERVER_DIR, exist_ok=True)
+    lock_path = os.path.join(SERVER_DIR, f"{get_server_name(browser_name, headless)}.lock")
+    acquire_lock(lock_path)
+    try:
+        # Another worker may have started it while we waited for the lock
+        state = read_server_state(browser_name, headless)
+        if is_server_healthy(state):
+            return state
+        if state is not None:
+            logger.warning(f"Browser server {get_server_name(browser_name, headless)} is not healthy, restarting")
+            stop_server(browser_name, headless)
+        return start_server(browser_name, headless, port)
+    finally:
+        os.remove(lock_path)
+
+
+def connect_browser(
+    playwright: Playwright,
+    browser_name: str = "chromium",
+    headless: bool = True,
+    **connect_args: Any
+) -> Browser:
+    """Connect to the server for a browser and mode, restarting it once if the connection fails."""
+    state = ensure_server(browser_name, headless)
+    try:
+        return playwright[browser_name].connect(state["ws_endpoint"], **connect_args)
+    except PlaywrightError as e:
+        logger.warning(f"Could not connect to browser server: {str(e)}")
+        stop_server(browser_name, headless)
+        state = ensure_server(browser_name, headless)
+        return playwright[browser_name].connect(state["ws_endpoint"], **connect_args)
+
+
+def list_servers() -> List[Dict[str, Any]]:
+    """Return the state of every known server with its health, skipping unreadable state files."""
+    if not os.path.isdir(SERVER_DIR):
+        return []
+    servers = []
+    for name in sorted(os.listdir(SERVER_DIR)):
+        if name.endswith(".json") and not name.endswith(".config.json"):
+            state = read_state_file(os.path.join(SERVER_DIR, name))
+            if state is None:
+                logger.warning(f"Skipping unreadable browser server state {name}")
+                continue
+            servers.append(dict(state, healthy=is_server_healthy(state)))
+    return servers
+
+
+def main() -> None:
+    """Start, stop or report the status of browser servers."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=("start", "stop", "restart", "status"))
+    parser.add_argument("--browser", default="chromium", choices=("chromium", "firefox", "webkit"))
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--port", type=int, default=0)
+    args = parser.parse_args()
+    headless = not args.headed
+
+    if args.command in ("stop", "restart"):
+        stopped = stop_server(args.browser, headless)
+        print(f"{get_server_name(args.browser, headless)}: {'stopped' if stopped else 'not running'}")
+    if args.command in ("start", "restart"):
+        state = ensure_server(args.browser, headless, args.port)
+        print(f"{get_server_name(args.browser, headless)}: running at {state['ws_endpoint']} (pid {state['pid']})")
+    if args.command == "status":
+        servers = list_servers()
+        if not servers:
+            print("No browser servers")
+        for state in servers:
+            health = "healthy" if state["healthy"] else "not responding"
+            print(f"{get_server_name(state['browser'], state['headless'])}: {health}, "
+                  f"pid {state['pid']}, {state['ws_endpoint']}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main()
@@ -0,0 +1,223 @@
+"""Bounded pool of warm browser contexts reused across tests.
+
+Between leases a context is reset: its pages are closed after their origins'
+local and session storage, IndexedDB databases, CacheStorage entries and
+service worker registrations are cleared, and cookies, permissions, routes,
+headers and emulation are restored. Storage of origins the test navigated
+away from is not reachable from the remaining pages and survives the reset;
+tests that need a guaranteed empty profile are marked clean_storage and get a
+fresh context instead of a pooled one.
+"""
+from typing import Any, Callable, Dict, Generator, List, Optional
+from contextlib import contextmanager
+import json
+import logging
+from playwright.sync_api import Browser, BrowserContext, Error as PlaywrightError
+
+logger = logging.getLogger(__name__)
+
+# Playwright's default action/navigation timeout, restored on reset
+DEFAULT_CONTEXT_TIMEOUT = 30000
+
+# Clears every storage the current origin can reach; each step may be
+# unsupported (indexedDB.databases in older Firefox) or denied (opaque origins)
+CLEAR_WEB_STORAGE_SCRIPT = """async () => {
+    try { window.localStorage.clear(); } catch (e) {}
+    try { window.sessionStorage.clear(); } catch (e) {}
+    try {
+        const databases = await indexedDB.databases();
+        await Promise.all(databases.map(db => new Promise(resolve => {
+            const request = indexedDB.deleteDatabase(db.name);
+            request.onsuccess = request.onerror = request.onblocked = resolve;
+        })));
+    } catch (e) {}
+    try {
+        const names = await caches.keys();
+        await Promise.all(names.map(name => caches.delete(name)));
+    } catch (e) {}
+    try {
+        const registrations = await navigator.serviceWorker.getRegistrations();
+        await Promise.all(registrations.map(registration => registration.unregister()));
+    } catch (e) {}
+}"""
+
+
+def get_profile_key(browser: Browser, context_args: Dict[str, Any]) -> str:
+    """Build the pool key for a browser instance and a context profile."""
+    args = json.dumps(context_args, sort_keys=True, default=str)
+    return f"{browser.browser_type.name}:{id(browser)}:{args}"
+
+
+def find_context_leaks(context: BrowserContext) -> List[str]:
+    """Return the kinds of state still present in a context after reset."""
+    leaks = []
+    if context.pages:
+        leaks.append("pages")
+    state = context.storage_state()
+    if state["cookies"]:
+        leaks.append("cookies")
+    if state["origins"]:
+        leaks.append("local_storage")
+    # Only Chromium reports service workers; an unregistered worker still running is evicted too
+    if getattr(context, "service_workers", None):
+        leaks.append("service_workers")
+    return leaks
+
+
+def reset_context(context: BrowserContext, context_args: Dict[str, Any]) -> None:
+    """Return a context to the state it had right after creation."""
+    for page in list(context.pages):
+        try:
+            for frame in page.frames:
+                frame.evaluate(CLEAR_WEB_STORAGE_SCRIPT)
+        except PlaywrightError:
+            # Detached frames or opaque origins have no storage to clear
+            pass
+        page.close()
+
+    context.clear_cookies()
+    context.clear_permissions()
+    context.unroute_all(behavior="ignoreErrors")
+    context.set_extra_http_headers(context_args.get("extra_http_headers", {}))
+    context.set_geolocation(context_args.get("geolocation"))
+    context.set_offline(context_args.get("offline", False))
+    context.set_default_timeout(DEFAULT_CONTEXT_TIMEOUT)
+    context.set_default_navigation_timeout(DEFAULT_CONTEXT_TIMEOUT)
+
+    # Permissions granted at creation time are part of the profile
+    if context_args.get("permissions"):
+        context.grant_permissions(context_args["permissions"])
+
+
+def create_context_pool(max_size: int = 4, max_reuses: int = 50) -> Dict[str, Callable]:
+    """
+    Returns a dictionary of actions for a pool of reusable browser contexts.
+
+    Contexts are grouped by browser and context arguments, so a device profile
+    only ever receives contexts created with its own emulation settings.
+
+    Args:
+        max_size: Maximum number of idle contexts kept per profile
+        max_reuses: Number of leases after which a context is evicted
+
+    Returns:
+        Dict of pool functions (acquire, release, close_all, get_metrics)
+    """
+    idle: Dict[str, List[BrowserContext]] = {}
+    leases: Dict[int, int] = {}
+    metrics = {
+        "acquired": 0,
+        "reused": 0,
+        "created": 0,
+        "isolation_verified": 0,
+        "evicted_max_reuses": 0,
+        "evicted_leak": 0,
+        "evicted_pool_full": 0,
+    }
+
+    def discard(context: BrowserContext) -> None:
+        """Close a context and forget its lease count."""
+        leases.pop(id(context), None)
+        try:
+            context.close()
+        except PlaywrightError as e:
+            logger.warning(f"Failed to close pooled context: {str(e)}")
+
+    def acquire(browser: Browser, context_args: Dict[str, Any]) -> BrowserContext:
+        """Hand out a warm context for the profile, creating one on a miss."""
+        metrics["acquired"] += 1
+        contexts = idle.get(get_profile_key(browser, context_args), [])
+        while contexts:
+            context = contexts.pop()
+            if browser.is_connected():
+                metrics["reused"] += 1
+                return context
+            discard(context)
+
+        metrics["created"] += 1
+        context = browser.new_context(**context_args)
+        leases[id(context)] = 0
+        return context
+
+    def release(browser: Browser, context_args: Dict[str, Any], context: BrowserContext) -> None:
+        """Reset a context and return it to the pool, evicting it if needed."""
+        leases[id(context)] = leases.get(id(context), 0) + 1
+        try:
+            reset_context(context, context_args)
+            leaks = find_context_leaks(context)
+        except PlaywrightError as e:
+            leaks = [f"reset failed: {str(e)}"]
+
+        if leaks:
+            logger.warning(f"Evicting pooled context, state leaked after reset: {', '.join(leaks)}")
+            metrics["evicted_leak"] += 1
+            discard(context)
+            return
+
+        metrics["isolation_verified"] += 1
+        if leases[id(context)] >= max_reuses:
+            metrics["evicted_max_reuses"] += 1
+            discard(context)
+            return
+
+        contexts = idle.setdefault(get_profile_key(browser, context_args), [])
+        if len(contexts) >= max_size:
+            metrics["evicted_pool_full"] += 1
+            discard(context)
+            return
+        contexts.append(context)
+
+    def close_all() -> None:
+        """Close every idle context in the pool."""
+        for contexts in idle.values():
+            for context in contexts:
+                discard(context)
+        idle.clear()
+
+    def get_metrics() -> Dict[str, int]:
+        """Return a snapshot of the pool counters."""
+        snapshot = dict(metrics)
+        snapshot["missed"] = metrics["created"]
+        snapshot["idle"] = sum(len(contexts) for contexts in idle.values())
+        return snapshot
+
+    return {
+        "acquire": acquire,
+        "release": release,
+        "close_all": close_all,
+        "get_metrics": get_metrics,
+    }
+
+
+@contextmanager
+def open_context(
+    pool: Optional[Dict[str, Callable]],
+    browser: Browser,
+    context_args: Dict[str, Any]
+) -> Generator[BrowserContext, None, None]:
+    """Lease a context from the pool, or create a fresh one when pooling is off."""
+    if pool is None:
+        context = browser.new_context(**context_args)
+        try:
+            yield context
+        finally:
+            context.close()
+        return
+
+    context = pool["acquire"](browser, context_args)
+    try:
+        yield context
+    finally:
+        pool["release"](browser, context_args, context)
+
+
+def format_pool_metrics(metrics: Dict[str, int]) -> List[str]:
+    """Format pool counters as lines for the run summary."""
+    acquired = metrics["acquired"] or 1
+    return [
+        f"leases: {metrics['acquired']}, reused: {metrics['reused']}, "
+        f"missed: {metrics['missed']} (reuse rate {metrics['reused'] / acquired:.0%})",
+        f"isolation verified: {metrics['isolation_verified']}/{metrics['acquired']} leases",
+        f"evicted: {metrics['evicted_max_reuses']} max reuses, "
+        f"{metrics['evicted_leak']} leaks, {metrics['evicted_pool_full']} pool full",
+    ]
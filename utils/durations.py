@@ -0,0 +1,82 @@
+"""Per-test duration history used to plan sharded runs.
+
+Durations are stored as an exponentially weighted moving average per test,
+keyed by node id, browser and device profile, so a single slow run does not
+dominate the estimate and the same test on different browsers or devices is
+tracked separately.
+"""
+from typing import Any, Dict, Iterable, List
+import json
+import os
+import statistics
+import pytest
+from config.test_config import get_mobile_devices
+
+DURATIONS_PATH = os.path.join("reports", "durations.json")
+DURATIONS_VERSION = 1
+
+# Assumed duration for tests that have never been recorded
+DEFAULT_DURATION = 1.0
+
+# Weight of the latest run in the moving average
+SMOOTHING = 0.3
+
+DEFAULT_BROWSER = "chromium"
+DEFAULT_DEVICE = "desktop"
+
+
+def get_duration_key(item: pytest.Item) -> str:
+    """Build the history key for a collected test.
+
+    Args:
+        item: Collected pytest item
+
+    Returns:
+        Key combining node id, browser name and device profile
+    """
+    params: Dict[str, Any] = getattr(getattr(item, "callspec", None), "params", {})
+    browser = params.get("browser_name", DEFAULT_BROWSER)
+    devices = get_mobile_devices()
+    device = next(
+        (value for value in params.values() if isinstance(value, str) and value in devices),
+        DEFAULT_DEVICE
+    )
+    return f"{item.nodeid}|{browser}|{device}"
+
+
+def load_durations(path: str = DURATIONS_PATH) -> Dict[str, List[float]]:
+    """Load the history as [average seconds, sample count] keyed by test key."""
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != DURATIONS_VERSION:
+        return {}
+    return data["tests"]
+
+
+def save_durations(durations: Dict[str, float], path: str = DURATIONS_PATH) -> None:
+    """Fold the durations of a run into the history file.
+
+    Args:
+        durations: Measured seconds keyed by test key
+        path: History file location
+    """
+    history = load_durations(path)
+    for key, seconds in durations.items():
+        average, samples = history.get(key, [seconds, 0])
+        history[key] = [round(average + SMOOTHING * (seconds - average), 4), samples + 1]
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"version": DURATIONS_VERSION, "tests": history}, f, separators=(",", ":"), sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def estimate_durations(keys: Iterable[str], history: Dict[str, List[float]]) -> Dict[str, float]:
+    """Return an expected duration per key, using the median for unseen tests."""
+    averages = [average for average, _ in history.values()]
+    fallback = statistics.median(averages) if averages else DEFAULT_DURATION
+    return {key: history[key][0] if key in history else fallback for key in keys}
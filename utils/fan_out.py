@@ -0,0 +1,136 @@
+"""Run one action script on several device profiles at once.
+
+Each device gets its own context in a shared async browser and all of them
+run the script concurrently, so a device matrix costs about as much as its
+slowest device instead of the sum of all. Scripts record soft checks and
+step timings through a per-device probe; failures are gathered across
+devices and raised together by assert_fan_out.
+
+    async def script(page, probe):
+        with probe["timed"]("open"):
+            await page.goto(base_url)
+        probe["check"]("menu toggle shown", await page.locator(".menu-toggle").is_visible())
+
+    result = run_on_loop(async_loop, fan_out(async_browser, get_mobile_devices(), script))
+    assert_fan_out(result)
+"""
+from typing import Any, Awaitable, Callable, Dict, Generator, List, Optional
+from contextlib import contextmanager
+import asyncio
+import time
+from playwright.async_api import Browser, Page
+
+FanOutScript = Callable[[Page, Dict[str, Callable]], Awaitable[None]]
+
+
+def create_probe(device: str = "") -> Dict[str, Any]:
+    """
+    Returns the per-device probe handed to a fan-out script.
+
+    Args:
+        device: Name of the device profile the script runs on
+
+    Returns:
+        Dict with the device name, check and timed functions and the checks and timings they record
+    """
+    checks: List[Dict[str, Any]] = []
+    timings: Dict[str, float] = {}
+
+    def check(name: str, condition: bool, detail: str = "") -> bool:
+        """Record a soft assertion and return its outcome."""
+        checks.append({"name": name, "passed": bool(condition), "detail": detail})
+        return bool(condition)
+
+    @contextmanager
+    def timed(step: str) -> Generator[None, None, None]:
+        """Time the awaited calls of a step in milliseconds."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            timings[step] = timings.get(step, 0.0) + (time.perf_counter() - started) * 1000
+
+    return {
+        "device": device,
+        "check": check,
+        "timed": timed,
+        "checks": checks,
+        "timings": timings,
+    }
+
+
+async def run_device(
+    browser: Browser,
+    device_name: str,
+    context_args: Dict[str, Any],
+    script: FanOutScript
+) -> Dict[str, Any]:
+    """Run the script in a fresh context emulating one device."""
+    probe = create_probe(device_name)
+    started = time.perf_counter()
+    error = None
+    context = await browser.new_context(**context_args)
+    try:
+        await script(await context.new_page(), probe)
+    except Exception as e:
+        error = f"{type(e).__name__}: {str(e)}"
+    finally:
+        await context.close()
+    return {
+        "device": device_name,
+        "passed": error is None and all(check["passed"] for check in probe["checks"]),
+        "error": error,
+        "checks": probe["checks"],
+        "timings": probe["timings"],
+        "duration": (time.perf_counter() - started) * 1000,
+    }
+
+
+async def fan_out(
+    browser: Browser,
+    devices: Dict[str, Dict[str, Any]],
+    script: FanOutScript,
+    context_args: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Run a script on every device profile concurrently.
+
+    Args:
+        browser: Shared async browser
+        devices: Context arguments per device name, e.g. get_mobile_devices()
+        script: Coroutine function taking the device's page and its probe
+        context_args: Extra context arguments applied to every device
+
+    Returns:
+        Dict with per-device results, overall pass flag and wall time in milliseconds
+    """
+    started = time.perf_counter()
+    results = await asyncio.gather(*(
+        run_device(browser, name, {**(context_args or {}), **config}, script)
+        for name, config in devices.items()
+    ))
+    return {
+        "devices": {result["device"]: result for result in results},
+        "passed": all(result["passed"] for result in results),
+        "duration": (time.perf_counter() - started) * 1000,
+    }
+
+
+def format_fan_out_report(result: Dict[str, Any]) -> List[str]:
+    """Format per-device outcomes and timings as report lines."""
+    lines = [f"fan-out over {len(result['devices'])} devices in {result['duration']:.0f} ms"]
+    for name, device in result["devices"].items():
+        steps = ", ".join(f"{step} {elapsed:.0f} ms" for step, elapsed in device["timings"].items())
+        lines.append(f"{name}: {'passed' if device['passed'] else 'FAILED'} in {device['duration']:.0f} ms ({steps})")
+        if device["error"]:
+            lines.append(f"    error: {device['error']}")
+        for check in device["checks"]:
+            if not check["passed"]:
+                lines.append(f"    failed check: {check['name']} {check['detail']}".rstrip())
+    return lines
+
+
+def assert_fan_out(result: Dict[str, Any]) -> None:
+    """Raise one AssertionError describing every failed device."""
+    if not result["passed"]:
+        raise AssertionError("\n".join(format_fan_out_report(result)))
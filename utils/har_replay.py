@@ -0,0 +1,190 @@
+"""Record network traffic of a scenario and replay it offline through routing.
+
+Archives are gzip-compressed JSON files holding one entry per request with
+response bodies stored once per content hash. In replay mode every request is
+answered from the archive; requests without a recorded response are aborted
+and reported as unmatched, so a replayed test never touches the network.
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+from playwright.sync_api import Page, Route, Error as PlaywrightError
+
+logger = logging.getLogger(__name__)
+
+HAR_DIR = os.path.join("tests", "har")
+ARCHIVE_VERSION = 1
+
+# Query parameters that still identify a request in lenient matching
+LENIENT_QUERY_KEYS = ("q", "start", "num", "hl", "tbm")
+
+# Response headers that no longer describe the decoded body we replay
+DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+def get_archive_path(group: str, test_name: str) -> str:
+    """Get the archive file for a test within a group of recordings."""
+    safe_name = "".join(char if char.isalnum() or char in "-_" else "_" for char in test_name)
+    return os.path.join(HAR_DIR, group, f"{safe_name}.json.gz")
+
+
+def get_strict_key(method: str, url: str, post_data: Optional[bytes]) -> str:
+    """Match on method, full URL and request body."""
+    body_hash = hashlib.sha1(post_data).hexdigest() if post_data else ""
+    return f"{method} {url} {body_hash}"
+
+
+def get_lenient_key(method: str, url: str) -> str:
+    """Match on method, origin, path and the identifying query parameters only."""
+    parts = urlsplit(url)
+    query = sorted((key, value) for key, value in parse_qsl(parts.query) if key in LENIENT_QUERY_KEYS)
+    return f"{method} {parts.scheme}://{parts.netloc}{parts.path}?{urlencode(query)}"
+
+
+def load_archive(path: str) -> Dict[str, Any]:
+    """Load an archive written by create_recorder."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        archive = json.load(f)
+    if archive.get("version") != ARCHIVE_VERSION:
+        raise ValueError(f"Unsupported HAR archive version in {path}")
+    return archive
+
+
+def save_archive(archive: Dict[str, Any], path: str) -> None:
+    """Write an archive as compact gzip-compressed JSON."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(archive, f, separators=(",", ":"))
+
+
+def create_recorder(page: Page) -> Dict[str, Callable]:
+    """
+    Returns a dictionary of actions that record a page's network traffic.
+
+    Args:
+        page: Page whose requests are routed through the recorder
+
+    Returns:
+        Dict of recorder functions (start, stop, save)
+    """
+    entries: List[Dict[str, Any]] = []
+    bodies: Dict[str, str] = {}
+
+    def handle_route(route: Route) -> None:
+        """Fetch the real response, keep a copy and pass it to the page."""
+        request = route.request
+        try:
+            response = route.fetch()
+            body = response.body()
+        except PlaywrightError as e:
+            logger.warning(f"Could not record {request.url}: {str(e)}")
+            route.abort()
+            return
+
+        body_hash = hashlib.sha1(body).hexdigest()
+        bodies.setdefault(body_hash, base64.b64encode(body).decode("ascii"))
+        headers = {name: value for name, value in response.headers.items() if name not in DROPPED_HEADERS}
+        entries.append({
+            "method": request.method,
+            "url": request.url,
+            "post_data": hashlib.sha1(request.post_data_buffer).hexdigest() if request.post_data_buffer else "",
+            "status": response.status,
+            "headers": headers,
+            "body": body_hash,
+        })
+        route.fulfill(status=response.status, headers=headers, body=body)
+
+    def start() -> None:
+        """Begin routing the page through the recorder."""
+        page.route("**/*", handle_route)
+
+    def stop() -> None:
+        """Stop recording new requests."""
+        page.unroute("**/*", handle_route)
+
+    def save(path: str) -> int:
+        """Write the recorded traffic and return the number of entries."""
+        save_archive({"version": ARCHIVE_VERSION, "entries": entries, "bodies": bodies}, path)
+        logger.info(f"Recorded {len(entries)} requests to {path}")
+        return len(entries)
+
+    return {
+        "start": start,
+        "stop": stop,
+        "save": save,
+    }
+
+
+def create_replayer(page: Page, archive: Dict[str, Any], strict: bool = True) -> Dict[str, Callable]:
+    """
+    Returns a dictionary of actions that serve a page from a recorded archive.
+
+    Args:
+        page: Page whose requests are answered from the archive
+        archive: Archive loaded with load_archive
+        strict: Match on the full URL and body; otherwise ignore volatile query parameters
+
+    Returns:
+        Dict of replayer functions (start, stop, get_unmatched)
+    """
+    by_strict_key: Dict[str, List[Dict[str, Any]]] = {}
+    by_lenient_key: Dict[str, List[Dict[str, Any]]] = {}
+    for entry in archive["entries"]:
+        strict_key = f"{entry['method']} {entry['url']} {entry['post_data']}"
+        by_strict_key.setdefault(strict_key, []).append(entry)
+        by_lenient_key.setdefault(get_lenient_key(entry["method"], entry["url"]), []).append(entry)
+    served: Dict[Tuple[str, str], int] = {}
+    unmatched: List[str] = []
+    decoded_bodies: Dict[str, bytes] = {}
+
+    def find_entry(method: str, url: str, post_data: Optional[bytes]) -> Optional[Dict[str, Any]]:
+        """Pick the next recorded response for a request, repeating the last one."""
+        candidates = [("strict", get_strict_key(method, url, post_data), by_strict_key)]
+        if not strict:
+            candidates.append(("lenient", get_lenient_key(method, url), by_lenient_key))
+        for kind, key, index in candidates:
+            entries = index.get(key)
+            if entries:
+                position = served.get((kind, key), 0)
+                served[(kind, key)] = position + 1
+                return entries[min(position, len(entries) - 1)]
+        return None
+
+    def get_body(body_hash: str) -> bytes:
+        """Decode a stored body once."""
+        if body_hash not in decoded_bodies:
+            decoded_bodies[body_hash] = base64.b64decode(archive["bodies"][body_hash])
+        return decoded_bodies[body_hash]
+
+    def handle_route(route: Route) -> None:
+        """Answer from the archive or abort the request as if offline."""
+        request = route.request
+        entry = find_entry(request.method, request.url, request.post_data_buffer)
+        if entry is None:
+            unmatched.append(f"{request.method} {request.url}")
+            route.abort("internetdisconnected")
+            return
+        route.fulfill(status=entry["status"], headers=entry["headers"], body=get_body(entry["body"]))
+
+    def start() -> None:
+        """Begin answering the page's requests from the archive."""
+        page.route("**/*", handle_route)
+
+    def stop() -> None:
+        """Stop answering requests from the archive."""
+        page.unroute("**/*", handle_route)
+
+    def get_unmatched() -> List[str]:
+        """Return the requests that had no recorded response."""
+        return list(unmatched)
+
+    return {
+        "start": start,
+        "stop": stop,
+        "get_unmatched": get_unmatched,
+    }
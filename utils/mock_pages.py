@@ -0,0 +1,108 @@
+"""Registry of mock pages served from memory under a stable http origin.
+
+Mock pages used to be opened with file:// URLs, which re-reads the file for
+every test and gives the page an opaque origin where localStorage and cookies
+do not behave like on a real site. The registry reads each template and its
+data file once per session, renders the page once and serves it to any
+context through routing at ``<origin>/<name>``.
+
+Templates mark where their data goes with ``{{ mock_results }}``; the data
+file's JSON is inserted there, typically inside a
+``<script type="application/json">`` element the page script parses. The
+same template can be registered under several names with different data
+files to get different result sets.
+"""
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ORIGIN = "http://mock.test"
+RESULTS_PLACEHOLDER = "{{ mock_results }}"
+
+
+def render_mock_page(template: str, results: Any) -> bytes:
+    """Insert result data as JSON into a template, safe inside a script element."""
+    payload = json.dumps(results).replace("</", "<\\/")
+    return template.replace(RESULTS_PLACEHOLDER, payload).encode("utf-8")
+
+
+def create_mock_registry(origin: str = DEFAULT_ORIGIN) -> Dict[str, Callable]:
+    """
+    Returns a dictionary of actions for serving mock pages from memory.
+
+    Args:
+        origin: Scheme and host the mock pages are served under
+
+    Returns:
+        Dict of registry functions (register, get_url, handle_route, attach, detach, get_stats)
+    """
+    origin = origin.rstrip("/")
+    pattern = f"{origin}/**"
+    files: Dict[str, str] = {}
+    pages: Dict[str, bytes] = {}
+    stats = {"files_read": 0, "served": 0, "not_found": 0}
+
+    def read_file(path: str) -> str:
+        """Read a template or data file once per registry."""
+        if path not in files:
+            with open(path, encoding="utf-8") as f:
+                files[path] = f.read()
+            stats["files_read"] += 1
+        return files[path]
+
+    def register(name: str, template_path: str, data_path: Optional[str] = None) -> str:
+        """
+        Register a mock page; registering a name again is a no-op.
+
+        Args:
+            name: Path segment the page is served at
+            template_path: HTML template
+            data_path: JSON file inserted at the template's placeholder
+
+        Returns:
+            URL of the page
+        """
+        if name not in pages:
+            results = json.loads(read_file(data_path)) if data_path else None
+            pages[name] = render_mock_page(read_file(template_path), results)
+        return get_url(name)
+
+    def get_url(name: str) -> str:
+        """URL a registered page is served at."""
+        return f"{origin}/{name}"
+
+    def handle_route(route: Any) -> None:
+        """Fulfill a request to the origin with the registered page."""
+        name = urlsplit(route.request.url).path.strip("/")
+        body = pages.get(name)
+        if body is None:
+            stats["not_found"] += 1
+            logger.warning(f"No mock page registered for {route.request.url}")
+            route.fulfill(status=404, content_type="text/plain", body=f"No mock page named {name!r}")
+            return
+        stats["served"] += 1
+        route.fulfill(status=200, content_type="text/html; charset=utf-8", body=body)
+
+    def attach(target: Any) -> None:
+        """Serve the mock origin in a context or page."""
+        target.route(pattern, handle_route)
+
+    def detach(target: Any) -> None:
+        """Stop serving the mock origin."""
+        target.unroute(pattern, handle_route)
+
+    def get_stats() -> Dict[str, int]:
+        """Return a snapshot of the registry counters."""
+        return dict(stats, pages=len(pages))
+
+    return {
+        "register": register,
+        "get_url": get_url,
+        "handle_route": handle_route,
+        "attach": attach,
+        "detach": detach,
+        "get_stats": get_stats,
+    }
@@ -0,0 +1,220 @@
+"""Filtered, bounded capture of a page's network responses.
+
+Responses are matched on resource type, method and URL (glob or regex)
+before anything else is read, so images, stylesheets and unrelated requests
+cost one cheap check each. Bodies are not fetched from the browser until a
+test asks for them with get_body, get_text or get_json. Captures are kept in
+a ring of the most recent matches, and the listener is removed with stop():
+
+    capture = create_network_capture(page, "**/api/search*", resource_types=["fetch", "xhr"])
+    capture["start"]()
+    page.click("#search")
+    results = get_json(capture["wait_for"](count=1))
+    capture["stop"]()
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Union
+from collections import deque
+import json
+import re
+import time
+from playwright.sync_api import Page, Response
+
+UrlPattern = Union[str, Pattern[str], None]
+
+DEFAULT_MAX_ENTRIES = 100
+DEFAULT_WAIT_TIMEOUT = 30000
+
+# Characters escaped when a glob is turned into a regex, as in Playwright's glob matching
+GLOB_ESCAPED_CHARS = set("$^+.*()|\\?{}[]")
+
+
+def glob_to_regex(glob: str) -> Pattern[str]:
+    """
+    Translate a URL glob with Playwright's rules, as page.route and expect_response use them.
+
+    "*" matches within one path segment, "**" across segments, "?" any one
+    character and "{a,b}" either alternative; a backslash escapes the next character.
+    """
+    tokens = ["^"]
+    in_group = False
+    i = 0
+    while i < len(glob):
+        char = glob[i]
+        if char == "\\" and i + 1 < len(glob):
+            escaped = glob[i + 1]
+            tokens.append("\\" + escaped if escaped in GLOB_ESCAPED_CHARS else escaped)
+            i += 1
+        elif char == "*":
+            before = glob[i - 1] if i > 0 else None
+            stars = 1
+            while i + 1 < len(glob) and glob[i + 1] == "*":
+                stars += 1
+                i += 1
+            after = glob[i + 1] if i + 1 < len(glob) else None
+            if stars > 1 and before in ("/", None) and after in ("/", None):
+                # "**/" spans any number of whole segments, including none
+                tokens.append("((?:[^/]*(?:/|$))*)")
+                i += 1
+            else:
+                tokens.append("([^/]*)")
+        elif char == "?":
+            tokens.append(".")
+        elif char in "[]":
+            tokens.append(char)
+        elif char == "{":
+            in_group = True
+            tokens.append("(")
+        elif char == "}":
+            in_group = False
+            tokens.append(")")
+        elif char == "," and in_group:
+            tokens.append("|")
+        else:
+            tokens.append("\\" + char if char in GLOB_ESCAPED_CHARS else char)
+        i += 1
+    tokens.append("$")
+    return re.compile("".join(tokens))
+
+
+def compile_url_pattern(url_pattern: UrlPattern) -> Optional[Pattern[str]]:
+    """Compile a URL glob ("**/api/*") or pass a regex through; None matches every URL."""
+    if url_pattern is None or isinstance(url_pattern, re.Pattern):
+        return url_pattern
+    return glob_to_regex(url_pattern)
+
+
+def get_body(capture: Dict[str, Any]) -> bytes:
+    """Read a captured response body from the browser, once.
+
+    Bodies are only available while the page that loaded them is open; read
+    them before navigating away when they matter.
+    """
+    if capture["body"] is None:
+        capture["body"] = capture["response"].body()
+    return capture["body"]
+
+
+def get_text(capture: Dict[str, Any]) -> str:
+    """Read a captured response body as text."""
+    return get_body(capture).decode("utf-8", errors="replace")
+
+
+def get_json(capture: Dict[str, Any]) -> Any:
+    """Read a captured response body as JSON."""
+    return json.loads(get_body(capture))
+
+
+def create_network_capture(
+    page: Page,
+    url_pattern: UrlPattern = None,
+    resource_types: Optional[Iterable[str]] = None,
+    methods: Optional[Iterable[str]] = None,
+    max_entries: int = DEFAULT_MAX_ENTRIES
+) -> Dict[str, Callable]:
+    """
+    Returns a dictionary of actions for a filtered response capture on a page.
+
+    Args:
+        page: Page whose responses are captured
+        url_pattern: URL glob or compiled regex; None captures every URL
+        resource_types: Resource types to keep (document, fetch, xhr, script, ...); None keeps all
+        methods: HTTP methods to keep; None keeps all
+        max_entries: Most recent matching responses kept
+
+    Returns:
+        Dict of capture functions (start, stop, get_captures, wait_for, clear, get_stats)
+    """
+    url_regex = compile_url_pattern(url_pattern)
+    allowed_types = frozenset(resource_types) if resource_types else None
+    allowed_methods = frozenset(method.upper() for method in methods) if methods else None
+    captures: "deque[Dict[str, Any]]" = deque(maxlen=max_entries)
+    stats = {"seen": 0, "matched": 0}
+    started = time.monotonic()
+    listening = False
+
+    def matches(response: Response) -> bool:
+        """Check the cheap request attributes first and the URL last."""
+        request = response.request
+        if allowed_types is not None and request.resource_type not in allowed_types:
+            return False
+        if allowed_methods is not None and request.method not in allowed_methods:
+            return False
+        # Regexes are searched like Playwright does; globs are anchored at both ends
+        return url_regex is None or url_regex.search(response.url) is not None
+
+    def on_response(response: Response) -> None:
+        stats["seen"] += 1
+        if not matches(response):
+            return
+        stats["matched"] += 1
+        captures.append({
+            "index": stats["matched"],
+            "url": response.url,
+            "method": response.request.method,
+            "resource_type": response.request.resource_type,
+            "status": response.status,
+            "ok": response.ok,
+            "time_ms": int((time.monotonic() - started) * 1000),
+            "response": response,
+            "body": None,
+        })
+
+    def start() -> None:
+        """Begin capturing responses; calling it twice has no effect."""
+        nonlocal listening
+        if not listening:
+            page.on("response", on_response)
+            listening = True
+
+    def stop() -> None:
+        """Detach the listener; captured entries stay readable."""
+        nonlocal listening
+        if listening:
+            page.remove_listener("response", on_response)
+            listening = False
+
+    def get_captures() -> List[Dict[str, Any]]:
+        """Return the buffered captures, oldest first."""
+        return list(captures)
+
+    def wait_for(count: int = 1, timeout: float = DEFAULT_WAIT_TIMEOUT) -> Dict[str, Any]:
+        """
+        Wait until the count-th matching response since start (or clear) has arrived.
+
+        Args:
+            count: Which match to wait for, counting from 1
+            timeout: Milliseconds to wait before Playwright raises a TimeoutError
+
+        Returns:
+            The capture of that response
+
+        Raises:
+            LookupError: When the capture was already evicted from the buffer
+        """
+        deadline = time.monotonic() + timeout / 1000
+        while stats["matched"] < count:
+            remaining = max((deadline - time.monotonic()) * 1000, 1)
+            # Our listener was registered first, so it has recorded the match when this returns
+            page.wait_for_event("response", predicate=matches, timeout=remaining)
+        for capture in captures:
+            if capture["index"] == count:
+                return capture
+        raise LookupError(f"Response #{count} was evicted; raise max_entries above {max_entries}")
+
+    def clear() -> None:
+        """Drop the buffered captures and restart the match count."""
+        captures.clear()
+        stats["matched"] = 0
+
+    def get_stats() -> Dict[str, int]:
+        """Return how many responses were seen, matched and are still buffered."""
+        return {**stats, "buffered": len(captures)}
+
+    return {
+        "start": start,
+        "stop": stop,
+        "get_captures": get_captures,
+        "wait_for": wait_for,
+        "clear": clear,
+        "get_stats": get_stats,
+    }
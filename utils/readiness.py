@@ -0,0 +1,148 @@
+"""Targeted readiness conditions with per-step wait instrumentation.
+
+Instead of waiting for the network to go idle, a step declares what it needs
+before it can continue: a specific response, a DOM predicate, a selector state
+or a custom in-page event. Conditions are armed before the triggering action,
+so fast responses and events are not missed, and waited on after it:
+
+    with expect_ready(page, "submit search", response_ready("**/search?*"), selector_ready("#search")):
+        button.click()
+"""
+from typing import Any, Dict, Generator, List
+from contextlib import ExitStack, contextmanager
+import logging
+import time
+from playwright.sync_api import Page
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_READY_TIMEOUT = 30000
+
+# Installs a one-shot listener that flags the event on window
+ARM_EVENT_SCRIPT = """name => {
+    window.__readyEvents = window.__readyEvents || {};
+    window.__readyEvents[name] = false;
+    window.addEventListener(name, () => { window.__readyEvents[name] = true; }, { once: true });
+}"""
+
+EVENT_FIRED_SCRIPT = "name => Boolean(window.__readyEvents && window.__readyEvents[name])"
+
+# Accumulated wait time per step name for the run summary
+_wait_stats: Dict[str, Dict[str, float]] = {}
+
+
+def response_ready(url: Any) -> Dict[str, Any]:
+    """Ready once a response matching a URL glob, regex or response predicate arrives."""
+    def arm(page: Page, timeout: float) -> Any:
+        # Entered by expect_ready, which cancels the wait if the step fails
+        return page.expect_response(url, timeout=timeout)
+
+    def wait(page: Page, event: Any, timeout: float) -> None:
+        event.value
+
+    return {"description": f"response {url}", "arm": arm, "wait": wait}
+
+
+def selector_ready(selector: str, state: str = "visible") -> Dict[str, Any]:
+    """Ready once an element matching the selector reaches the given state."""
+    def wait(page: Page, handle: Any, timeout: float) -> None:
+        page.wait_for_selector(selector, state=state, timeout=timeout)
+
+    return {"description": f"{selector} {state}", "arm": lambda page, timeout: None, "wait": wait}
+
+
+def dom_ready(expression: str, arg: Any = None) -> Dict[str, Any]:
+    """Ready once a JavaScript predicate evaluated in the page returns a truthy value."""
+    def wait(page: Page, handle: Any, timeout: float) -> None:
+        page.wait_for_function(expression, arg=arg, timeout=timeout)
+
+    return {"description": f"predicate {expression}", "arm": lambda page, timeout: None, "wait": wait}
+
+
+def event_ready(event_name: str) -> Dict[str, Any]:
+    """Ready once the page dispatches a custom event on window.
+
+    The listener lives in the current document, so the event must fire
+    before the page navigates away.
+    """
+    def arm(page: Page, timeout: float) -> None:
+        page.evaluate(ARM_EVENT_SCRIPT, event_name)
+
+    def wait(page: Page, handle: Any, timeout: float) -> None:
+        page.wait_for_function(EVENT_FIRED_SCRIPT, arg=event_name, timeout=timeout)
+
+    return {"description": f"event {event_name}", "arm": arm, "wait": wait}
+
+
+def load_state_ready(state: str = "domcontentloaded") -> Dict[str, Any]:
+    """Ready once the page reaches a load state."""
+    def wait(page: Page, handle: Any, timeout: float) -> None:
+        page.wait_for_load_state(state, timeout=timeout)
+
+    return {"description": f"load state {state}", "arm": lambda page, timeout: None, "wait": wait}
+
+
+def record_wait(step: str, elapsed_ms: float) -> None:
+    """Add a wait to the per-step statistics."""
+    stats = _wait_stats.setdefault(step, {"calls": 0, "total_ms": 0.0, "max_ms": 0.0})
+    stats["calls"] += 1
+    stats["total_ms"] += elapsed_ms
+    stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+
+@contextmanager
+def expect_ready(
+    page: Page,
+    step: str,
+    *conditions: Dict[str, Any],
+    timeout: float = DEFAULT_READY_TIMEOUT
+) -> Generator[None, None, None]:
+    """Arm conditions, run the wrapped action, then wait until all conditions hold.
+
+    Args:
+        page: Page object
+        step: Step name used in logs and wait statistics
+        conditions: Conditions built by the *_ready functions
+        timeout: Overall deadline in milliseconds for all conditions
+    """
+    with ExitStack() as stack:
+        handles = []
+        for condition in conditions:
+            handle = condition["arm"](page, timeout)
+            # Armed expectations such as expect_response are context managers; exiting cleans them up
+            if hasattr(handle, "__enter__"):
+                handle = stack.enter_context(handle)
+            handles.append((condition, handle))
+        yield
+
+        started = time.perf_counter()
+        try:
+            for condition, handle in handles:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                condition["wait"](page, handle, max(timeout - elapsed_ms, 1))
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            record_wait(step, elapsed_ms)
+            description = ", ".join(condition["description"] for condition in conditions)
+            logger.info(f"Waited {elapsed_ms:.0f} ms in step '{step}' for {description}")
+
+
+def wait_until(page: Page, step: str, *conditions: Dict[str, Any], timeout: float = DEFAULT_READY_TIMEOUT) -> None:
+    """Wait until all conditions hold, without a triggering action."""
+    with expect_ready(page, step, *conditions, timeout=timeout):
+        pass
+
+
+def get_wait_stats() -> Dict[str, Dict[str, float]]:
+    """Return a copy of the accumulated wait statistics per step."""
+    return {step: dict(stats) for step, stats in _wait_stats.items()}
+
+
+def format_wait_stats(stats: Dict[str, Dict[str, float]], limit: int = 10) -> List[str]:
+    """Format the steps with the most time spent waiting as summary lines."""
+    slowest = sorted(stats.items(), key=lambda entry: entry[1]["total_ms"], reverse=True)[:limit]
+    return [
+        f"{step}: {values['total_ms'] / 1000:.2f}s over {values['calls']} waits "
+        f"(max {values['max_ms']:.0f} ms)"
+        for step, values in slowest
+    ]
@@ -0,0 +1,120 @@
+"""Declarative blocking of resources functional tests do not need.
+
+A policy (see RESOURCE_POLICIES in config.test_config) lists resource types
+to block, domains to deny and, optionally, the only domains requests may go
+to. It is installed with context.route when the context is created. Policies
+that only deny domains route just those hosts, so every other request keeps
+going straight to the network without a round trip through Python.
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Union
+from collections import Counter
+import re
+from urllib.parse import urlparse
+from playwright.sync_api import BrowserContext, Route
+
+
+def matches_domain(host: str, domains: Iterable[str]) -> bool:
+    """Check whether a host is one of the domains or a subdomain of one."""
+    return any(host == domain or host.endswith(f".{domain}") for domain in domains)
+
+
+def build_domain_pattern(domains: Iterable[str]) -> Pattern[str]:
+    """Regex matching http(s) URLs on the domains and their subdomains."""
+    hosts = "|".join(re.escape(domain) for domain in domains)
+    return re.compile(rf"^https?://([^/?#]*\.)?({hosts})(:\d+)?([/?#]|$)", re.IGNORECASE)
+
+
+def create_resource_blocker(policy: Dict[str, List[str]]) -> Dict[str, Callable]:
+    """
+    Returns a dictionary of actions for a resource blocking policy.
+
+    Args:
+        policy: block_types, deny_domains and allow_domains lists (all optional)
+
+    Returns:
+        Dict of blocker functions (should_block, attach, detach, is_active, get_stats)
+    """
+    block_types = frozenset(policy.get("block_types", []))
+    deny_domains = list(policy.get("deny_domains", []))
+    allow_domains = list(policy.get("allow_domains", []))
+    # Resource types and allow lists need to see every request, deny lists only their hosts
+    route_pattern: Union[str, Pattern[str], None] = None
+    if block_types or allow_domains:
+        route_pattern = "**/*"
+    elif deny_domains:
+        route_pattern = build_domain_pattern(deny_domains)
+    stats = {"blocked": 0, "allowed": 0}
+    blocked_types: Counter = Counter()
+    blocked_hosts: Counter = Counter()
+
+    def should_block(url: str, resource_type: str) -> Optional[str]:
+        """Return why a request is blocked, or None when it may go ahead."""
+        if resource_type in block_types:
+            return f"type {resource_type}"
+        host = urlparse(url).hostname or ""
+        if not host:
+            return None
+        if deny_domains and matches_domain(host, deny_domains):
+            return f"denied domain {host}"
+        if allow_domains and not matches_domain(host, allow_domains):
+            return f"domain {host} not allowed"
+        return None
+
+    def handle_route(route: Route) -> None:
+        """Abort blocked requests and pass the rest on to other routes or the network."""
+        request = route.request
+        if should_block(request.url, request.resource_type) is None:
+            stats["allowed"] += 1
+            route.fallback()
+            return
+        stats["blocked"] += 1
+        blocked_types[request.resource_type] += 1
+        blocked_hosts[urlparse(request.url).hostname or ""] += 1
+        route.abort("blockedbyclient")
+
+    def attach(context: BrowserContext) -> None:
+        """Install the policy on a context; a no-op for an empty policy."""
+        if route_pattern is not None:
+            context.route(route_pattern, handle_route)
+
+    def detach(context: BrowserContext) -> None:
+        """Remove the policy from a context."""
+        if route_pattern is not None:
+            context.unroute(route_pattern, handle_route)
+
+    def is_active() -> bool:
+        """Check whether the policy blocks anything at all."""
+        return route_pattern is not None
+
+    def get_stats() -> Dict[str, Any]:
+        """Return blocked and allowed counts, with blocked requests by resource type and host."""
+        return {**stats, "by_type": dict(blocked_types), "by_host": dict(blocked_hosts)}
+
+    return {
+        "should_block": should_block,
+        "attach": attach,
+        "detach": detach,
+        "is_active": is_active,
+        "get_stats": get_stats,
+    }
+
+
+def merge_blocker_stats(totals: Dict[str, Any], stats: Dict[str, Any]) -> None:
+    """Add one blocker's counters to the session totals in place."""
+    totals["blocked"] = totals.get("blocked", 0) + stats["blocked"]
+    totals["allowed"] = totals.get("allowed", 0) + stats["allowed"]
+    for key in ("by_type", "by_host"):
+        merged = Counter(totals.get(key, {}))
+        merged.update(stats[key])
+        totals[key] = dict(merged)
+
+
+def format_blocker_stats(totals: Dict[str, Any]) -> List[str]:
+    """Format session blocking counters as lines for the run summary."""
+    by_type = ", ".join(f"{name} {count}" for name, count in Counter(totals["by_type"]).most_common())
+    by_host = ", ".join(f"{name} {count}" for name, count in Counter(totals["by_host"]).most_common(5))
+    return [
+        f"blocked: {totals['blocked']}, allowed through routing: {totals['allowed']}",
+        f"by type: {by_type or '-'}",
+        f"top hosts: {by_host or '-'}",
+    ]
@@ -0,0 +1,90 @@
+"""Longest-processing-time-first scheduling of tests onto shards."""
+from typing import Any, Dict, List, Tuple
+import heapq
+
+
+def plan_lpt(durations: Dict[str, float], shard_count: int) -> Dict[str, Any]:
+    """Bin tests onto shards longest first, always filling the lightest shard.
+
+    Each shard lists its tests in descending duration, so slow tests start
+    early instead of ending up last in a shard.
+
+    Args:
+        durations: Expected duration in seconds keyed by node id
+        shard_count: Number of shards to create
+
+    Returns:
+        Plan with the ordered node ids and predicted load of every shard
+    """
+    shards: List[List[str]] = [[] for _ in range(shard_count)]
+    loads: List[Tuple[float, int]] = [(0.0, index) for index in range(shard_count)]
+    for nodeid in sorted(durations, key=lambda n: (-durations[n], n)):
+        load, index = heapq.heappop(loads)
+        shards[index].append(nodeid)
+        heapq.heappush(loads, (load + durations[nodeid], index))
+
+    predicted = [0.0] * shard_count
+    for load, index in loads:
+        predicted[index] = load
+    return {
+        "shards": shards,
+        "predicted_loads": predicted,
+        "predicted_makespan": max(predicted, default=0.0),
+    }
+
+
+def predict_round_robin_makespan(nodeids: List[str], durations: Dict[str, float], shard_count: int) -> float:
+    """Predict the makespan of dealing tests to shards in collection order."""
+    loads = [0.0] * shard_count
+    for position, nodeid in enumerate(nodeids):
+        loads[position % shard_count] += durations[nodeid]
+    return max(loads, default=0.0)
+
+
+def build_schedule_report(
+    plan: Dict[str, Any],
+    round_robin_makespan: float,
+    actual_durations: Dict[str, float],
+    wall_times: List[float]
+) -> Dict[str, Any]:
+    """Compare the planned shard loads with what the run actually took.
+
+    Args:
+        plan: Plan returned by plan_lpt
+        round_robin_makespan: Predicted makespan without the scheduler
+        actual_durations: Measured seconds keyed by node id
+        wall_times: Wall-clock seconds of every shard process, in plan order
+
+    Returns:
+        Report with per-shard predicted and actual times
+    """
+    shards = []
+    for index, nodeids in enumerate(plan["shards"]):
+        shards.append({
+            "tests": len(nodeids),
+            "predicted": round(plan["predicted_loads"][index], 2),
+            "actual": round(sum(actual_durations.get(nodeid, 0.0) for nodeid in nodeids), 2),
+            "wall": round(wall_times[index], 2) if index < len(wall_times) else 0.0,
+        })
+    return {
+        "predicted_makespan": round(plan["predicted_makespan"], 2),
+        "round_robin_makespan": round(round_robin_makespan, 2),
+        "actual_makespan": round(max((shard["actual"] for shard in shards), default=0.0), 2),
+        "wall_makespan": round(max(wall_times, default=0.0), 2),
+        "shards": shards,
+    }
+
+
+def format_schedule_report(report: Dict[str, Any]) -> List[str]:
+    """Format a schedule report as lines for the run summary."""
+    lines = [
+        f"predicted makespan: {report['predicted_makespan']}s "
+        f"(round-robin would be {report['round_robin_makespan']}s)",
+        f"actual makespan: {report['actual_makespan']}s in tests, {report['wall_makespan']}s wall clock",
+    ]
+    for index, shard in enumerate(report["shards"]):
+        lines.append(
+            f"shard {index}: {shard['tests']} tests, predicted {shard['predicted']}s, "
+            f"actual {shard['actual']}s, wall {shard['wall']}s"
+        )
+    return lines
@@ -0,0 +1,169 @@
+"""Screenshot capture that leaves encoding and disk writes to a thread pool.
+
+The calling test only waits for the browser to return the image bytes.
+Identical frames are detected by content hash and written once; PNG and JPEG
+bytes come straight from the browser, WebP is re-encoded in the background
+with Pillow when it is installed.
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import hashlib
+import io
+import logging
+import os
+import threading
+import time
+from playwright.sync_api import Page
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; only WebP output needs it
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+IMAGE_FORMATS = ("png", "jpeg", "webp")
+EXTENSIONS = {"png": "png", "jpeg": "jpg", "webp": "webp"}
+
+
+def encode_webp(data: bytes, quality: int) -> bytes:
+    """Re-encode browser PNG bytes as WebP."""
+    with Image.open(io.BytesIO(data)) as image:
+        output = io.BytesIO()
+        image.save(output, format="WEBP", quality=quality)
+        return output.getvalue()
+
+
+def create_screenshot_service(
+    output_dir: str = "screenshots",
+    image_format: str = "png",
+    quality: int = 80,
+    max_workers: int = 2
+) -> Dict[str, Callable]:
+    """
+    Returns a dictionary of actions for a background screenshot writer.
+
+    Args:
+        output_dir: Directory screenshots are written to
+        image_format: Default format, one of png, jpeg or webp
+        quality: Default JPEG/WebP quality (0-100)
+        max_workers: Threads encoding and writing screenshots
+
+    Returns:
+        Dict of service functions (capture, flush, close, get_stats)
+    """
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(f"Unsupported screenshot format '{image_format}', use one of {', '.join(IMAGE_FORMATS)}")
+    # capture() takes per-call overrides under the same names
+    default_format = image_format
+    default_quality = quality
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="screenshot")
+    lock = threading.Lock()
+    pending: List[Future] = []
+    # Content hash (with format and quality) -> path and pending write of that frame
+    written: Dict[str, Tuple[str, Future]] = {}
+    stats = {
+        "captured": 0,
+        "deduplicated": 0,
+        "written": 0,
+        "bytes": 0,
+        "capture_ms": 0.0,
+        "write_ms": 0.0,
+    }
+
+    def write(data: bytes, path: str, target_format: str, target_quality: int) -> str:
+        """Encode and write one frame in a worker thread."""
+        started = time.perf_counter()
+        if target_format == "webp":
+            data = encode_webp(data, target_quality)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        with lock:
+            stats["written"] += 1
+            stats["bytes"] += len(data)
+            stats["write_ms"] += (time.perf_counter() - started) * 1000
+        return path
+
+    def capture(
+        page: Page,
+        name: str,
+        full_page: bool = True,
+        clip: Optional[Dict[str, float]] = None,
+        image_format: Optional[str] = None,
+        quality: Optional[int] = None,
+        wait_for_write: bool = False
+    ) -> str:
+        """
+        Capture a screenshot and queue it for writing.
+
+        Args:
+            page: Page object
+            name: File name prefix; a timestamp and extension are appended
+            full_page: Capture the full scrollable page
+            clip: Region to capture ({x, y, width, height} in CSS pixels)
+            image_format: png, jpeg or webp, defaults to the service format
+            quality: JPEG/WebP quality, defaults to the service quality
+            wait_for_write: Block until the file exists
+
+        Returns:
+            Path of the screenshot, or of an identical earlier frame
+        """
+        target_format = image_format or default_format
+        target_quality = quality if quality is not None else default_quality
+        if target_format == "webp" and Image is None:
+            raise RuntimeError("WebP screenshots need Pillow (pip install Pillow)")
+
+        started = time.perf_counter()
+        # WebP is not produced by the browser, so capture lossless PNG for re-encoding
+        browser_format = "jpeg" if target_format == "jpeg" else "png"
+        screenshot_args: Dict[str, Any] = {"full_page": full_page, "type": browser_format}
+        if clip:
+            screenshot_args["clip"] = clip
+        if browser_format == "jpeg":
+            screenshot_args["quality"] = target_quality
+        data = page.screenshot(**screenshot_args)
+
+        key = f"{hashlib.sha1(data).hexdigest()}|{target_format}|{target_quality}"
+        with lock:
+            stats["captured"] += 1
+            stats["capture_ms"] += (time.perf_counter() - started) * 1000
+            if key in written:
+                stats["deduplicated"] += 1
+                path, future = written[key]
+            else:
+                timestamp = time.strftime("%Y%m%d-%H%M%S") + f"-{int(time.time() * 1000) % 1000:03d}"
+                path = os.path.join(output_dir, f"{name}_{timestamp}.{EXTENSIONS[target_format]}")
+                future = executor.submit(write, data, path, target_format, target_quality)
+                written[key] = (path, future)
+                pending.append(future)
+        if wait_for_write:
+            future.result()
+        return path
+
+    def flush() -> None:
+        """Wait until every queued screenshot is written, logging failed writes."""
+        with lock:
+            futures = list(pending)
+            pending.clear()
+        wait(futures)
+        for future in futures:
+            if future.exception() is not None:
+                logger.warning(f"Failed to write screenshot: {str(future.exception())}")
+
+    def close() -> None:
+        """Flush and stop the worker threads."""
+        flush()
+        executor.shutdown(wait=True)
+
+    def get_stats() -> Dict[str, float]:
+        """Return a snapshot of the service counters."""
+        with lock:
+            return dict(stats)
+
+    return {
+        "capture": capture,
+        "flush": flush,
+        "close": close,
+        "get_stats": get_stats,
+    }
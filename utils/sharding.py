@@ -0,0 +1,210 @@
+"""Sharded test execution across worker processes.
+
+The controller process collects tests, splits them into shards planned by
+utils.scheduler and runs each shard in a separate pytest process. Every
+worker owns its own Playwright driver and browser and streams its test reports
+back as JSON lines, which the controller replays through its own hooks so the
+terminal output and the HTML report cover the whole run. Each worker writes
+its Playwright artifacts to its own ``shard-<index>`` folder under the run's
+``--output`` directory, since every process deletes its output directory when
+its session starts.
+"""
+from typing import Any, Dict, List, Sequence
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+import pytest
+
+logger = logging.getLogger(__name__)
+
+SHARDS_DIR = os.path.join("reports", "shards")
+
+# Options that only make sense for the controller process
+CONTROLLER_OPTIONS = ("--workers",)
+
+# Options every worker gets its own value for
+PER_SHARD_OPTIONS = ("--output",)
+
+DEFAULT_OUTPUT_DIR = "test-results"
+
+POLL_INTERVAL = 0.1
+
+
+def get_worker_args(invocation_args: Sequence[str]) -> List[str]:
+    """Strip controller-only and per-shard options from the original command line."""
+    stripped = CONTROLLER_OPTIONS + PER_SHARD_OPTIONS
+    args: List[str] = []
+    skip_next = False
+    for arg in invocation_args:
+        if skip_next:
+            skip_next = False
+            continue
+        if arg in stripped:
+            skip_next = True
+            continue
+        if arg.startswith(tuple(f"{option}=" for option in stripped)):
+            continue
+        args.append(arg)
+    return args
+
+
+def read_shard_file(path: str) -> List[str]:
+    """Read the ordered node ids assigned to a worker."""
+    with open(path, "r") as f:
+        return [line.rstrip("\n") for line in f if line.strip()]
+
+
+def select_shard_items(config: pytest.Config, items: List[pytest.Item], shard_file: str) -> None:
+    """Keep only the items assigned to this worker, in planned order."""
+    order = {nodeid: index for index, nodeid in enumerate(read_shard_file(shard_file))}
+    selected = [item for item in items if item.nodeid in order]
+    deselected = [item for item in items if item.nodeid not in order]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = sorted(selected, key=lambda item: order[item.nodeid])
+
+
+def write_report_line(config: pytest.Config, output: Any, report: pytest.TestReport) -> None:
+    """Serialize a worker test report to the controller stream."""
+    data = config.hook.pytest_report_to_serializable(config=config, report=report)
+    output.write(json.dumps(data, default=str) + "\n")
+    output.flush()
+
+
+def start_worker(index: int, nodeids: List[str], worker_args: List[str],
+                 output_dir: str = DEFAULT_OUTPUT_DIR) -> Dict[str, Any]:
+    """Launch a pytest worker process for one shard.
+
+    The worker's --output points at a folder of its own under output_dir so
+    its session start does not delete the artifacts of the other workers.
+    """
+    shard_file = os.path.join(SHARDS_DIR, f"shard-{index}.txt")
+    output_file = os.path.join(SHARDS_DIR, f"shard-{index}.jsonl")
+    log_file = os.path.join(SHARDS_DIR, f"shard-{index}.log")
+    with open(shard_file, "w") as f:
+        f.write("\n".join(nodeids) + "\n")
+    open(output_file, "w").close()
+
+    command = [
+        sys.executable, "-m", "pytest",
+        *worker_args,
+        "--worker-shard", shard_file,
+        "--worker-output", output_file,
+        f"--html={os.path.join(SHARDS_DIR, f'shard-{index}.html')}",
+        f"--output={os.path.join(output_dir, f'shard-{index}')}",
+        "-p", "no:cacheprovider",
+    ]
+    log = open(log_file, "w")
+    env = dict(os.environ, PYTEST_SHARD_INDEX=str(index))
+    process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT, env=env)
+    logger.info(f"Started worker {index} (pid {process.pid}) with {len(nodeids)} tests")
+    return {
+        "index": index,
+        "process": process,
+        "log": log,
+        "log_file": log_file,
+        "output_file": output_file,
+        "offset": 0,
+        "nodeids": nodeids,
+        "done": set(),
+        "started": time.monotonic(),
+        "finished": None,
+    }
+
+
+def replay_reports(config: pytest.Config, reports: List[pytest.TestReport]) -> None:
+    """Feed the reports of one finished test through the local reporting hooks."""
+    nodeid, location = reports[0].nodeid, reports[0].location
+    config.hook.pytest_runtest_logstart(nodeid=nodeid, location=location)
+    for report in reports:
+        config.hook.pytest_runtest_logreport(report=report)
+    config.hook.pytest_runtest_logfinish(nodeid=nodeid, location=location)
+
+
+def drain_worker(config: pytest.Config, worker: Dict[str, Any], pending: Dict[str, list]) -> None:
+    """Replay the tests a worker finished since the last read.
+
+    Reports are held back until a test's teardown arrives so the phases of
+    one test are never interleaved with those of another worker.
+    """
+    with open(worker["output_file"], "r") as f:
+        f.seek(worker["offset"])
+        while True:
+            line = f.readline()
+            if not line.endswith("\n"):
+                break
+            worker["offset"] = f.tell()
+            data = json.loads(line)
+            # JSON turns the (path, lineno, message) tuples of skips into lists
+            for key in ("location", "longrepr"):
+                if isinstance(data.get(key), list):
+                    data[key] = tuple(data[key])
+            report = config.hook.pytest_report_from_serializable(config=config, data=data)
+            pending.setdefault(report.nodeid, []).append(report)
+            if report.when == "teardown":
+                replay_reports(config, pending.pop(report.nodeid))
+                worker["done"].add(report.nodeid)
+
+
+def report_lost_tests(session: pytest.Session, worker: Dict[str, Any], pending: Dict[str, list]) -> None:
+    """Fail the tests of a crashed worker that never reported a result."""
+    returncode = worker["process"].returncode
+    items = {item.nodeid: item for item in session.items}
+    for nodeid in worker["nodeids"]:
+        if nodeid in worker["done"]:
+            continue
+        item = items[nodeid]
+        report = pytest.TestReport(
+            nodeid=nodeid,
+            location=item.location,
+            keywords={name: 1 for name in item.keywords},
+            outcome="failed",
+            longrepr=f"Worker {worker['index']} exited with code {returncode} before finishing "
+                     f"this test, see {worker['log_file']}",
+            when="call",
+        )
+        replay_reports(session.config, pending.pop(nodeid, []) + [report])
+
+
+def run_shards(session: pytest.Session, shards: List[List[str]]) -> List[Dict[str, Any]]:
+    """Run each shard in its own worker process and merge the results.
+
+    Returns:
+        Worker records including start and finish times
+    """
+    config = session.config
+    os.makedirs(SHARDS_DIR, exist_ok=True)
+    worker_args = get_worker_args(config.invocation_params.args)
+    output_dir = config.getoption("output", DEFAULT_OUTPUT_DIR)
+    workers = [
+        start_worker(index, nodeids, worker_args, output_dir)
+        for index, nodeids in enumerate(shards)
+        if nodeids
+    ]
+    pending: Dict[str, list] = {}
+
+    try:
+        running = list(workers)
+        while running:
+            for worker in list(running):
+                finished = worker["process"].poll() is not None
+                drain_worker(config, worker, pending)
+                if finished:
+                    worker["finished"] = time.monotonic()
+                    worker["log"].close()
+                    running.remove(worker)
+                    if worker["process"].returncode not in (pytest.ExitCode.OK, pytest.ExitCode.TESTS_FAILED):
+                        report_lost_tests(session, worker, pending)
+            if session.shouldstop:
+                raise session.Interrupted(session.shouldstop)
+            time.sleep(POLL_INTERVAL)
+    finally:
+        for worker in workers:
+            if worker["process"].poll() is None:
+                worker["process"].terminate()
+                worker["process"].wait()
+                worker["log"].close()
+    return workers
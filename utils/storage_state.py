@@ -0,0 +1,152 @@
+"""Saved storage states (cookies and local storage) for named identities.
+
+Each identity is seeded from a Playwright storage state file under auth/, with
+"default" mapping to auth/storage.json. A state is validated against cookie
+expiry before use and regenerated at most once per session (each shard worker
+has its own session) by the identity's generator function. Regenerated states
+are written to the untracked .auth-cache/ and preferred over the seed while
+they are fresh, so the tracked files are never rewritten by a test run.
+"""
+from typing import Any, Callable, Dict, List, Optional
+import json
+import logging
+import os
+import time
+from playwright.sync_api import Browser, BrowserContext, Error as PlaywrightError
+from page_objects.consent_resolver import EXPECTED_CONSENT_TIMEOUT, resolve_consent_dialog
+
+logger = logging.getLogger(__name__)
+
+AUTH_DIR = "auth"
+AUTH_CACHE_DIR = ".auth-cache"
+DEFAULT_IDENTITY = "default"
+
+# Cookies must stay valid at least this long to be worth injecting
+DEFAULT_MIN_TTL = 3600
+
+
+def get_storage_state_path(identity: str) -> str:
+    """Get the storage state file of an identity."""
+    if identity == DEFAULT_IDENTITY:
+        return os.path.join(AUTH_DIR, "storage.json")
+    return os.path.join(AUTH_DIR, f"{identity}.json")
+
+
+def get_cached_state_path(identity: str) -> str:
+    """Get the untracked file a regenerated storage state of an identity is saved to."""
+    return os.path.join(AUTH_CACHE_DIR, os.path.basename(get_storage_state_path(identity)))
+
+
+def load_storage_state(path: str) -> Optional[Dict[str, Any]]:
+    """Load a storage state file, returning None when missing or unreadable."""
+    try:
+        with open(path, "r") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state.get("cookies"), list):
+        return None
+    return state
+
+
+def save_storage_state(state: Dict[str, Any], path: str) -> None:
+    """Write a storage state atomically so parallel workers never read half a file."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+def find_expiring_cookies(state: Dict[str, Any], min_ttl: float = DEFAULT_MIN_TTL,
+                          now: Optional[float] = None) -> List[str]:
+    """Return the names of persistent cookies that expire within min_ttl seconds."""
+    deadline = (now if now is not None else time.time()) + min_ttl
+    return [
+        cookie["name"]
+        for cookie in state["cookies"]
+        # Session cookies report expires -1 and never go stale on their own
+        if cookie.get("expires", -1) > 0 and cookie["expires"] < deadline
+    ]
+
+
+def is_storage_state_fresh(state: Optional[Dict[str, Any]], min_ttl: float = DEFAULT_MIN_TTL) -> bool:
+    """Check that a storage state exists, has cookies and none of them is about to expire."""
+    return bool(state and state["cookies"] and not find_expiring_cookies(state, min_ttl))
+
+
+def generate_google_consent_state(context: BrowserContext) -> None:
+    """Accept Google's consent dialog so its consent cookies are stored."""
+    page = context.new_page()
+    try:
+        page.goto("https://www.google.com", wait_until="domcontentloaded")
+        resolve_consent_dialog(page, timeout=EXPECTED_CONSENT_TIMEOUT)
+    finally:
+        page.close()
+
+
+# Functions that bring a fresh context into the state of an identity
+IDENTITY_GENERATORS: Dict[str, Callable[[BrowserContext], None]] = {
+    DEFAULT_IDENTITY: generate_google_consent_state,
+}
+
+
+def register_identity(identity: str, generator: Callable[[BrowserContext], None]) -> None:
+    """Register the function that generates the storage state of an identity."""
+    IDENTITY_GENERATORS[identity] = generator
+
+
+def create_storage_state_manager(min_ttl: float = DEFAULT_MIN_TTL) -> Dict[str, Callable]:
+    """
+    Returns a dictionary of actions for loading and injecting storage states.
+
+    Args:
+        min_ttl: Seconds a cookie must remain valid for the state to be reused
+
+    Returns:
+        Dict of manager functions (get_state, inject)
+    """
+    states: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    def regenerate(browser: Browser, identity: str) -> Optional[Dict[str, Any]]:
+        """Run the identity generator in a fresh context and save the result."""
+        generator = IDENTITY_GENERATORS.get(identity)
+        if generator is None:
+            logger.warning(f"No generator registered for stale identity '{identity}'")
+            return None
+        context = browser.new_context()
+        try:
+            generator(context)
+            state = context.storage_state()
+        except PlaywrightError as e:
+            logger.warning(f"Failed to regenerate storage state for '{identity}': {str(e)}")
+            return None
+        finally:
+            context.close()
+        save_storage_state(state, get_cached_state_path(identity))
+        logger.info(f"Regenerated storage state for identity '{identity}'")
+        return state
+
+    def get_state(browser: Browser, identity: str = DEFAULT_IDENTITY) -> Optional[Dict[str, Any]]:
+        """Return a fresh storage state, regenerating it once per session when stale."""
+        if identity not in states:
+            state = load_storage_state(get_cached_state_path(identity))
+            if not is_storage_state_fresh(state, min_ttl):
+                state = load_storage_state(get_storage_state_path(identity))
+            if not is_storage_state_fresh(state, min_ttl):
+                state = regenerate(browser, identity)
+            states[identity] = state
+        return states[identity]
+
+    def inject(context: BrowserContext, browser: Browser, identity: str = DEFAULT_IDENTITY) -> bool:
+        """Add the identity's cookies to an existing context."""
+        state = get_state(browser, identity)
+        if state is None:
+            return False
+        context.add_cookies(state["cookies"])
+        return True
+
+    return {
+        "get_state": get_state,
+        "inject": inject,
+    }
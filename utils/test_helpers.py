@@ -1,29 +1,71 @@
-from typing import Any, Dict, Optional
-from playwright.sync_api import Page, Response
+from typing import Any, Callable, Dict, Iterable, Optional
+from playwright.sync_api import Page
 import json
 import time
+from config.test_config import get_screenshot_settings
+from utils.network_capture import UrlPattern, create_network_capture
+from utils.screenshot_service import create_screenshot_service
 
-def wait_for_network_idle(page: Page, timeout: int = 5000):
-    """Wait for network to be idle."""
-    return page.wait_for_load_state("networkidle", timeout=timeout)
-
-def intercept_request(page: Page, url_pattern: str) -> Dict[str, Any]:
-    """Intercept and return network request data."""
-    data = {}
-    
-    def handle_response(response: Response):
-        if response.ok:
-            data["response"] = response.json()
-    
-    page.on("response", handle_response)
-    return data
-
-def take_screenshot(page: Page, name: str, full_page: bool = True):
-    """Take screenshot with timestamp."""
-    timestamp = time.strftime("%Y%m%d-%H%M%S")
-    filename = f"screenshots/{name}_{timestamp}.png"
-    page.screenshot(path=filename, full_page=full_page)
-    return filename
+# Shared screenshot writer, created on first use
+_screenshot_service: Optional[Dict[str, Callable]] = None
+
+def intercept_request(
+    page: Page,
+    url_pattern: UrlPattern,
+    resource_types: Optional[Iterable[str]] = ("fetch", "xhr"),
+    max_entries: int = 20
+) -> Dict[str, Callable]:
+    """Start capturing API responses whose URL matches a glob or regex.
+
+    Returns the started capture (see utils.network_capture); read bodies with
+    get_json(capture["wait_for"]()) and call capture["stop"]() when done, or
+    use the network_capture fixture, which detaches at teardown.
+    """
+    capture = create_network_capture(page, url_pattern, resource_types=resource_types, max_entries=max_entries)
+    capture["start"]()
+    return capture
+
+def get_screenshot_service() -> Dict[str, Callable]:
+    """Get the shared screenshot service configured from the environment."""
+    global _screenshot_service
+    if _screenshot_service is None:
+        _screenshot_service = create_screenshot_service(**get_screenshot_settings())
+    return _screenshot_service
+
+def close_screenshot_service() -> Optional[Dict[str, float]]:
+    """Write pending screenshots, stop the shared service and return its counters."""
+    global _screenshot_service
+    if _screenshot_service is None:
+        return None
+    _screenshot_service["close"]()
+    stats = _screenshot_service["get_stats"]()
+    _screenshot_service = None
+    return stats
+
+def take_screenshot(
+    page: Page,
+    name: str,
+    full_page: bool = True,
+    clip: Optional[Dict[str, float]] = None,
+    image_format: Optional[str] = None,
+    quality: Optional[int] = None,
+    wait: bool = False
+) -> str:
+    """Take screenshot with timestamp.
+
+    Only the capture blocks; encoding and writing happen in the background
+    (pass wait=True to block until the file exists). Identical frames are
+    written once and share a path.
+    """
+    return get_screenshot_service()["capture"](
+        page,
+        name,
+        full_page=full_page,
+        clip=clip,
+        image_format=image_format,
+        quality=quality,
+        wait_for_write=wait
+    )
 
 def load_test_data(file_path: str) -> Dict[str, Any]:
     """Load test data from JSON file."""
@@ -0,0 +1,116 @@
+"""In-process WSGI server for the test app on an ephemeral port.
+
+Each pytest process (every shard worker included) serves app.py on its own
+port, so parallel runs never contend for port 5000 or queue behind the
+single-threaded Flask development server. Waitress is used when it is
+installed; otherwise the threaded werkzeug server. Readiness is checked
+through the app's /healthz endpoint.
+"""
+from typing import Any, Callable, Dict
+import logging
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+try:
+    from waitress.server import create_server as create_waitress_server
+except ImportError:  # waitress is optional; werkzeug ships with Flask
+    create_waitress_server = None
+
+logger = logging.getLogger(__name__)
+
+HEALTH_PATH = "/healthz"
+DEFAULT_READY_TIMEOUT = 10.0
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    """Werkzeug request handler that does not log every request."""
+
+    def log_request(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+def wait_until_healthy(base_url: str, timeout: float = DEFAULT_READY_TIMEOUT) -> float:
+    """
+    Poll the health endpoint until it answers 200.
+
+    Args:
+        base_url: Server origin
+        timeout: Seconds to wait
+
+    Returns:
+        Seconds it took until the server was ready
+
+    Raises:
+        RuntimeError: When the server is not ready in time
+    """
+    started = time.monotonic()
+    delay = 0.005
+    last_error = None
+    while time.monotonic() - started < timeout:
+        try:
+            with urllib.request.urlopen(base_url + HEALTH_PATH, timeout=1) as response:
+                if response.status == 200:
+                    return time.monotonic() - started
+        except (urllib.error.URLError, ConnectionError) as e:
+            last_error = e
+        time.sleep(delay)
+        delay = min(delay * 2, 0.2)
+    raise RuntimeError(f"Test server at {base_url} not ready after {timeout:.0f}s: {last_error}")
+
+
+def start_test_server(
+    wsgi_app: Callable,
+    host: str = "127.0.0.1",
+    threads: int = 8,
+    backend: str = "auto"
+) -> Dict[str, Any]:
+    """
+    Serve a WSGI app on an ephemeral port in a background thread.
+
+    Args:
+        wsgi_app: WSGI application
+        host: Interface to bind
+        threads: Worker threads handling requests (waitress); werkzeug uses a thread per request
+        backend: waitress, werkzeug or auto (waitress when installed)
+
+    Returns:
+        Dict with base_url, backend, ready_seconds and a stop function
+    """
+    if backend == "auto":
+        backend = "waitress" if create_waitress_server is not None else "werkzeug"
+    if backend == "waitress":
+        if create_waitress_server is None:
+            raise RuntimeError("The waitress backend needs waitress (pip install waitress)")
+        # A short loop timeout lets the serving thread notice the closed socket quickly
+        server = create_waitress_server(wsgi_app, host=host, port=0, threads=threads, asyncore_loop_timeout=0.05)
+        port = server.effective_port
+
+        def shutdown() -> None:
+            # Close from inside the serving loop; closing from this thread races its select()
+            server.trigger.pull_trigger(server.close)
+
+        serve = server.run
+    else:
+        server = make_server(host, 0, wsgi_app, threaded=True, request_handler=QuietRequestHandler)
+        port = server.server_port
+        # A short poll interval lets shutdown() return quickly
+        serve, shutdown = lambda: server.serve_forever(poll_interval=0.05), server.shutdown
+
+    thread = threading.Thread(target=serve, name=f"test-server-{port}", daemon=True)
+    thread.start()
+    base_url = f"http://{host}:{port}"
+    ready_seconds = wait_until_healthy(base_url)
+    logger.info(f"Test server ({backend}) listening on {base_url}, ready in {ready_seconds * 1000:.0f} ms")
+
+    def stop() -> None:
+        """Stop accepting requests and wait for the server thread."""
+        shutdown()
+        thread.join(timeout=5)
+        if backend == "waitress":
+            server.task_dispatcher.shutdown()
+
+    return {"base_url": base_url, "backend": backend, "ready_seconds": ready_seconds, "stop": stop}
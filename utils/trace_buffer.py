@@ -0,0 +1,165 @@
+"""Bounded in-memory record of what a page did, written out only when a test fails.
+
+Video and Playwright tracing pay for encoding and disk writes on every test,
+including the passing ones. The trace buffer instead keeps a ring of the most
+recent user actions, network events, console messages and DOM snapshots per
+page. Nothing touches the disk unless the test fails, in which case the ring
+is written as JSON next to a final screenshot and DOM.
+"""
+from typing import Any, Callable, Dict, List
+from collections import deque
+import json
+import logging
+import os
+import time
+from playwright.sync_api import Page, Request, Response, Error as PlaywrightError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_EVENTS = 500
+DEFAULT_MAX_SNAPSHOTS = 3
+
+# Largest DOM snapshot kept, in characters
+MAX_SNAPSHOT_LENGTH = 200_000
+
+# Reports user actions and DOM snapshots from inside the page; navigations
+# reload the script, so each document reports its own snapshot
+RECORDER_SCRIPT = """() => {
+    if (window.__traceBufferInstalled || !window.__traceBufferRecord) return;
+    window.__traceBufferInstalled = true;
+    const describe = element => {
+        if (!element || !element.tagName) return "";
+        if (element.id) return `#${element.id}`;
+        const name = element.getAttribute("name");
+        if (name) return `${element.tagName.toLowerCase()}[name="${name}"]`;
+        const classes = (element.className && typeof element.className === "string")
+            ? "." + element.className.trim().split(/\\s+/).join(".") : "";
+        return element.tagName.toLowerCase() + classes;
+    };
+    const snapshot = () => document.documentElement ? document.documentElement.outerHTML : "";
+    const record = (type, event) => window.__traceBufferRecord({
+        kind: "action",
+        type,
+        target: describe(event.target),
+        value: type === "input" || type === "change" ? String(event.target.value || "").slice(0, 200) : null,
+        url: location.href,
+    });
+    for (const type of ["click", "input", "change", "submit"]) {
+        document.addEventListener(type, event => record(type, event), true);
+    }
+    document.addEventListener("keydown", event => {
+        if (event.key === "Enter" || event.key === "Escape" || event.key === "Tab") record(`key ${event.key}`, event);
+    }, true);
+    const reportSnapshot = () => window.__traceBufferRecord({ kind: "snapshot", url: location.href, html: snapshot() });
+    if (document.readyState === "loading") {
+        document.addEventListener("DOMContentLoaded", reportSnapshot, { once: true });
+    } else {
+        reportSnapshot();
+    }
+}"""
+
+
+def create_trace_buffer(
+    page: Page,
+    max_events: int = DEFAULT_MAX_EVENTS,
+    max_snapshots: int = DEFAULT_MAX_SNAPSHOTS
+) -> Dict[str, Callable]:
+    """
+    Returns a dictionary of actions for a page's trace ring buffer.
+
+    Args:
+        page: Page to record
+        max_events: Most recent actions, network and console events kept
+        max_snapshots: Most recent DOM snapshots kept
+
+    Returns:
+        Dict of buffer functions (start, get_events, get_snapshots, persist)
+    """
+    events: "deque[Dict[str, Any]]" = deque(maxlen=max_events)
+    snapshots: "deque[Dict[str, Any]]" = deque(maxlen=max_snapshots)
+    started = time.monotonic()
+
+    def elapsed_ms() -> int:
+        """Milliseconds since recording started."""
+        return int((time.monotonic() - started) * 1000)
+
+    def record_from_page(entry: Dict[str, Any]) -> None:
+        """Store an action or snapshot reported by the in-page recorder."""
+        entry["time_ms"] = elapsed_ms()
+        if entry.get("kind") == "snapshot":
+            entry["html"] = entry["html"][:MAX_SNAPSHOT_LENGTH]
+            snapshots.append(entry)
+        else:
+            events.append(entry)
+
+    def on_request(request: Request) -> None:
+        events.append({"kind": "request", "method": request.method, "url": request.url,
+                       "resource_type": request.resource_type, "time_ms": elapsed_ms()})
+
+    def on_response(response: Response) -> None:
+        events.append({"kind": "response", "status": response.status, "url": response.url, "time_ms": elapsed_ms()})
+
+    def on_request_failed(request: Request) -> None:
+        events.append({"kind": "requestfailed", "url": request.url, "error": request.failure, "time_ms": elapsed_ms()})
+
+    def on_console(message: Any) -> None:
+        events.append({"kind": "console", "type": message.type, "text": message.text[:1000], "time_ms": elapsed_ms()})
+
+    def on_page_error(error: Any) -> None:
+        events.append({"kind": "pageerror", "text": str(error)[:1000], "time_ms": elapsed_ms()})
+
+    def on_navigation(frame: Any) -> None:
+        if frame == page.main_frame:
+            events.append({"kind": "navigation", "url": frame.url, "time_ms": elapsed_ms()})
+
+    def start() -> None:
+        """Begin recording; navigations after this call are instrumented."""
+        page.expose_function("__traceBufferRecord", record_from_page)
+        page.add_init_script(f"({RECORDER_SCRIPT})()")
+        page.on("request", on_request)
+        page.on("response", on_response)
+        page.on("requestfailed", on_request_failed)
+        page.on("console", on_console)
+        page.on("pageerror", on_page_error)
+        page.on("framenavigated", on_navigation)
+
+    def get_events() -> List[Dict[str, Any]]:
+        """Return the buffered events, oldest first."""
+        return list(events)
+
+    def get_snapshots() -> List[Dict[str, Any]]:
+        """Return the buffered DOM snapshots, oldest first."""
+        return list(snapshots)
+
+    def persist(directory: str, name: str) -> Dict[str, Any]:
+        """Write the buffer and final DOM to <name>.json and a screenshot to <name>.png; returns the written paths and bytes."""
+        os.makedirs(directory, exist_ok=True)
+        final_dom = None
+        screenshot_path = None
+        try:
+            final_dom = page.content()[:MAX_SNAPSHOT_LENGTH]
+            # Next to the buffer in the test's own artifact directory, never the shared screenshots/
+            screenshot_path = os.path.join(directory, f"{name}.png")
+            page.screenshot(path=screenshot_path, timeout=5000)
+        except PlaywrightError as e:
+            logger.warning(f"Could not capture the final page state: {str(e)}")
+            if screenshot_path and not os.path.exists(screenshot_path):
+                screenshot_path = None
+
+        trace_path = os.path.join(directory, f"{name}.json")
+        with open(trace_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "url": page.url if not page.is_closed() else None,
+                "events": list(events),
+                "snapshots": list(snapshots),
+                "final_dom": final_dom,
+            }, f)
+        paths = [path for path in (trace_path, screenshot_path) if path]
+        return {"paths": paths, "bytes": sum(os.path.getsize(path) for path in paths)}
+
+    return {
+        "start": start,
+        "get_events": get_events,
+        "get_snapshots": get_snapshots,
+        "persist": persist,
+    }
@@ -0,0 +1,111 @@
+"""Baseline store and screenshot assertion built on utils.visual_diff.
+
+Baselines live under tests/visual_baselines/<browser>/<name>[-<device>].png.
+They are only written with --update-baselines, which rewrites every baseline
+the run touches; a missing baseline fails the assertion instead of silently
+recording whatever the page looks like. On a mismatch or a missing baseline
+the actual screenshot is written to the test's artifact folder, along with a
+diff image for mismatches.
+"""
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import logging
+import os
+from playwright.sync_api import Page
+from utils.visual_diff import compare_images, load_image, render_diff_image, save_image
+
+logger = logging.getLogger(__name__)
+
+# Screenshot options that keep captures stable between runs
+SCREENSHOT_OPTIONS = {"animations": "disabled", "caret": "hide"}
+
+
+def get_baseline_path(baseline_dir: str, browser_name: str, name: str, device: Optional[str] = None) -> str:
+    """Get the baseline file of a named screenshot for a browser and optional device."""
+    file_name = f"{name}-{device}.png" if device else f"{name}.png"
+    return os.path.join(baseline_dir, browser_name, file_name)
+
+
+def create_visual_asserter(
+    baseline_dir: str,
+    browser_name: str,
+    artifact_dir: str,
+    update: bool = False,
+    threshold: float = 0.1,
+    max_diff_ratio: float = 0.0
+) -> Callable[..., Dict[str, Any]]:
+    """
+    Returns an assertion comparing page screenshots with their baselines.
+
+    Args:
+        baseline_dir: Root of the baseline store
+        browser_name: Browser the baselines belong to
+        artifact_dir: Folder for actual and diff images of failed comparisons
+        update: Write baselines, including missing ones, instead of comparing
+        threshold: Default perceptual threshold per pixel (0..1)
+        max_diff_ratio: Default share of differing pixels still accepted
+
+    Returns:
+        Function (page, name, device=None, ...) raising AssertionError on a mismatch;
+        pass page=None and screenshot=<PNG bytes> for a screenshot taken elsewhere,
+        e.g. by an async page in a fan-out script
+    """
+
+    def assert_matches(
+        page: Optional[Page],
+        name: str,
+        device: Optional[str] = None,
+        full_page: bool = True,
+        ignore_regions: Optional[Sequence[Dict[str, float]]] = None,
+        mask_selectors: Optional[List[str]] = None,
+        threshold_override: Optional[float] = None,
+        max_diff_ratio_override: Optional[float] = None,
+        screenshot: Optional[bytes] = None
+    ) -> Dict[str, Any]:
+        """Screenshot the page (unless a screenshot is given) and compare it with its baseline."""
+        if screenshot is None:
+            screenshot = page.screenshot(
+                full_page=full_page,
+                mask=[page.locator(selector) for selector in mask_selectors or []],
+                **SCREENSHOT_OPTIONS
+            )
+        baseline_path = get_baseline_path(baseline_dir, browser_name, name, device)
+        stem = f"{name}-{device}" if device else name
+        actual_path = os.path.join(artifact_dir, f"{stem}-actual.png")
+        if update:
+            os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+            with open(baseline_path, "wb") as f:
+                f.write(screenshot)
+            logger.info(f"Updated visual baseline {baseline_path}")
+            return {"match": True, "baseline_written": True, "baseline": baseline_path}
+        if not os.path.exists(baseline_path):
+            save_image(load_image(screenshot), actual_path)
+            raise AssertionError(
+                f"No visual baseline for '{stem}' at {baseline_path} (actual saved to {actual_path}); "
+                f"rerun with --update-baselines to record it"
+            )
+
+        result = compare_images(
+            screenshot,
+            baseline_path,
+            threshold=threshold if threshold_override is None else threshold_override,
+            ignore_regions=ignore_regions,
+            max_diff_ratio=max_diff_ratio if max_diff_ratio_override is None else max_diff_ratio_override
+        )
+        if result["match"]:
+            return {"match": True, "baseline_written": False, "baseline": baseline_path, "diff_ratio": result["diff_ratio"]}
+
+        save_image(load_image(screenshot), actual_path)
+        if result["size_mismatch"]:
+            raise AssertionError(
+                f"Screenshot '{stem}' is {result['actual_size']}, baseline {baseline_path} is "
+                f"{result['expected_size']} (actual saved to {actual_path})"
+            )
+        diff_path = os.path.join(artifact_dir, f"{stem}-diff.png")
+        save_image(render_diff_image(baseline_path, result), diff_path)
+        raise AssertionError(
+            f"Screenshot '{stem}' differs from {baseline_path}: {result['diff_pixels']} pixels "
+            f"({result['diff_ratio']:.3%}), max perceptual delta {result['max_delta']:.2f}. "
+            f"Actual: {actual_path}, diff: {diff_path}"
+        )
+
+    return assert_matches
@@ -0,0 +1,258 @@
+"""Screenshot comparison against stored baselines with vectorized NumPy diffing.
+
+Pixels are compared by perceptual (YIQ) color distance, as pixelmatch does,
+so small shifts in hue count for less than changes in brightness. Pixels that
+only differ because an edge was anti-aliased differently are tolerated, and
+rectangular regions (clocks, ads, carousels) can be ignored. Whole batches of
+comparisons can run in a process pool.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
+import io
+import os
+import numpy as np
+from PIL import Image
+
+ImageSource = Union[str, bytes, np.ndarray]
+
+# Largest possible YIQ delta, between black and white
+MAX_YIQ_DELTA = 35215.0
+
+DEFAULT_THRESHOLD = 0.1
+DIFF_COLOR = (255, 0, 0, 255)
+ANTI_ALIASED_COLOR = (255, 200, 0, 255)
+
+
+def load_image(source: ImageSource) -> np.ndarray:
+    """Load a path, encoded image bytes or an array as an RGBA uint8 array."""
+    if isinstance(source, np.ndarray):
+        return source
+    with Image.open(io.BytesIO(source) if isinstance(source, bytes) else source) as image:
+        return np.asarray(image.convert("RGBA"))
+
+
+def read_encoded(source: ImageSource) -> ImageSource:
+    """Read an image path into its encoded bytes; bytes and arrays pass through."""
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            return f.read()
+    return source
+
+
+def save_image(pixels: np.ndarray, path: str) -> None:
+    """Write an RGBA array as PNG, favoring speed over size."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    Image.fromarray(pixels, "RGBA").save(path, compress_level=1)
+
+
+def as_words(pixels: np.ndarray) -> np.ndarray:
+    """View an RGBA image as one 32-bit word per pixel for fast equality checks."""
+    return np.ascontiguousarray(pixels).view(np.uint32)[..., 0]
+
+
+def to_yiq(pixels: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Blend an RGBA image onto white and convert it to YIQ channels."""
+    rgba = pixels.astype(np.float32)
+    alpha = rgba[..., 3:4] / 255.0
+    rgb = 255.0 + (rgba[..., :3] - 255.0) * alpha
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    y = r * 0.29889531 + g * 0.58662247 + b * 0.11448223
+    i = r * 0.59597799 - g * 0.27417610 - b * 0.32180189
+    q = r * 0.21147017 - g * 0.52261711 + b * 0.31114694
+    return y, i, q
+
+
+def perceptual_delta(actual: np.ndarray, expected: np.ndarray) -> np.ndarray:
+    """Perceptual color distance of corresponding RGBA pixels, normalized to 0..1."""
+    y1, i1, q1 = to_yiq(actual)
+    y2, i2, q2 = to_yiq(expected)
+    delta = 0.5053 * (y1 - y2) ** 2 + 0.299 * (i1 - i2) ** 2 + 0.1957 * (q1 - q2) ** 2
+    return delta / MAX_YIQ_DELTA
+
+
+def brightness(pixels: np.ndarray) -> np.ndarray:
+    """Y (brightness) channel of RGBA pixels blended onto white."""
+    return to_yiq(pixels)[0]
+
+
+def neighbor_offsets() -> List[Tuple[int, int]]:
+    """Row and column offsets of the 8 neighbors of a pixel."""
+    return [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx]
+
+
+def find_anti_aliased(actual: np.ndarray, expected: np.ndarray, ys: np.ndarray, xs: np.ndarray) -> np.ndarray:
+    """Mark which of the differing pixels at (ys, xs) an edge rendered at a slightly different position explains.
+
+    A pixel counts as anti-aliased when, in both images, its brightness lies
+    within the range of its neighbors' brightness and those neighbors show an
+    edge (a real change in contrast), i.e. it is a blend of its surroundings.
+    Only the 3x3 neighborhoods of the given pixels are read.
+    """
+    height, width = actual.shape[:2]
+    offsets = neighbor_offsets()
+    # Neighbors outside the image repeat the edge pixel
+    neighbor_ys = np.clip(ys[:, None] + np.array([dy for dy, _ in offsets]), 0, height - 1)
+    neighbor_xs = np.clip(xs[:, None] + np.array([dx for _, dx in offsets]), 0, width - 1)
+    result = np.ones(len(ys), dtype=bool)
+    for pixels in (actual, expected):
+        center = brightness(pixels[ys, xs])
+        neighbors = brightness(pixels[neighbor_ys, neighbor_xs])
+        low, high = neighbors.min(axis=1), neighbors.max(axis=1)
+        # Allow one brightness step of slack at the ends of the range
+        within = (center >= low - 1.0) & (center <= high + 1.0)
+        has_edge = (high - low) > 255.0 * 0.1
+        result &= within & has_edge
+    return result
+
+
+def build_ignore_mask(shape: Tuple[int, int], regions: Optional[Iterable[Dict[str, float]]]) -> np.ndarray:
+    """Boolean mask of pixels inside any ignore region ({x, y, width, height})."""
+    mask = np.zeros(shape, dtype=bool)
+    for region in regions or []:
+        x, y = max(int(region["x"]), 0), max(int(region["y"]), 0)
+        mask[y:y + int(region["height"]), x:x + int(region["width"])] = True
+    return mask
+
+
+def identical_result(shape: Tuple[int, int]) -> Dict[str, Any]:
+    """Comparison result of two identical images."""
+    mask = np.zeros(shape, dtype=bool)
+    return {
+        "match": True, "size_mismatch": False, "diff_pixels": 0, "diff_ratio": 0.0,
+        "anti_aliased": 0, "max_delta": 0.0, "mask": mask, "anti_aliased_mask": mask,
+    }
+
+
+def compare_images(
+    actual: ImageSource,
+    expected: ImageSource,
+    threshold: float = DEFAULT_THRESHOLD,
+    ignore_regions: Optional[Sequence[Dict[str, float]]] = None,
+    anti_aliasing: bool = True,
+    max_diff_ratio: float = 0.0
+) -> Dict[str, Any]:
+    """
+    Compare two images pixel by pixel.
+
+    Args:
+        actual: Screenshot under test
+        expected: Baseline image
+        threshold: Perceptual distance (0..1) above which a pixel differs
+        ignore_regions: Rectangles ({x, y, width, height}) excluded from the comparison
+        anti_aliasing: Tolerate differences explained by anti-aliased edges
+        max_diff_ratio: Share of differing pixels still considered a match
+
+    Returns:
+        Dict with match flag, diff_pixels, diff_ratio, anti_aliased count,
+        max_delta, size mismatch flag and the boolean diff mask
+    """
+    actual, expected = read_encoded(actual), read_encoded(expected)
+    # Byte-identical encodings (the usual case for an unchanged page) skip decoding
+    if isinstance(actual, bytes) and isinstance(expected, bytes) and actual == expected:
+        with Image.open(io.BytesIO(actual)) as image:
+            width, height = image.size
+        return identical_result((height, width))
+    actual_pixels = load_image(actual)
+    expected_pixels = load_image(expected)
+    if actual_pixels.shape != expected_pixels.shape:
+        return {
+            "match": False,
+            "size_mismatch": True,
+            "actual_size": actual_pixels.shape[1::-1],
+            "expected_size": expected_pixels.shape[1::-1],
+            "diff_pixels": None,
+            "diff_ratio": 1.0,
+            "anti_aliased": 0,
+            "max_delta": None,
+            "mask": None,
+            "anti_aliased_mask": None,
+        }
+
+    # Identical buffers need no further work
+    if np.array_equal(actual_pixels, expected_pixels):
+        return identical_result(actual_pixels.shape[:2])
+
+    # Only pixels whose bytes changed can differ, so the color math runs on those alone
+    height, width = actual_pixels.shape[:2]
+    changed = as_words(actual_pixels) != as_words(expected_pixels)
+    changed &= ~build_ignore_mask(changed.shape, ignore_regions)
+    ys, xs = np.nonzero(changed)
+    delta = perceptual_delta(actual_pixels[ys, xs], expected_pixels[ys, xs])
+    # pixelmatch compares squared YIQ distance against the squared threshold
+    differing = delta > threshold * threshold
+    ys, xs = ys[differing], xs[differing]
+    anti_aliased = find_anti_aliased(actual_pixels, expected_pixels, ys, xs) if anti_aliasing else \
+        np.zeros(len(ys), dtype=bool)
+
+    mask = np.zeros((height, width), dtype=bool)
+    mask[ys[~anti_aliased], xs[~anti_aliased]] = True
+    anti_aliased_mask = np.zeros((height, width), dtype=bool)
+    anti_aliased_mask[ys[anti_aliased], xs[anti_aliased]] = True
+    diff_pixels = int((~anti_aliased).sum())
+    diff_ratio = diff_pixels / mask.size
+    return {
+        "match": diff_ratio <= max_diff_ratio,
+        "size_mismatch": False,
+        "diff_pixels": diff_pixels,
+        "diff_ratio": diff_ratio,
+        "anti_aliased": int(anti_aliased.sum()),
+        "max_delta": float(np.sqrt(delta.max())) if len(delta) else 0.0,
+        "mask": mask,
+        "anti_aliased_mask": anti_aliased_mask,
+    }
+
+
+def render_diff_image(expected: ImageSource, result: Dict[str, Any]) -> np.ndarray:
+    """Draw differing pixels in red and tolerated anti-aliasing in yellow over a faded baseline."""
+    pixels = load_image(expected)
+    # Integer luma is close enough for a background and far cheaper than YIQ on every pixel
+    rgb = pixels[..., :3].astype(np.uint16)
+    gray = (rgb[..., 0] * 77 + rgb[..., 1] * 150 + rgb[..., 2] * 29) >> 8
+    faded = (255 - (255 - gray) // 10).astype(np.uint8)
+    image = np.dstack([faded, faded, faded, np.full_like(faded, 255)])
+    image[result["anti_aliased_mask"]] = ANTI_ALIASED_COLOR
+    image[result["mask"]] = DIFF_COLOR
+    return image
+
+
+def compare_files(
+    actual_path: str,
+    expected_path: str,
+    diff_path: Optional[str] = None,
+    **options: Any
+) -> Dict[str, Any]:
+    """Compare two image files, optionally writing a diff image; returns the result without masks."""
+    result = compare_images(actual_path, expected_path, **options)
+    if diff_path and not result["match"] and not result["size_mismatch"]:
+        save_image(render_diff_image(expected_path, result), diff_path)
+    summary = {key: value for key, value in result.items() if not key.endswith("mask")}
+    summary.update(actual=actual_path, expected=expected_path, diff=diff_path if not result["match"] else None)
+    return summary
+
+
+def _compare_job(job: Tuple[str, str, Optional[str], Dict[str, Any]]) -> Dict[str, Any]:
+    """Process pool entry point for compare_files."""
+    actual_path, expected_path, diff_path, options = job
+    return compare_files(actual_path, expected_path, diff_path, **options)
+
+
+def compare_many(
+    jobs: Sequence[Tuple[str, str, Optional[str]]],
+    workers: Optional[int] = None,
+    **options: Any
+) -> List[Dict[str, Any]]:
+    """
+    Compare many (actual, expected, diff) file triples in a process pool.
+
+    Args:
+        jobs: Actual path, baseline path and optional diff output path per comparison
+        workers: Worker processes, defaults to the CPU count
+        options: compare_images options applied to every comparison
+
+    Returns:
+        Results in the order of the jobs
+    """
+    if workers == 1 or len(jobs) <= 1:
+        return [compare_files(actual, expected, diff, **options) for actual, expected, diff in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_compare_job, [(*job, options) for job in jobs], chunksize=4))
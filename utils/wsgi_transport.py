@@ -0,0 +1,151 @@
+"""Serve a WSGI app to the browser through request routing instead of TCP.
+
+Requests for the transport's origin are intercepted with context routing and
+passed straight to the app through werkzeug's test client; the response is
+fulfilled from the returned bytes. No server is started and no socket is
+opened, so any number of contexts can load the app at once without queuing
+behind a server's accept loop or worker threads.
+
+The origin is never resolved, so pages must be opened under the transport's
+base_url rather than BASE_URL. Requests carry all their headers, cookies
+included, and responses are served uncompressed since nothing goes over the
+wire. The async handler runs the app in the event loop's default executor, so
+concurrent contexts are not serialized behind one another.
+"""
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+import asyncio
+import logging
+import threading
+import time
+from werkzeug.test import Client
+from playwright.sync_api import Route
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ORIGIN = "http://app.wsgi.test"
+
+# Request headers the app should not see: compression would only cost time in-process
+DROPPED_REQUEST_HEADERS = ("accept-encoding", "host")
+
+# Response headers recomputed by the browser for the fulfilled body
+DROPPED_RESPONSE_HEADERS = ("content-length", "transfer-encoding")
+
+
+def collect_headers(header_items: List[tuple]) -> Dict[str, str]:
+    """Fold response headers into one dict, joining repeated Set-Cookie headers with newlines."""
+    headers: Dict[str, str] = {}
+    for name, value in header_items:
+        name = name.lower()
+        if name in DROPPED_RESPONSE_HEADERS:
+            continue
+        if name in headers:
+            separator = "\n" if name == "set-cookie" else ", "
+            headers[name] = f"{headers[name]}{separator}{value}"
+        else:
+            headers[name] = value
+    return headers
+
+
+def create_wsgi_transport(wsgi_app: Callable, origin: str = DEFAULT_ORIGIN) -> Dict[str, Any]:
+    """
+    Returns a dictionary of actions for routing an origin into a WSGI app.
+
+    Args:
+        wsgi_app: WSGI application, e.g. the Flask app in app.py
+        origin: Scheme and host the pages are opened under
+
+    Returns:
+        Dict with base_url and the transport functions
+        (dispatch, handle_route, handle_route_async, attach, detach, get_stats)
+    """
+    origin = origin.rstrip("/")
+    pattern = f"{origin}/**"
+    client = Client(wsgi_app, use_cookies=False)
+    stats = {"requests": 0, "errors": 0, "bytes": 0, "app_seconds": 0.0}
+    # The async handler dispatches from executor threads
+    stats_lock = threading.Lock()
+
+    def dispatch(method: str, url: str, headers: Dict[str, str], body: Optional[bytes] = None) -> Dict[str, Any]:
+        """Run one request through the app and return its status, headers and body."""
+        parts = urlsplit(url)
+        started = time.perf_counter()
+        response = client.open(
+            parts.path or "/",
+            base_url=origin,
+            query_string=parts.query,
+            method=method,
+            headers=[(name, value) for name, value in headers.items() if name.lower() not in DROPPED_REQUEST_HEADERS],
+            data=body,
+        )
+        try:
+            payload = response.get_data()
+        finally:
+            response.close()
+        with stats_lock:
+            stats["app_seconds"] += time.perf_counter() - started
+            stats["requests"] += 1
+            stats["bytes"] += len(payload)
+        return {"status": response.status_code, "headers": collect_headers(response.headers.to_wsgi_list()), "body": payload}
+
+    def respond(request: Any, headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """Dispatch a routed request with its full headers; None when the app raised."""
+        try:
+            return dispatch(request.method, request.url, headers, request.post_data_buffer)
+        except Exception as e:
+            with stats_lock:
+                stats["errors"] += 1
+            logger.warning(f"WSGI transport failed for {request.method} {request.url}: {str(e)}")
+            return None
+
+    def handle_route(route: Route) -> None:
+        """Fulfill a request to the origin from the app."""
+        # request.headers leaves out Cookie; all_headers() has everything the browser sends
+        response = respond(route.request, route.request.all_headers())
+        if response is None:
+            route.fulfill(status=502, body="WSGI app raised; see the test log")
+            return
+        route.fulfill(**response)
+
+    async def handle_route_async(route: Any) -> None:
+        """handle_route for the async API; the app runs in an executor thread."""
+        headers = await route.request.all_headers()
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(None, respond, route.request, headers)
+        if response is None:
+            await route.fulfill(status=502, body="WSGI app raised; see the test log")
+            return
+        await route.fulfill(**response)
+
+    def attach(target: Any) -> None:
+        """Route the origin of a sync context or page into the app."""
+        target.route(pattern, handle_route)
+
+    def detach(target: Any) -> None:
+        """Stop routing the origin into the app."""
+        target.unroute(pattern, handle_route)
+
+    def get_stats() -> Dict[str, Any]:
+        """Return a snapshot of the transport counters."""
+        with stats_lock:
+            return dict(stats)
+
+    return {
+        "base_url": origin,
+        "pattern": pattern,
+        "dispatch": dispatch,
+        "handle_route": handle_route,
+        "handle_route_async": handle_route_async,
+        "attach": attach,
+        "detach": detach,
+        "get_stats": get_stats,
+    }
+
+
+def format_transport_stats(stats: Dict[str, Any]) -> List[str]:
+    """Format transport counters as lines for the run summary."""
+    mean_ms = stats["app_seconds"] / stats["requests"] * 1000 if stats["requests"] else 0.0
+    return [
+        f"{stats['requests']} requests served in-process ({stats['bytes'] / 1024:.0f} KiB), "
+        f"{mean_ms:.2f} ms mean in the app, {stats['errors']} errors"
+    ]